@@ -0,0 +1,290 @@
+"""Benchmark pencarian dan sorting DataMahasiswaManager.
+
+Contoh:
+    python benchmark.py --sizes 1000 10000 --repeat 5 --output bench_results
+    python benchmark.py --sizes 1000 10000 --baseline bench_results.json
+    python benchmark.py --startup
+"""
+import argparse
+import csv
+import json
+import math
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from datamahasiswa import DataMahasiswaManager, Mahasiswa
+
+JURUSAN = [
+    "Teknik Informatika", "Sistem Informasi", "Teknik Komputer",
+    "Manajemen Informatika", "Ilmu Komputer", "Teknologi Informasi",
+    "Teknik Elektro", "Teknik Industri", "Teknik Sipil",
+    "Akuntansi", "Manajemen", "Hukum", "Lainnya"
+]
+
+# Model kompleksitas untuk fitting hasil scaling
+COMPLEXITY_MODELS = {
+    'O(1)': lambda n: 1.0,
+    'O(log n)': lambda n: math.log2(n),
+    'O(n)': lambda n: float(n),
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n^2)': lambda n: float(n) * n,
+}
+
+
+# ============================== DATASET ==============================
+def generate_dataset(n, seed=42):
+    """Membuat n Mahasiswa sintetis dengan NIM unik 12 digit"""
+    rng = random.Random(seed)
+    nims = set()
+    while len(nims) < n:
+        angkatan = rng.choice(range(2018, 2025))
+        nims.add(f"{angkatan}{rng.randrange(10**8):08d}")
+
+    records = []
+    for nim in nims:
+        nama = " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))).title()
+            for _ in range(rng.randint(2, 3))
+        )
+        records.append(Mahasiswa(
+            nim=nim,
+            nama=nama,
+            jurusan=rng.choice(JURUSAN),
+            email=f"{nama.split()[0].lower()}{nim[-4:]}@kampus.ac.id",
+            telepon=f"08{rng.randrange(10**10):010d}",
+            ipk=rng.randrange(401) / 100
+        ))
+    rng.shuffle(records)
+    return records
+
+
+def build_manager(records):
+    """Manager tanpa autosave yang berisi records (urutan acak)"""
+    manager = DataMahasiswaManager()
+    manager._autosave = False
+    manager.add_many(records, strict=True)
+    return manager
+
+
+# ============================== OPERASI ==============================
+def reset_state(manager, baseline):
+    """Mengembalikan urutan array dan mengosongkan cache sebelum setiap run"""
+    manager._data_mahasiswa = list(baseline)
+    manager._sorted_views = {}
+    manager.clear_cache()
+
+
+def build_operations(records, quadratic_limit):
+    """Daftar (kategori, nama, fungsi(manager)) yang akan diukur"""
+    sample = records[len(records) // 2]
+    keyword = sample.nama.split()[0][:4].lower()
+    prefix = sample.nim[:4]
+    operations = [
+        ('search', 'linear_search', lambda m: m.linear_search(keyword, 'nama')),
+        ('search', 'trigram_search', lambda m: m.trigram_search(keyword, 'nama')),
+        ('search', 'binary_search', lambda m: m.binary_search(sample.nim)),
+        ('search', 'get_by_nim', lambda m: m.get_by_nim(sample.nim)),
+        ('search', 'search_by_nim_prefix', lambda m: m.search_by_nim_prefix(prefix)),
+        ('search', 'search_by_multiple',
+         lambda m: m.search_by_multiple({'jurusan': sample.jurusan, 'nama': keyword})),
+        ('stats', 'get_statistics', lambda m: m.get_statistics()),
+        ('stats', 'top_k', lambda m: m.top_k('ipk', 10)),
+        ('sort', 'quick_sort', lambda m: m.quick_sort('nim')),
+        ('sort', 'sort_by', lambda m: m.sort_by([('jurusan', True), ('ipk', False)])),
+        ('sort', 'radix_sort_nim', lambda m: m.radix_sort('nim')),
+        ('sort', 'radix_sort_ipk', lambda m: m.radix_sort('ipk')),
+        ('sort', 'get_sorted_view', lambda m: m.get_sorted_view('ipk')),
+    ]
+    if len(records) <= quadratic_limit:
+        operations += [
+            ('sort', 'bubble_sort', lambda m: m.bubble_sort('nim')),
+            ('sort', 'selection_sort', lambda m: m.selection_sort('nim')),
+            ('sort', 'insertion_sort', lambda m: m.insertion_sort('nim')),
+        ]
+    return operations
+
+
+# ============================== PENGUKURAN ==============================
+def percentile(values, pct):
+    """Persentil nearest-rank"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(manager, baseline, func, repeat):
+    """Menjalankan func sebanyak repeat kali, mengembalikan durasi (ns)"""
+    samples = []
+    for _ in range(repeat):
+        reset_state(manager, baseline)
+        # Index trigram dibangun di luar pengukuran (biaya build sekali)
+        if manager._trigram_index is None:
+            manager.enable_trigram_index()
+        start = time.perf_counter_ns()
+        func(manager)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def fit_complexity(points):
+    """Memilih model kompleksitas dengan rasio waktu/f(n) paling konstan.
+    points: list (n, median_ns). Mengembalikan (model, slope log-log)."""
+    points = [(n, t) for n, t in points if t > 0]
+    if len(points) < 2:
+        return None, None
+
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+    best_model, best_spread = None, None
+    for model, func in COMPLEXITY_MODELS.items():
+        ratios = [math.log(t / func(n)) for n, t in points]
+        spread = max(ratios) - min(ratios)
+        if best_spread is None or spread < best_spread:
+            best_model, best_spread = model, spread
+    return best_model, slope
+
+
+def run_benchmark(sizes, repeat, quadratic_limit, seed):
+    results = []
+    for size in sizes:
+        records = generate_dataset(size, seed)
+        manager = build_manager(records)
+        for category, name, func in build_operations(records, quadratic_limit):
+            samples = measure(manager, records, func, repeat)
+            row = {
+                'category': category,
+                'operation': name,
+                'n': size,
+                'repeat': repeat,
+                'median_ms': percentile(samples, 50) / 1e6,
+                'p95_ms': percentile(samples, 95) / 1e6,
+                'min_ms': min(samples) / 1e6,
+            }
+            results.append(row)
+            print(f"{name:<22} n={size:<9} median={row['median_ms']:>10.3f} ms "
+                  f"p95={row['p95_ms']:>10.3f} ms")
+
+    complexity = {}
+    for name in dict.fromkeys(row['operation'] for row in results):
+        points = [(row['n'], row['median_ms'] * 1e6) for row in results if row['operation'] == name]
+        model, slope = fit_complexity(points)
+        complexity[name] = {'model': model, 'slope': slope}
+    return results, complexity
+
+
+# ============================== STARTUP ==============================
+STARTUP_MODULES = ['datamahasiswa', 'datamahasiswa.manager', 'datamahasiswa.cli']
+STARTUP_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print((time.perf_counter() - start) * 1000, 'tkinter' in sys.modules)\n"
+)
+
+
+def measure_startup(repeat):
+    """Waktu import tiap modul inti di proses baru (ms) dan apakah Tkinter ikut termuat"""
+    rows = []
+    for module in STARTUP_MODULES:
+        samples, loads_tk = [], False
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT.format(module=module)],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            samples.append(float(output[0]))
+            loads_tk = loads_tk or output[1] == 'True'
+        rows.append({'module': module, 'median_ms': percentile(samples, 50),
+                     'max_ms': max(samples), 'tkinter': loads_tk})
+        print(f"import {module:<24} median={rows[-1]['median_ms']:>8.2f} ms "
+              f"max={rows[-1]['max_ms']:>8.2f} ms tkinter={'ya' if loads_tk else 'tidak'}")
+    return rows
+
+
+# ============================== OUTPUT ==============================
+def write_results(prefix, results, complexity, args):
+    report = {
+        'metadata': {
+            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'results': results,
+        'complexity': complexity
+    }
+    with open(f"{prefix}.json", 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+    with open(f"{prefix}.csv", 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=['category', 'operation', 'n', 'repeat',
+                                                  'median_ms', 'p95_ms', 'min_ms', 'complexity'])
+        writer.writeheader()
+        for row in results:
+            writer.writerow({**row, 'complexity': complexity[row['operation']]['model']})
+
+
+def compare_baseline(results, baseline_file, threshold):
+    """Mengembalikan daftar regresi: median lebih lambat dari baseline x threshold"""
+    with open(baseline_file, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    previous = {(row['operation'], row['n']): row for row in baseline.get('results', [])}
+
+    regressions = []
+    for row in results:
+        old = previous.get((row['operation'], row['n']))
+        if old and old['median_ms'] > 0 and row['median_ms'] > old['median_ms'] * threshold:
+            regressions.append((row['operation'], row['n'], old['median_ms'], row['median_ms']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pencarian & sorting data mahasiswa")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--quadratic-limit', type=int, default=5000,
+                        help="ukuran maksimum untuk bubble/selection/insertion sort")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='bench_results',
+                        help="prefix file hasil (.json dan .csv)")
+    parser.add_argument('--baseline', help="file JSON hasil sebelumnya untuk deteksi regresi")
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help="rasio median yang dianggap regresi")
+    parser.add_argument('--startup', action='store_true',
+                        help="hanya ukur waktu import paket inti (gagal jika Tkinter termuat)")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        rows = measure_startup(args.repeat)
+        return 1 if any(row['tkinter'] for row in rows) else 0
+
+    results, complexity = run_benchmark(args.sizes, args.repeat, args.quadratic_limit, args.seed)
+
+    print("\nKompleksitas (fitting):")
+    for name, fit in complexity.items():
+        if fit['model']:
+            print(f"  {name:<22} {fit['model']:<11} slope={fit['slope']:.2f}")
+
+    write_results(args.output, results, complexity, args)
+    print(f"\nHasil disimpan ke {args.output}.json dan {args.output}.csv")
+
+    if args.baseline:
+        regressions = compare_baseline(results, args.baseline, args.threshold)
+        for name, size, old, new in regressions:
+            print(f"⚠ REGRESI {name} n={size}: {old:.3f} ms -> {new:.3f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Inti data mahasiswa tanpa GUI.
+
+Modul dimuat saat nama pertama kali diakses, sehingga job batch/CLI yang
+hanya memakai DataMahasiswaManager tidak ikut memuat Tkinter, sqlite3,
+maupun multiprocessing. GUI tersedia di datamahasiswa.gui.
+"""
+import importlib
+
+# typing.TYPE_CHECKING tanpa biaya import modul typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    # Deklarasi statis untuk pylint/IDE; saat runtime dimuat lazy oleh __getattr__
+    from .exceptions import ValidationError, FileOperationError
+    from .model import (RegexPatterns, Mahasiswa, TIMESTAMP_FORMAT,
+                        format_timestamp, parse_timestamp)
+    from .base import DataOperations
+    from .instrumentation import LatencyHistogram, PerformanceMonitor, instrumented
+    from .persistence import AutosaveWorker, OperationJournal
+    from .storage import (JSONRecordStream, BinarySnapshot, StreamingExporter, atomic_write,
+                          write_snapshot, read_snapshot, export_records)
+    from .indexes import TrigramIndex, SortedView
+    from .importer import CSV_COLUMN_ALIASES, CSV_DEFAULT_COLUMNS, parse_csv_chunk, CSVImporter
+    from .manager import DataMahasiswaManager
+    from .sqlite_backend import SQLiteMahasiswaManager
+
+# Nama publik -> submodul yang mendefinisikannya
+_EXPORTS = {
+    'ValidationError': 'exceptions',
+    'FileOperationError': 'exceptions',
+    'RegexPatterns': 'model',
+    'Mahasiswa': 'model',
+    'TIMESTAMP_FORMAT': 'model',
+    'format_timestamp': 'model',
+    'parse_timestamp': 'model',
+    'DataOperations': 'base',
+    'LatencyHistogram': 'instrumentation',
+    'PerformanceMonitor': 'instrumentation',
+    'instrumented': 'instrumentation',
+    'AutosaveWorker': 'persistence',
+    'OperationJournal': 'persistence',
+    'JSONRecordStream': 'storage',
+    'BinarySnapshot': 'storage',
+    'StreamingExporter': 'storage',
+    'atomic_write': 'storage',
+    'write_snapshot': 'storage',
+    'read_snapshot': 'storage',
+    'export_records': 'storage',
+    'TrigramIndex': 'indexes',
+    'SortedView': 'indexes',
+    'CSV_COLUMN_ALIASES': 'importer',
+    'CSV_DEFAULT_COLUMNS': 'importer',
+    'parse_csv_chunk': 'importer',
+    'CSVImporter': 'importer',
+    'DataMahasiswaManager': 'manager',
+    'SQLiteMahasiswaManager': 'sqlite_backend',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import submodul secara lazy (PEP 562)"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
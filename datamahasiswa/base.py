@@ -0,0 +1,54 @@
+"""Kontrak operasi data (abstract class) dan helper batch bersama semua backend"""
+
+from abc import ABC, abstractmethod
+
+from .model import Mahasiswa
+
+
+# ============================== ABSTRACT CLASS ==============================
+class DataOperations(ABC):
+    """Abstract class untuk operasi data"""
+    @abstractmethod
+    def display_data(self):
+        pass
+
+    @abstractmethod
+    def save_to_file(self):
+        pass
+
+    @abstractmethod
+    def load_from_file(self):
+        pass
+
+    @abstractmethod
+    def compact(self):
+        pass
+
+
+# ============================== BATCH HELPER ==============================
+def check_batch(records, exists, upsert=False, validate=True):
+    """Validasi batch Mahasiswa. exists(nim) memeriksa NIM di penyimpanan;
+    validate=False melewati cek regex untuk record yang sudah divalidasi (mis. import CSV).
+    Mengembalikan (list (row, Mahasiswa) yang valid, list laporan error per baris)."""
+    valid, errors, seen = [], [], set()
+    for row, mhs in enumerate(records):
+        nim = getattr(mhs, 'nim', None)
+        if not isinstance(mhs, Mahasiswa):
+            message = "Bukan data mahasiswa!"
+        else:
+            message = mhs.validate() if validate else None
+        if message is None and nim in seen:
+            message = f"NIM {nim} ganda dalam batch!"
+        elif message is None and not upsert and exists(nim):
+            message = f"NIM {nim} sudah terdaftar!"
+        if message is None:
+            seen.add(nim)
+            valid.append((row, mhs))
+        else:
+            errors.append({'row': row, 'nim': nim, 'error': message})
+    return valid, errors
+
+
+def batch_report(total, applied, errors):
+    """Laporan operasi batch yang sama untuk semua backend"""
+    return {'total': total, 'applied': applied, 'rejected': len(errors), 'errors': errors}
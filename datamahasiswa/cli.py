@@ -0,0 +1,240 @@
+"""CLI batch data mahasiswa (tanpa GUI).
+
+Contoh:
+    python -m datamahasiswa --file data_mahasiswa.json import mahasiswa.csv --workers 4
+    python -m datamahasiswa export hasil.jsonl.gz --where jurusan=Hukum --fields nim,nama,ipk
+    python -m datamahasiswa search --where nama=budi --limit 20
+    python -m datamahasiswa sort ipk --desc --save
+    python -m datamahasiswa stats --json
+    python -m datamahasiswa compact
+"""
+import argparse
+import json
+import sys
+
+from .exceptions import ValidationError, FileOperationError
+from .manager import DataMahasiswaManager
+from .storage import StreamingExporter
+
+FIELDS = StreamingExporter.FIELDS
+# Nama algoritma CLI -> method sorting manager (timsort = sort_by multi-kunci, seperti di GUI)
+SORT_ALGORITHMS = {
+    'quick': 'quick_sort',
+    'timsort': 'sort_by',
+    'radix': 'radix_sort',
+    'insertion': 'insertion_sort',
+    'selection': 'selection_sort',
+    'bubble': 'bubble_sort',
+}
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+# ============================== HELPER ==============================
+def open_manager(filename):
+    """Manager sesuai ekstensi file (SQLite untuk .db), data sudah dimuat"""
+    if filename.endswith(SQLITE_EXTENSIONS):
+        from .sqlite_backend import SQLiteMahasiswaManager
+        manager = SQLiteMahasiswaManager(filename)
+    else:
+        manager = DataMahasiswaManager(filename)
+    manager.load_from_file()
+    return manager
+
+
+def check_field(field):
+    """Nama field wajib salah satu FIELDS"""
+    if field not in FIELDS:
+        raise ValidationError(f"Field '{field}' tidak dikenal! Pilihan: {', '.join(FIELDS)}")
+    return field
+
+
+def parse_criteria(pairs):
+    """['jurusan=Hukum', 'nama=budi'] -> {'jurusan': 'Hukum', 'nama': 'budi'}"""
+    criteria = {}
+    for pair in pairs or []:
+        field, sep, value = pair.partition('=')
+        if not sep or not field:
+            raise ValidationError(f"Kriteria '{pair}' harus berformat field=nilai!")
+        criteria[check_field(field.strip())] = value.strip()
+    return criteria
+
+
+def parse_fields(value):
+    """'nim,nama' -> ['nim', 'nama']; None berarti field default"""
+    if not value:
+        return None
+    return [check_field(field.strip()) for field in value.split(',') if field.strip()]
+
+
+def validate_args(args):
+    """Memeriksa --fields/--where/field sort sebelum data dimuat"""
+    args.fields = parse_fields(getattr(args, 'fields', None))
+    args.criteria = parse_criteria(getattr(args, 'where', None))
+    if args.command == 'sort':
+        check_field(args.field)
+
+
+def select_records(manager, args):
+    """Record hasil filter --nim/--prefix/--where; None berarti seluruh data"""
+    if getattr(args, 'nim', None):
+        mhs = manager.get_by_nim(args.nim)
+        return [mhs] if mhs is not None else []
+    if getattr(args, 'prefix', None):
+        return manager.search_by_nim_prefix(args.prefix)
+    if args.criteria:
+        return manager.search_by_multiple(args.criteria)
+    return None
+
+
+def print_records(records, fields, as_json=False, out=None):
+    """Menulis record sebagai tabel teks atau JSON Lines"""
+    out = out or sys.stdout
+    for mhs in records:
+        data = mhs.to_dict()
+        if as_json:
+            out.write(json.dumps({field: data[field] for field in fields}, ensure_ascii=False) + "\n")
+        else:
+            out.write("  ".join(str(data[field]) for field in fields) + "\n")
+
+
+# ============================== COMMAND ==============================
+def cmd_import(manager, args):
+    report = manager.import_from_csv(args.csv, workers=args.workers, strict=args.strict)
+    print(f"Import {args.csv}: {report['applied']}/{report['total']} diterapkan, "
+          f"{report['rejected']} ditolak ({report.get('rows_per_sec', 0):.0f} baris/detik)")
+    for error in report['errors'][:args.show_errors]:
+        print(f"  baris {error['row']} ({error['nim']}): {error['error']}", file=sys.stderr)
+    return 1 if report['rejected'] and args.strict else 0
+
+
+def cmd_export(manager, args):
+    records = select_records(manager, args)
+    count = manager.export(args.output, records=records, fields=args.fields,
+                           fmt=args.format, compression=args.compression)
+    print(f"{count} data diexport ke {args.output}")
+    return 0
+
+
+def cmd_search(manager, args):
+    records = select_records(manager, args)
+    if records is None:
+        records = manager.get_all_mahasiswa()
+    fields = args.fields or ['nim', 'nama', 'jurusan', 'ipk']
+    print_records(records[:args.limit] if args.limit else records, fields, args.json)
+    if not args.json:
+        print(f"{len(records)} data ditemukan", file=sys.stderr)
+    return 0
+
+
+def cmd_sort(manager, args):
+    if not args.save:
+        # Hanya tampilan: urutan tersimpan (journal/kolom urutan SQLite) tidak disentuh
+        records = manager.get_sorted_page(args.field, not args.desc, 0, args.limit or None)
+    else:
+        if args.algorithm == 'timsort':
+            manager.sort_by([(args.field, not args.desc)])
+        else:
+            getattr(manager, SORT_ALGORITHMS[args.algorithm])(args.field, not args.desc)
+        manager.save_to_file()
+        records = manager.get_all_mahasiswa()
+        if args.limit:
+            records = records[:args.limit]
+    fields = ['nim', 'nama', 'jurusan', 'ipk']
+    if args.field not in fields:
+        fields.append(args.field)
+    print_records(records, fields, args.json)
+    return 0
+
+
+def cmd_stats(manager, args):
+    stats = manager.get_statistics()
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        return 0
+    if not stats:
+        print("Tidak ada data")
+        return 0
+    print(f"Total data : {stats['total']}")
+    print(f"Rata-rata  : {stats['avg_ipk']:.2f}")
+    print(f"IPK max/min: {stats['max_ipk']:.2f} / {stats['min_ipk']:.2f}")
+    for jurusan, count in sorted(stats['jurusan_distribution'].items()):
+        print(f"  {jurusan:<25} {count:>8}  rata-rata {stats['jurusan_avg_ipk'][jurusan]:.2f}")
+    return 0
+
+
+def cmd_compact(manager, args):
+    manager.compact()
+    print(f"{manager.get_count()} data dipadatkan ke {args.file}")
+    return 0
+
+
+# ============================== PARSER ==============================
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m datamahasiswa',
+                                     description="Operasi batch data mahasiswa tanpa GUI")
+    parser.add_argument('--file', default='data_mahasiswa.json',
+                        help="file data (JSON, .mhsb biner, atau .db SQLite)")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+
+    importer = commands.add_parser('import', help="import CSV paralel")
+    importer.add_argument('csv')
+    importer.add_argument('--workers', type=int, default=None)
+    importer.add_argument('--strict', action='store_true',
+                          help="batalkan seluruh import jika ada baris ditolak")
+    importer.add_argument('--show-errors', type=int, default=20,
+                          help="jumlah baris ditolak yang ditampilkan")
+    importer.set_defaults(func=cmd_import)
+
+    def add_filters(sub):
+        sub.add_argument('--nim')
+        sub.add_argument('--prefix', help="prefix NIM")
+        sub.add_argument('--where', action='append', metavar='FIELD=NILAI',
+                         help="kriteria pencarian, boleh diulang")
+        sub.add_argument('--fields', help=f"daftar field dipisah koma dari: {', '.join(FIELDS)}")
+
+    exporter = commands.add_parser('export', help="export CSV/JSON Lines/JSON (.gz/.xz)")
+    exporter.add_argument('output')
+    add_filters(exporter)
+    exporter.add_argument('--format', choices=('csv', 'jsonl', 'json'))
+    exporter.add_argument('--compression', choices=('gzip', 'lzma'))
+    exporter.set_defaults(func=cmd_export)
+
+    search = commands.add_parser('search', help="cari data")
+    add_filters(search)
+    search.add_argument('--limit', type=int, default=50)
+    search.add_argument('--json', action='store_true', help="output JSON Lines")
+    search.set_defaults(func=cmd_search)
+
+    sort = commands.add_parser('sort', help="urutkan data")
+    sort.add_argument('field', help=f"salah satu: {', '.join(FIELDS)}")
+    sort.add_argument('--desc', action='store_true')
+    sort.add_argument('--algorithm', choices=SORT_ALGORITHMS, default='quick',
+                      help="algoritma sorting saat --save")
+    sort.add_argument('--save', action='store_true',
+                      help="urutkan data lalu simpan urutan baru ke file")
+    sort.add_argument('--limit', type=int, default=50)
+    sort.add_argument('--json', action='store_true', help="output JSON Lines")
+    sort.set_defaults(func=cmd_sort)
+
+    stats = commands.add_parser('stats', help="statistik IPK & jurusan")
+    stats.add_argument('--json', action='store_true')
+    stats.set_defaults(func=cmd_stats)
+
+    compact = commands.add_parser('compact', help="lipat journal ke snapshot baru")
+    compact.set_defaults(func=cmd_compact)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        validate_args(args)
+        manager = open_manager(args.file)
+        try:
+            return args.func(manager, args)
+        finally:
+            manager.shutdown()
+    except (ValidationError, FileOperationError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
@@ -0,0 +1,11 @@
+"""Exception custom data mahasiswa"""
+
+
+# ============================== EXCEPTION CUSTOM ==============================
+class ValidationError(Exception):
+    """Exception untuk validasi input"""
+    pass
+
+class FileOperationError(Exception):
+    """Exception untuk operasi file"""
+    pass
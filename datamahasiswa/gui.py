@@ -0,0 +1,1435 @@
+"""Aplikasi GUI Tkinter"""
+
+import math
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk, messagebox, filedialog
+
+from .exceptions import ValidationError, FileOperationError
+from .manager import DataMahasiswaManager
+from .model import Mahasiswa
+
+
+# ============================== GUI APPLICATION ==============================
+class MahasiswaApp:
+    """Kelas utama untuk aplikasi GUI"""
+    PAGE_SIZE = 500  # Jumlah baris per halaman treeview
+    LOAD_PROGRESS_MIN_BYTES = 1 << 20  # Progress bar hanya untuk file data >= 1 MB
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Manajemen Data Mahasiswa - Enhanced Version")
+        self.root.geometry("1200x800")
+        self.root.configure(bg='#2E7D32')  # Hijau gelap
+        
+        # Set minimum size
+        self.root.minsize(1000, 700)
+        
+        # Inisialisasi data manager
+        self.data_manager = DataMahasiswaManager()
+        
+        # Tampilan treeview: None = urutan array, selain itu field sorted view
+        self.view_field = None
+        self.view_ascending = True
+        self.current_page = 0
+        self.search_results = None  # Hasil pencarian yang sedang ditampilkan
+        
+        # Load data dari file (jika ada)
+        self.load_initial_data()
+        
+        # Setup GUI
+        self.setup_styles()
+        self.create_widgets()
+        self.update_display()
+        
+        # Auto-save timer
+        self.setup_autosave()
+
+    def setup_autosave(self):
+        """Setup timer untuk auto-save"""
+        def autosave():
+            # Lewati jika tidak ada perubahan; serialisasi berjalan di thread worker
+            self.data_manager.request_save()
+            self.root.after(30000, autosave)  # Auto-save setiap 30 detik
+        
+        self.root.after(30000, autosave)
+
+    def load_with_progress(self):
+        """Memuat file data; file besar menampilkan jendela progress bar"""
+        window = None
+        bar = None
+
+        def progress(bytes_read, total_bytes):
+            nonlocal window, bar
+            if total_bytes < self.LOAD_PROGRESS_MIN_BYTES:
+                return
+            if window is None:
+                window = tk.Toplevel(self.root)
+                window.title("Memuat Data")
+                window.resizable(False, False)
+                ttk.Label(window, text="📂 Memuat data mahasiswa...", padding=10).pack()
+                bar = ttk.Progressbar(window, length=300, mode='determinate', maximum=total_bytes)
+                bar.pack(padx=20, pady=(0, 15))
+                window.grab_set()
+            bar['value'] = bytes_read
+            window.update()
+
+        try:
+            return self.data_manager.load_from_file(progress=progress)
+        finally:
+            if window is not None:
+                window.grab_release()
+                window.destroy()
+
+    def load_initial_data(self):
+        """Load data awal dengan error handling"""
+        try:
+            if not self.load_with_progress():
+                messagebox.showinfo("Info", "📄 File data tidak ditemukan. Membuat data baru.")
+        except FileOperationError as e:
+            messagebox.showwarning("Peringatan", f"⚠ {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Gagal memuat data: {str(e)}")
+
+    def setup_styles(self):
+        """Setup styles untuk widget"""
+        self.style = ttk.Style()
+        try:
+            self.style.theme_use('clam')
+        except:
+            pass
+
+        self.colors = {
+            'primary': '#2E7D32',
+            'secondary': '#4CAF50',
+            'accent': '#FFEB3B',
+            'background': '#E8F5E9',
+            'text': '#212121',
+            'error': '#F44336',
+            'warning': '#FF9800',
+            'info': '#2196F3'
+        }
+
+        # Configure styles
+        self.style.configure('TFrame', background=self.colors['primary'])
+        self.style.configure('TLabel', background=self.colors['primary'], foreground='white')
+        self.style.configure('TButton', background=self.colors['secondary'], foreground='black')
+        self.style.configure('TLabelframe', background=self.colors['primary'], foreground='white')
+        self.style.configure('TLabelframe.Label', background=self.colors['primary'], foreground='white')
+        
+        self.style.configure('Title.TLabel', font=('Arial', 18, 'bold'), 
+                           background=self.colors['primary'], foreground=self.colors['accent'])
+        self.style.configure('Subtitle.TLabel', font=('Arial', 11, 'bold'),
+                           background=self.colors['primary'], foreground='white')
+        
+        self.style.configure('Primary.TButton', background=self.colors['secondary'], 
+                           foreground='white', font=('Arial', 9, 'bold'))
+        self.style.configure('Secondary.TButton', background=self.colors['info'], 
+                           foreground='white', font=('Arial', 9))
+        
+        self.style.configure('Treeview', background=self.colors['background'], 
+                           fieldbackground=self.colors['background'], foreground=self.colors['text'])
+        self.style.configure('Treeview.Heading', background=self.colors['secondary'], 
+                           foreground='black', font=('Arial', 9, 'bold'))
+        self.style.map('Treeview', background=[('selected', '#81C784')])
+        
+        self.style.configure('Error.TLabel', background=self.colors['error'], foreground='white')
+        self.style.configure('Success.TLabel', background=self.colors['secondary'], foreground='white')
+
+    def create_widgets(self):
+        """Membuat semua widget GUI"""
+        # Main container
+        main_container = ttk.Frame(self.root, padding="5")
+        main_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid weights
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+        main_container.grid_rowconfigure(0, weight=1)
+        main_container.grid_columnconfigure(0, weight=1)
+        
+        # Create notebook (tabbed interface)
+        self.notebook = ttk.Notebook(main_container)
+        self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Tab 1: Data Management
+        self.create_data_tab()
+        
+        # Tab 2: Search & Sort
+        self.create_search_sort_tab()
+        
+        # Tab 3: Statistics
+        self.create_statistics_tab()
+        
+        # Tab 4: Performance
+        self.create_performance_tab()
+        
+        # Status bar
+        self.create_status_bar(main_container)
+
+    def create_data_tab(self):
+        """Membuat tab untuk manajemen data"""
+        data_tab = ttk.Frame(self.notebook)
+        self.notebook.add(data_tab, text="📝 Data Management")
+        
+        # Title
+        title_frame = ttk.Frame(data_tab)
+        title_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Label(title_frame, text="MANAJEMEN DATA MAHASISWA", 
+                 style='Title.TLabel').pack()
+        ttk.Label(title_frame, text="Sistem Pengelolaan Data Mahasiswa Terintegrasi",
+                 style='Subtitle.TLabel').pack()
+        
+        # Content frame dengan grid
+        content_frame = ttk.Frame(data_tab)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Left side: Input form
+        input_frame = ttk.LabelFrame(content_frame, text="📋 Form Input Data", padding="15")
+        input_frame.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.W), padx=(0, 10), pady=5)
+        
+        self.create_input_form(input_frame)
+        
+        # Right side: Data table
+        table_frame = ttk.LabelFrame(content_frame, text="📊 Data Mahasiswa", padding="10")
+        table_frame.grid(row=0, column=1, sticky=(tk.N, tk.S, tk.E, tk.W), pady=5)
+        
+        # Configure grid weights
+        content_frame.grid_rowconfigure(0, weight=1)
+        content_frame.grid_columnconfigure(1, weight=1)
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+        
+        self.create_data_table(table_frame)
+        
+        # Navigation buttons
+        self.create_navigation_buttons(content_frame)
+
+    def create_input_form(self, parent):
+        """Membuat form input data"""
+        fields = [
+            ("NIM (12 digit):", "nim", "entry"),
+            ("Nama Lengkap:", "nama", "entry"),
+            ("Jurusan:", "jurusan", "combo"),
+            ("Email:", "email", "entry"),
+            ("Telepon:", "telepon", "entry"),
+            ("IPK (0.0-4.0):", "ipk", "entry")
+        ]
+        
+        self.entries = {}
+        jurusan_options = [
+            "Teknik Informatika", "Sistem Informasi", "Teknik Komputer",
+            "Manajemen Informatika", "Ilmu Komputer", "Teknologi Informasi",
+            "Teknik Elektro", "Teknik Industri", "Teknik Sipil",
+            "Akuntansi", "Manajemen", "Hukum", "Lainnya"
+        ]
+        
+        for i, (label, field, widget_type) in enumerate(fields):
+            # Label
+            lbl = ttk.Label(parent, text=label, font=('Arial', 9, 'bold'))
+            lbl.grid(row=i, column=0, sticky=tk.W, pady=8, padx=(0, 10))
+            
+            # Widget input
+            if widget_type == "entry":
+                entry = ttk.Entry(parent, width=35, font=('Arial', 9))
+                entry.grid(row=i, column=1, pady=8, sticky=tk.W)
+                self.entries[field] = entry
+                
+                # Bind Enter key untuk navigasi
+                entry.bind('<Return>', lambda e, f=field: self.focus_next_field(f))
+                
+            elif widget_type == "combo":
+                combo = ttk.Combobox(parent, values=jurusan_options, 
+                                   state="readonly", width=33, font=('Arial', 9))
+                combo.grid(row=i, column=1, pady=8, sticky=tk.W)
+                combo.set("Teknik Informatika")
+                self.entries[field] = combo
+        
+        # Action buttons frame
+        btn_frame = ttk.Frame(parent)
+        btn_frame.grid(row=len(fields), column=0, columnspan=2, pady=20)
+        
+        button_configs = [
+            ("➕ Tambah", self.add_mahasiswa, '#4CAF50'),
+            ("✏️ Update", self.update_mahasiswa, '#2196F3'),
+            ("🗑️ Hapus", self.delete_mahasiswa, '#F44336'),
+            ("🧹 Clear", self.clear_fields, '#FF9800'),
+            ("📋 Detail", self.show_details, '#9C27B0')
+        ]
+        
+        for text, command, color in button_configs:
+            btn = tk.Button(btn_frame, text=text, command=command,
+                          bg=color, fg='white', font=('Arial', 9, 'bold'),
+                          padx=10, pady=5, bd=0, cursor='hand2')
+            btn.pack(side=tk.LEFT, padx=5)
+            btn.bind("<Enter>", lambda e, b=btn: b.config(brightness=0.9))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(brightness=1.0))
+
+    def focus_next_field(self, current_field):
+        """Focus ke field berikutnya saat tekan Enter"""
+        field_order = ['nim', 'nama', 'jurusan', 'email', 'telepon', 'ipk']
+        try:
+            current_idx = field_order.index(current_field)
+            next_field = field_order[current_idx + 1] if current_idx + 1 < len(field_order) else 'nim'
+            self.entries[next_field].focus()
+        except:
+            pass
+
+    def create_data_table(self, parent):
+        """Membuat tabel data"""
+        # Frame untuk treeview dan scrollbar
+        tree_frame = ttk.Frame(parent)
+        tree_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        
+        # Define columns
+        columns = ('No', 'NIM', 'Nama', 'Jurusan', 'IPK', 'Status')
+        
+        # Create treeview
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        
+        # Define column headings and widths
+        col_configs = [
+            ('No', 50, 'center'),
+            ('NIM', 120, 'center'),
+            ('Nama', 200, 'w'),
+            ('Jurusan', 150, 'center'),
+            ('IPK', 80, 'center'),
+            ('Status', 100, 'center')
+        ]
+        
+        for col, width, anchor in col_configs:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor=anchor)
+        
+        # Add scrollbars
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        # Grid layout
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        
+        # Bind events
+        self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        self.tree.bind('<Double-Button-1>', self.on_tree_double_click)
+        
+        # Context menu
+        self.create_context_menu()
+
+    def create_context_menu(self):
+        """Membuat context menu untuk treeview"""
+        self.context_menu = tk.Menu(self.root, tearoff=0)
+        self.context_menu.add_command(label="Edit Data", command=self.edit_selected)
+        self.context_menu.add_command(label="Hapus Data", command=self.delete_mahasiswa)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Lihat Detail", command=self.show_details)
+        self.context_menu.add_command(label="Salin NIM", command=self.copy_nim)
+        
+        self.tree.bind('<Button-3>', self.show_context_menu)
+
+    def show_context_menu(self, event):
+        """Menampilkan context menu"""
+        try:
+            self.tree.selection_set(self.tree.identify_row(event.y))
+            self.context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.context_menu.grab_release()
+
+    def copy_nim(self):
+        """Copy NIM ke clipboard"""
+        nim = self.get_selected_nim()
+        if nim:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(nim)
+            self.show_toast("NIM disalin ke clipboard!")
+
+    def show_toast(self, message):
+        """Menampilkan toast notification"""
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.geometry(f"300x50+{self.root.winfo_x()+450}+{self.root.winfo_y()+700}")
+        
+        label = tk.Label(toast, text=message, bg='#333', fg='white', 
+                        font=('Arial', 10), padx=20, pady=10)
+        label.pack(fill=tk.BOTH, expand=True)
+        
+        toast.after(2000, toast.destroy)
+
+    def create_navigation_buttons(self, parent):
+        """Membuat navigation buttons"""
+        nav_frame = ttk.LabelFrame(parent, text="🔄 Navigasi & Kontrol", padding="15")
+        nav_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        
+        # Navigation buttons
+        nav_btn_frame = ttk.Frame(nav_frame)
+        nav_btn_frame.pack(pady=5)
+        
+        nav_buttons = [
+            ("⏮ First", self.first_mahasiswa),
+            ("⏪ Prev", self.prev_mahasiswa),
+            ("Next ⏩", self.next_mahasiswa),
+            ("Last ⏭", self.last_mahasiswa),
+            ("🔍 Find", self.show_search_dialog)
+        ]
+        
+        for text, command in nav_buttons:
+            btn = ttk.Button(nav_btn_frame, text=text, command=command, 
+                           style='Primary.TButton', width=12)
+            btn.pack(side=tk.LEFT, padx=5)
+        
+        # Position display
+        self.position_var = tk.StringVar(value="Posisi: 0/0")
+        pos_label = ttk.Label(nav_frame, textvariable=self.position_var, 
+                            font=('Arial', 10, 'bold'))
+        pos_label.pack(pady=5)
+        
+        # Paging treeview
+        page_frame = ttk.Frame(nav_frame)
+        page_frame.pack(pady=5)
+        
+        ttk.Button(page_frame, text="◀ Hal", command=self.prev_page,
+                  style='Secondary.TButton', width=8).pack(side=tk.LEFT, padx=3)
+        self.page_var = tk.StringVar(value="Hal 1/1")
+        ttk.Label(page_frame, textvariable=self.page_var,
+                 font=('Arial', 9, 'bold')).pack(side=tk.LEFT, padx=5)
+        ttk.Button(page_frame, text="Hal ▶", command=self.next_page,
+                  style='Secondary.TButton', width=8).pack(side=tk.LEFT, padx=3)
+        
+        # File operations
+        file_btn_frame = ttk.Frame(nav_frame)
+        file_btn_frame.pack(pady=10)
+        
+        file_buttons = [
+            ("💾 Save", self.save_data),
+            ("📂 Load", self.load_data),
+            ("📥 Import", self.import_data),
+            ("📤 Export", self.export_data),
+            ("🔄 Refresh", self.update_display),
+            ("🗑️ Reset", self.reset_data)
+        ]
+        
+        for text, command in file_buttons:
+            btn = ttk.Button(file_btn_frame, text=text, command=command,
+                           style='Secondary.TButton', width=10)
+            btn.pack(side=tk.LEFT, padx=3)
+
+    def create_search_sort_tab(self):
+        """Membuat tab untuk search dan sort"""
+        search_tab = ttk.Frame(self.notebook)
+        self.notebook.add(search_tab, text="🔍 Search & Sort")
+        
+        # Search section
+        search_frame = ttk.LabelFrame(search_tab, text="🔍 Advanced Search", padding="20")
+        search_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.create_search_section(search_frame)
+        
+        # Sort section
+        sort_frame = ttk.LabelFrame(search_tab, text="📊 Sorting Algorithms", padding="20")
+        sort_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.create_sort_section(sort_frame)
+
+    def create_search_section(self, parent):
+        """Membuat section untuk search"""
+        # Search criteria
+        criteria_frame = ttk.Frame(parent)
+        criteria_frame.pack(fill=tk.X, pady=10)
+        
+        search_fields = [
+            ("NIM:", "nim"),
+            ("Nama:", "nama"),
+            ("Jurusan:", "jurusan"),
+            ("Email:", "email")
+        ]
+        
+        self.search_entries = {}
+        for i, (label, field) in enumerate(search_fields):
+            ttk.Label(criteria_frame, text=label).grid(row=i//2, column=(i%2)*2, 
+                                                      sticky=tk.W, padx=5, pady=5)
+            entry = ttk.Entry(criteria_frame, width=25)
+            entry.grid(row=i//2, column=(i%2)*2+1, sticky=tk.W, padx=5, pady=5)
+            self.search_entries[field] = entry
+        
+        # Search buttons
+        btn_frame = ttk.Frame(parent)
+        btn_frame.pack(pady=15)
+        
+        search_methods = [
+            ("Linear Search", self.do_linear_search),
+            ("Binary Search", self.do_binary_search),
+            ("Quick Search", self.do_quick_search),
+            ("Trigram Search", self.do_trigram_search),
+            ("Clear", self.clear_search)
+        ]
+        
+        for text, command in search_methods:
+            btn = ttk.Button(btn_frame, text=text, command=command,
+                           style='Primary.TButton', width=15)
+            btn.pack(side=tk.LEFT, padx=5)
+
+    def create_sort_section(self, parent):
+        """Membuat section untuk sorting"""
+        # Sort options
+        options_frame = ttk.Frame(parent)
+        options_frame.pack(fill=tk.X, pady=10)
+        
+        ttk.Label(options_frame, text="Sort by:").pack(side=tk.LEFT, padx=5)
+        
+        self.sort_field_var = tk.StringVar(value="nim")
+        sort_fields = ttk.Combobox(options_frame, textvariable=self.sort_field_var,
+                                 values=['nim', 'nama', 'jurusan', 'ipk', 'created_at'],
+                                 state="readonly", width=15)
+        sort_fields.pack(side=tk.LEFT, padx=5)
+        
+        self.sort_order_var = tk.StringVar(value="asc")
+        ttk.Radiobutton(options_frame, text="Ascending", variable=self.sort_order_var,
+                       value="asc").pack(side=tk.LEFT, padx=10)
+        ttk.Radiobutton(options_frame, text="Descending", variable=self.sort_order_var,
+                       value="desc").pack(side=tk.LEFT, padx=10)
+        
+        # Kunci kedua untuk Timsort multi-kunci
+        secondary_frame = ttk.Frame(parent)
+        secondary_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(secondary_frame, text="Lalu by:").pack(side=tk.LEFT, padx=5)
+        
+        self.sort_field2_var = tk.StringVar(value="")
+        sort_fields2 = ttk.Combobox(secondary_frame, textvariable=self.sort_field2_var,
+                                  values=['', 'nim', 'nama', 'jurusan', 'ipk', 'created_at'],
+                                  state="readonly", width=15)
+        sort_fields2.pack(side=tk.LEFT, padx=5)
+        
+        self.sort_order2_var = tk.StringVar(value="asc")
+        ttk.Radiobutton(secondary_frame, text="Ascending", variable=self.sort_order2_var,
+                       value="asc").pack(side=tk.LEFT, padx=10)
+        ttk.Radiobutton(secondary_frame, text="Descending", variable=self.sort_order2_var,
+                       value="desc").pack(side=tk.LEFT, padx=10)
+        
+        # Sort buttons
+        btn_frame = ttk.Frame(parent)
+        btn_frame.pack(pady=15)
+        
+        sort_algorithms = [
+            ("Bubble Sort", self.do_bubble_sort),
+            ("Selection Sort", self.do_selection_sort),
+            ("Insertion Sort", self.do_insertion_sort),
+            ("Quick Sort", self.do_quick_sort),
+            ("Timsort", self.do_timsort),
+            ("Radix Sort", self.do_radix_sort)
+        ]
+        
+        for text, command in sort_algorithms:
+            btn = ttk.Button(btn_frame, text=text, command=command,
+                           style='Primary.TButton', width=15)
+            btn.pack(side=tk.LEFT, padx=5)
+        
+        # Sorted view: tampil terurut tanpa mengubah urutan array
+        view_frame = ttk.Frame(parent)
+        view_frame.pack(pady=5)
+        
+        view_buttons = [
+            ("Sorted View", self.do_sorted_view),
+            ("Urutan Asli", self.reset_view)
+        ]
+        
+        for text, command in view_buttons:
+            btn = ttk.Button(view_frame, text=text, command=command,
+                           style='Secondary.TButton', width=15)
+            btn.pack(side=tk.LEFT, padx=5)
+        
+        # Results display
+        results_frame = ttk.LabelFrame(parent, text="📈 Performance", padding="10")
+        results_frame.pack(fill=tk.X, pady=10)
+        
+        self.sort_results_var = tk.StringVar(value="Waktu eksekusi akan ditampilkan di sini...")
+        ttk.Label(results_frame, textvariable=self.sort_results_var,
+                 font=('Arial', 9)).pack()
+
+    def create_statistics_tab(self):
+        """Membuat tab untuk statistics"""
+        stats_tab = ttk.Frame(self.notebook)
+        self.notebook.add(stats_tab, text="📈 Statistics")
+        self.stats_tab = stats_tab
+        
+        # Statistics display
+        stats_frame = ttk.LabelFrame(stats_tab, text="📊 Statistik Data", padding="20")
+        stats_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self.stats_text = tk.Text(stats_frame, height=15, width=60,
+                                font=('Consolas', 10), bg=self.colors['background'])
+        scrollbar = ttk.Scrollbar(stats_frame, command=self.stats_text.yview)
+        self.stats_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.stats_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        stats_frame.grid_rowconfigure(0, weight=1)
+        stats_frame.grid_columnconfigure(0, weight=1)
+        
+        # Leaderboard top-K
+        self.create_leaderboard(stats_tab)
+        
+        # Update button
+        ttk.Button(stats_tab, text="🔄 Update Statistics", 
+                  command=self.refresh_statistics_tab, style='Primary.TButton').pack(pady=10)
+
+    def create_leaderboard(self, parent):
+        """Membuat panel leaderboard IPK (top-K)"""
+        board_frame = ttk.LabelFrame(parent, text="🏆 Leaderboard", padding="10")
+        board_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        options_frame = ttk.Frame(board_frame)
+        options_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(options_frame, text="Jurusan:").pack(side=tk.LEFT, padx=5)
+        self.board_jurusan_var = tk.StringVar(value="")
+        self.board_jurusan_combo = ttk.Combobox(options_frame, textvariable=self.board_jurusan_var,
+                                              values=[''], state="readonly", width=25)
+        self.board_jurusan_combo.pack(side=tk.LEFT, padx=5)
+        self.board_jurusan_combo.bind('<<ComboboxSelected>>', lambda e: self.update_leaderboard())
+        
+        ttk.Label(options_frame, text="Top:").pack(side=tk.LEFT, padx=5)
+        self.board_k_var = tk.StringVar(value="10")
+        ttk.Spinbox(options_frame, from_=1, to=100, textvariable=self.board_k_var,
+                   width=5).pack(side=tk.LEFT, padx=5)
+        
+        self.board_order_var = tk.StringVar(value="desc")
+        ttk.Radiobutton(options_frame, text="Tertinggi", variable=self.board_order_var,
+                       value="desc", command=self.update_leaderboard).pack(side=tk.LEFT, padx=10)
+        ttk.Radiobutton(options_frame, text="Terendah", variable=self.board_order_var,
+                       value="asc", command=self.update_leaderboard).pack(side=tk.LEFT, padx=10)
+        
+        ttk.Button(options_frame, text="Tampilkan", command=self.update_leaderboard,
+                  style='Primary.TButton').pack(side=tk.LEFT, padx=5)
+        
+        columns = ('Rank', 'NIM', 'Nama', 'Jurusan', 'IPK')
+        self.board_tree = ttk.Treeview(board_frame, columns=columns, show='headings', height=6)
+        col_configs = [
+            ('Rank', 50, 'center'),
+            ('NIM', 120, 'center'),
+            ('Nama', 200, 'w'),
+            ('Jurusan', 150, 'center'),
+            ('IPK', 80, 'center')
+        ]
+        for col, width, anchor in col_configs:
+            self.board_tree.heading(col, text=col)
+            self.board_tree.column(col, width=width, anchor=anchor)
+        self.board_tree.pack(fill=tk.X, pady=5)
+        self.leaderboard_stale = True  # Dihitung ulang saat tab Statistics dibuka
+
+    def create_performance_tab(self):
+        """Membuat tab untuk instrumentasi performa"""
+        perf_tab = ttk.Frame(self.notebook)
+        self.notebook.add(perf_tab, text="⏱ Performance")
+        
+        # Ringkasan latensi per operasi
+        summary_frame = ttk.LabelFrame(perf_tab, text="⏱ Latensi Operasi (ms)", padding="10")
+        summary_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        columns = ('Operasi', 'Count', 'Error', 'Mean', 'p50', 'p95', 'p99', 'Max', 'Total')
+        self.perf_tree = ttk.Treeview(summary_frame, columns=columns, show='headings', height=12)
+        for col in columns:
+            self.perf_tree.heading(col, text=col)
+            self.perf_tree.column(col, width=160 if col == 'Operasi' else 80,
+                                  anchor='w' if col == 'Operasi' else 'e')
+        scrollbar = ttk.Scrollbar(summary_frame, command=self.perf_tree.yview)
+        self.perf_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.perf_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        summary_frame.grid_rowconfigure(0, weight=1)
+        summary_frame.grid_columnconfigure(0, weight=1)
+        
+        # Operasi terakhir (ring buffer)
+        recent_frame = ttk.LabelFrame(perf_tab, text="🕘 Operasi Terakhir", padding="10")
+        recent_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        self.perf_recent_text = tk.Text(recent_frame, height=8, width=60,
+                                      font=('Consolas', 9), bg=self.colors['background'])
+        self.perf_recent_text.pack(fill=tk.X)
+        
+        btn_frame = ttk.Frame(perf_tab)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="🔄 Refresh", command=self.update_performance,
+                  style='Primary.TButton').pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="🧹 Reset", command=self.reset_performance,
+                  style='Secondary.TButton').pack(side=tk.LEFT, padx=5)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self.on_tab_changed())
+
+    def create_status_bar(self, parent):
+        """Membuat status bar"""
+        status_bar = tk.Frame(parent, bg='#1B5E20', height=25)
+        status_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        
+        self.status_var = tk.StringVar()
+        self.status_var.set(f"📊 Jumlah data: {self.data_manager.get_count()} | 💾 Auto-save aktif")
+        
+        status_label = tk.Label(status_bar, textvariable=self.status_var,
+                               bg='#1B5E20', fg='white', font=('Arial', 9))
+        status_label.pack(side=tk.LEFT, padx=10)
+        
+        # Timer
+        self.time_var = tk.StringVar()
+        time_label = tk.Label(status_bar, textvariable=self.time_var,
+                            bg='#1B5E20', fg='white', font=('Arial', 9))
+        time_label.pack(side=tk.RIGHT, padx=10)
+        
+        # Info penyimpanan terakhir
+        self.save_status_var = tk.StringVar(value="💾 Belum disimpan")
+        save_label = tk.Label(status_bar, textvariable=self.save_status_var,
+                            bg='#1B5E20', fg='white', font=('Arial', 9))
+        save_label.pack(side=tk.RIGHT, padx=10)
+        
+        self.update_time()
+
+    def update_time(self):
+        """Update waktu di status bar"""
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.time_var.set(f"🕒 {current_time}")
+        self.check_autosave_errors()
+        self.update_save_status()
+        self.root.after(1000, self.update_time)
+
+    def update_save_status(self):
+        """Menampilkan waktu & durasi simpan terakhir serta status perubahan"""
+        info = self.data_manager.get_last_save_info()
+        dirty = " • ada perubahan" if self.data_manager.is_dirty() else ""
+        if info:
+            self.save_status_var.set(f"💾 Disimpan {info['saved_at'][11:]} "
+                                     f"({info['duration_ms']:.0f} ms){dirty}")
+        else:
+            self.save_status_var.set(f"💾 Belum disimpan{dirty}")
+
+    def check_autosave_errors(self):
+        """Menampilkan error dari thread autosave (dipoll dari event loop Tk)"""
+        errors = self.data_manager.pop_autosave_errors()
+        if errors:
+            self.status_var.set(f"⚠ Auto-save gagal: {errors[-1]}")
+            messagebox.showwarning("Auto-save", f"⚠ {errors[-1]}")
+
+    # ==================== EVENT HANDLERS ====================
+    def add_mahasiswa(self):
+        try:
+            nim = self.entries['nim'].get().strip()
+            nama = self.entries['nama'].get().strip()
+            jurusan = self.entries['jurusan'].get().strip()
+            email = self.entries['email'].get().strip()
+            telepon = self.entries['telepon'].get().strip()
+            ipk = self.entries['ipk'].get().strip()
+
+            if not nim or not nama:
+                raise ValidationError("NIM dan Nama harus diisi!")
+
+            if len(nim) != 12 or not nim.isdigit():
+                raise ValidationError("NIM harus 12 digit angka!")
+
+            mahasiswa = Mahasiswa()
+            mahasiswa.nim = nim
+            mahasiswa.nama = nama
+            mahasiswa.jurusan = jurusan
+            mahasiswa.email = email
+            mahasiswa.telepon = telepon
+
+            if ipk:
+                mahasiswa.ipk = ipk
+            else:
+                mahasiswa.ipk = 0.0
+
+            self.data_manager.add_mahasiswa(mahasiswa)
+            self.update_display()
+            self.clear_fields()
+            self.show_toast("✅ Data berhasil ditambahkan!")
+            
+        except ValidationError as e:
+            messagebox.showerror("Validasi Error", f"❌ {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Terjadi kesalahan: {str(e)}")
+
+    def update_mahasiswa(self):
+        try:
+            selection = self.tree.selection()
+            if not selection:
+                messagebox.showwarning("Peringatan", "⚠ Pilih data yang akan diupdate!")
+                return
+
+            old_nim = selection[0]
+
+            nim = self.entries['nim'].get().strip()
+            nama = self.entries['nama'].get().strip()
+            jurusan = self.entries['jurusan'].get().strip()
+            email = self.entries['email'].get().strip()
+            telepon = self.entries['telepon'].get().strip()
+            ipk = self.entries['ipk'].get().strip()
+
+            if not nim or not nama:
+                raise ValidationError("NIM dan Nama harus diisi!")
+
+            mahasiswa = Mahasiswa()
+            mahasiswa.nim = nim
+            mahasiswa.nama = nama
+            mahasiswa.jurusan = jurusan
+            mahasiswa.email = email
+            mahasiswa.telepon = telepon
+
+            if ipk:
+                mahasiswa.ipk = ipk
+            else:
+                mahasiswa.ipk = 0.0
+
+            if self.data_manager.edit_by_nim(old_nim, mahasiswa):
+                self.update_display()
+                self.clear_fields()
+                self.show_toast("✅ Data berhasil diupdate!")
+            else:
+                messagebox.showerror("Error", "❌ Gagal mengupdate data!")
+                
+        except ValidationError as e:
+            messagebox.showerror("Validasi Error", f"❌ {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Terjadi kesalahan: {str(e)}")
+
+    def delete_mahasiswa(self):
+        try:
+            selection = self.tree.selection()
+            if not selection:
+                messagebox.showwarning("Peringatan", "⚠ Pilih data yang akan dihapus!")
+                return
+
+            if not messagebox.askyesno("Konfirmasi", "🗑 Apakah Anda yakin ingin menghapus data ini?"):
+                return
+
+            deleted = self.data_manager.delete_by_nim(selection[0])
+            if deleted:
+                self.update_display()
+                self.clear_fields()
+                self.show_toast(f"✅ Data {deleted.nama} berhasil dihapus!")
+            else:
+                messagebox.showerror("Error", "❌ Gagal menghapus data!")
+                
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Terjadi kesalahan: {str(e)}")
+
+    def edit_selected(self):
+        """Edit data yang dipilih dari context menu"""
+        selection = self.tree.selection()
+        if selection:
+            self.update_mahasiswa()
+
+    def show_details(self):
+        """Menampilkan detail data"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("Peringatan", "⚠ Pilih data untuk melihat detail!")
+            return
+
+        mhs = self.data_manager.get_by_nim(selection[0])
+        
+        if mhs:
+            details = f"""
+📋 DETAIL MAHASISWA
+
+📝 Identitas:
+• NIM      : {mhs.nim}
+• Nama     : {mhs.nama}
+• Jurusan  : {mhs.jurusan}
+
+📞 Kontak:
+• Email    : {mhs.email if mhs.email else '-'}
+• Telepon  : {mhs.telepon if mhs.telepon else '-'}
+
+📊 Akademik:
+• IPK      : {mhs.ipk:.2f}
+• Status   : {'Lulus' if mhs.ipk >= 2.0 else 'Belum Lulus'}
+
+📅 Timeline:
+• Dibuat   : {mhs.created_at}
+• Diupdate : {mhs.updated_at}
+"""
+            messagebox.showinfo("Detail Mahasiswa", details)
+
+    def do_linear_search(self):
+        keyword = self.search_entries['nim'].get().strip() or \
+                 self.search_entries['nama'].get().strip() or \
+                 self.search_entries['jurusan'].get().strip() or \
+                 self.search_entries['email'].get().strip()
+        
+        if not keyword:
+            messagebox.showwarning("Peringatan", "⚠ Masukkan keyword pencarian!")
+            return
+
+        results = self.data_manager.linear_search(keyword, 'nama')
+        exec_ms = self.data_manager.get_monitor().last_ms('search.linear')
+        
+        self.display_search_results(results, "Linear Search", exec_ms)
+
+    def do_binary_search(self):
+        nim = self.search_entries['nim'].get().strip()
+        if not nim:
+            messagebox.showwarning("Peringatan", "⚠ Masukkan NIM untuk Binary Search!")
+            return
+
+        if len(nim) == 12:
+            result = self.data_manager.binary_search(nim)
+            results = [result] if result else []
+            exec_ms = self.data_manager.get_monitor().last_ms('search.binary')
+        else:
+            # NIM tidak lengkap: range query berdasarkan awalan NIM
+            results = self.data_manager.search_by_nim_prefix(nim)
+            exec_ms = self.data_manager.get_monitor().last_ms('search.nim_prefix')
+        
+        self.display_search_results(results, "Binary Search", exec_ms)
+
+    def do_quick_search(self):
+        criteria = {}
+        for field, entry in self.search_entries.items():
+            value = entry.get().strip()
+            if value:
+                criteria[field] = value
+        
+        if not criteria:
+            messagebox.showwarning("Peringatan", "⚠ Masukkan minimal satu kriteria pencarian!")
+            return
+
+        results = self.data_manager.search_by_multiple(criteria)
+        exec_ms = self.data_manager.get_monitor().last_ms('search.multiple')
+        
+        plan_lines = []
+        for i, step in enumerate(self.data_manager.get_last_search_plan(), 1):
+            if step['actual'] is None:
+                plan_lines.append(f"{i}. {step['field']} [{step['method']}] dilewati")
+            else:
+                plan_lines.append(f"{i}. {step['field']} [{step['method']}] "
+                                  f"est {step['estimate']} → {step['actual']} "
+                                  f"({step['time_ms']:.3f} ms)")
+        self.display_search_results(results, "Quick Search", exec_ms,
+                                    "📋 Rencana eksekusi:\n" + "\n".join(plan_lines))
+
+    def do_trigram_search(self):
+        field, keyword = None, ''
+        for candidate in ('nama', 'email', 'jurusan'):
+            keyword = self.search_entries[candidate].get().strip()
+            if keyword:
+                field = candidate
+                break
+
+        if not field:
+            messagebox.showwarning("Peringatan", "⚠ Masukkan Nama, Email, atau Jurusan untuk Trigram Search!")
+            return
+
+        results = self.data_manager.trigram_search(keyword, field)
+        exec_ms = self.data_manager.get_monitor().last_ms('search.trigram')
+        
+        self.display_search_results(results, "Trigram Search", exec_ms)
+
+    def clear_search(self):
+        for entry in self.search_entries.values():
+            entry.delete(0, tk.END)
+        self.update_display()
+
+    def display_search_results(self, results, algorithm, exec_ms, details=None):
+        extra = f"\n\n{details}" if details else ""
+        if results:
+            self.update_treeview(results)
+            messagebox.showinfo("Hasil Pencarian", 
+                              f"✅ {algorithm}\n"
+                              f"📊 Ditemukan {len(results)} data\n"
+                              f"⏱ Waktu eksekusi: {exec_ms:.3f} ms{extra}")
+        else:
+            messagebox.showinfo("Hasil Pencarian", f"🔍 Data tidak ditemukan!{extra}")
+
+    def do_bubble_sort(self):
+        self.perform_sort('bubble')
+
+    def do_selection_sort(self):
+        self.perform_sort('selection')
+
+    def do_insertion_sort(self):
+        self.perform_sort('insertion')
+
+    def do_quick_sort(self):
+        self.perform_sort('quick')
+
+    def do_timsort(self):
+        self.perform_sort('timsort')
+
+    def do_radix_sort(self):
+        self.perform_sort('radix')
+
+    def perform_sort(self, algorithm):
+        try:
+            field = self.sort_field_var.get()
+            ascending = self.sort_order_var.get() == 'asc'
+            
+            if not self.data_manager.get_all_mahasiswa():
+                messagebox.showwarning("Peringatan", "⚠ Tidak ada data untuk diurutkan!")
+                return
+
+            if algorithm == 'bubble':
+                self.data_manager.bubble_sort(field, ascending)
+                algo_name = "Bubble Sort"
+            elif algorithm == 'selection':
+                self.data_manager.selection_sort(field, ascending)
+                algo_name = "Selection Sort"
+            elif algorithm == 'insertion':
+                self.data_manager.insertion_sort(field, ascending)
+                algo_name = "Insertion Sort"
+            elif algorithm == 'quick':
+                self.data_manager.quick_sort(field, ascending)
+                algo_name = "Quick Sort"
+            elif algorithm == 'timsort':
+                keys = [(field, ascending)]
+                field2 = self.sort_field2_var.get()
+                if field2 and field2 != field:
+                    keys.append((field2, self.sort_order2_var.get() == 'asc'))
+                self.data_manager.sort_by(keys)
+                algo_name = "Timsort"
+            elif algorithm == 'radix':
+                self.data_manager.radix_sort(field, ascending)
+                algo_name = self.data_manager.get_sort_history()[-1]['algorithm']
+            else:
+                return
+
+            exec_time = self.data_manager.get_sort_history()[-1]['elapsed_ms']
+            
+            self.view_field = None
+            self.current_page = 0
+            self.update_display()
+            self.sort_results_var.set(f"{algo_name} selesai dalam {exec_time:.3f} ms")
+            self.show_toast(f"✅ Data berhasil diurutkan dengan {algo_name}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Terjadi kesalahan: {str(e)}")
+
+    def do_sorted_view(self):
+        try:
+            field = self.sort_field_var.get()
+            ascending = self.sort_order_var.get() == 'asc'
+            
+            self.data_manager.get_sorted_page(field, ascending, 0, self.PAGE_SIZE)
+            exec_time = self.data_manager.get_monitor().last_ms('sort.view_page')
+            
+            self.view_field = field
+            self.view_ascending = ascending
+            self.current_page = 0
+            self.update_display()
+            order = 'asc' if ascending else 'desc'
+            self.sort_results_var.set(f"Sorted view {field} {order} siap dalam {exec_time:.3f} ms")
+        except ValidationError as e:
+            messagebox.showerror("Validasi Error", f"❌ {str(e)}")
+
+    def reset_view(self):
+        self.view_field = None
+        self.current_page = 0
+        self.update_display()
+
+    def prev_page(self):
+        if self.current_page > 0:
+            self.current_page -= 1
+            self.update_display()
+
+    def next_page(self):
+        self.current_page += 1
+        self.update_display()
+
+    def save_data(self):
+        try:
+            self.data_manager.save_to_file()
+            self.show_toast("✅ Data berhasil disimpan!")
+        except FileOperationError as e:
+            messagebox.showerror("Error", f"❌ {str(e)}")
+
+    def load_data(self):
+        try:
+            if self.load_with_progress():
+                self.update_display()
+                self.show_toast("✅ Data berhasil dimuat!")
+            else:
+                messagebox.showinfo("Info", "📄 File data tidak ditemukan.")
+        except FileOperationError as e:
+            messagebox.showerror("Error", f"❌ {str(e)}")
+
+    def import_data(self):
+        """Import CSV massal; ringkasan throughput & baris yang ditolak ditampilkan"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+
+        def progress(rows):
+            self.status_var.set(f"📥 Import: {rows:,} baris diproses...")
+            self.root.update_idletasks()
+
+        try:
+            self.root.config(cursor='watch')
+            report = self.data_manager.import_from_csv(filename, progress=progress)
+        except FileOperationError as e:
+            messagebox.showerror("Error", f"❌ {str(e)}")
+            return
+        finally:
+            self.root.config(cursor='')
+
+        self.update_display()
+        summary = (f"✅ {report['applied']:,} dari {report['total']:,} baris diimport\n"
+                   f"⏱ {report['elapsed_s']:.2f} detik ({report['rows_per_sec']:,.0f} baris/detik, "
+                   f"{report['workers']} proses)")
+        if report['errors']:
+            details = "\n".join(f"Baris {error['row']} ({error['nim']}): {error['error']}"
+                                for error in report['errors'][:10])
+            more = len(report['errors']) - 10
+            if more > 0:
+                details += f"\n... dan {more:,} baris lainnya"
+            messagebox.showwarning("Import Selesai",
+                                   f"{summary}\n\n⚠ {report['rejected']:,} baris ditolak:\n{details}")
+        else:
+            messagebox.showinfo("Import Selesai", summary)
+
+    def export_data(self):
+        """Export streaming (CSV/JSON Lines/JSON, .gz/.xz); bisa hanya hasil pencarian aktif"""
+        records = None
+        if self.search_results and messagebox.askyesno(
+                "Export", f"Export hanya hasil pencarian ({len(self.search_results):,} data)?"):
+            records = self.search_results
+        try:
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("JSON Lines", "*.jsonl"), ("JSON", "*.json"),
+                           ("Gzip", "*.csv.gz *.jsonl.gz *.json.gz"),
+                           ("XZ", "*.csv.xz *.jsonl.xz *.json.xz"), ("All files", "*.*")]
+            )
+            if filename:
+                def progress(done, total):
+                    suffix = f"/{total:,}" if total else ""
+                    self.status_var.set(f"📤 Export: {done:,}{suffix} data...")
+                    self.root.update_idletasks()
+
+                count = self.data_manager.export(filename, records=records, progress=progress)
+                self.status_var.set(f"📊 Jumlah data: {self.data_manager.get_count()}")
+                self.show_toast(f"✅ {count:,} data berhasil diexport ke {filename}")
+        except FileOperationError as e:
+            messagebox.showerror("Error", f"❌ {str(e)}")
+
+    def reset_data(self):
+        if messagebox.askyesno("Konfirmasi", "⚠ Apakah Anda yakin ingin mereset semua data?"):
+            self.data_manager.shutdown()
+            self.data_manager = DataMahasiswaManager()
+            try:
+                # Tulis snapshot kosong sekaligus mengosongkan journal
+                self.data_manager.save_to_file()
+            except FileOperationError as e:
+                messagebox.showerror("Error", f"❌ {str(e)}")
+            self.update_display()
+            self.clear_fields()
+            self.show_toast("✅ Semua data telah direset!")
+
+    def first_mahasiswa(self):
+        self.data_manager.set_current_index(0)
+        self.display_current_mahasiswa()
+
+    def last_mahasiswa(self):
+        count = self.data_manager.get_count()
+        if count > 0:
+            self.data_manager.set_current_index(count - 1)
+            self.display_current_mahasiswa()
+
+    def show_search_dialog(self):
+        """Dialog untuk pencarian langsung"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Cari Data")
+        dialog.geometry("400x150")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        ttk.Label(dialog, text="Masukkan NIM atau Nama:").pack(pady=10)
+        
+        search_entry = ttk.Entry(dialog, width=40)
+        search_entry.pack(pady=5)
+        search_entry.focus()
+        
+        def do_search():
+            keyword = search_entry.get().strip()
+            if keyword:
+                results = self.data_manager.linear_search(keyword, 'nama')
+                if results:
+                    self.update_treeview(results)
+                    dialog.destroy()
+                    self.show_toast(f"✅ Ditemukan {len(results)} data")
+                else:
+                    messagebox.showinfo("Hasil", "Data tidak ditemukan")
+        
+        ttk.Button(dialog, text="Cari", command=do_search).pack(pady=10)
+        search_entry.bind('<Return>', lambda e: do_search())
+
+    def update_performance(self):
+        """Mengisi ulang tab Performance dari PerformanceMonitor"""
+        monitor = self.data_manager.get_monitor()
+        for item in self.perf_tree.get_children():
+            self.perf_tree.delete(item)
+        
+        for row in monitor.snapshot():
+            self.perf_tree.insert('', 'end', values=(
+                row['operation'], row['count'], row['errors'],
+                f"{row['mean_ms']:.3f}", f"{row['p50_ms']:.3f}", f"{row['p95_ms']:.3f}",
+                f"{row['p99_ms']:.3f}", f"{row['max_ms']:.3f}", f"{row['total_ms']:.1f}"
+            ))
+        
+        lines = []
+        for timestamp, name, elapsed_ns, failed in reversed(monitor.get_recent(50)):
+            waktu = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+            status = " ❌" if failed else ""
+            lines.append(f"{waktu}  {name:<20} {elapsed_ns / 1e6:>10.3f} ms{status}")
+        self.perf_recent_text.delete(1.0, tk.END)
+        self.perf_recent_text.insert(1.0, "\n".join(lines))
+
+    def reset_performance(self):
+        self.data_manager.get_monitor().reset()
+        self.update_performance()
+
+    def on_tab_changed(self):
+        """Tab Performance/Statistics hanya dihitung ulang saat ditampilkan"""
+        self.update_performance()
+        if self.leaderboard_stale and self.notebook.select() == str(self.stats_tab):
+            self.update_leaderboard()
+
+    def refresh_statistics_tab(self):
+        self.update_statistics()
+        self.update_leaderboard()
+
+    def update_leaderboard(self):
+        """Mengisi ulang leaderboard dari top_k"""
+        self.leaderboard_stale = False
+        for item in self.board_tree.get_children():
+            self.board_tree.delete(item)
+        
+        jurusan_list = list(self.data_manager.get_statistics().get('jurusan_distribution', {}))
+        self.board_jurusan_combo.configure(values=[''] + jurusan_list)
+        
+        try:
+            k = int(self.board_k_var.get())
+        except ValueError:
+            k = 10
+        jurusan = self.board_jurusan_var.get()
+        filters = {'jurusan': jurusan} if jurusan else None
+        ascending = self.board_order_var.get() == 'asc'
+        
+        for rank, mhs in enumerate(self.data_manager.top_k('ipk', k, ascending, filters), 1):
+            self.board_tree.insert('', 'end', values=(
+                rank, mhs.nim, mhs.nama, mhs.jurusan, f"{mhs.ipk:.2f}"
+            ))
+
+    def update_statistics(self):
+        stats = self.data_manager.get_statistics()
+        if not stats:
+            self.stats_text.delete(1.0, tk.END)
+            self.stats_text.insert(1.0, "Tidak ada data yang dapat dianalisis.")
+            return
+        
+        stats_text = f"""
+{'='*60}
+{'STATISTIK DATA MAHASISWA':^60}
+{'='*60}
+
+📊 JUMLAH DATA:
+• Total Mahasiswa  : {stats['total']}
+• Operasi Sorting  : {stats.get('total_sort_operations', 0)}
+
+📈 STATISTIK IPK:
+• Rata-rata IPK    : {stats['avg_ipk']:.2f}
+• IPK Tertinggi    : {stats['max_ipk']:.2f}
+• IPK Terendah     : {stats['min_ipk']:.2f}
+
+🎓 DISTRIBUSI JURUSAN:
+"""
+        for jurusan, count in stats['jurusan_distribution'].items():
+            percentage = (count / stats['total']) * 100
+            avg = stats['jurusan_avg_ipk'][jurusan]
+            stats_text += f"• {jurusan:<25} : {count:>3} ({percentage:.1f}%) | IPK {avg:.2f}\n"
+        
+        cache = self.data_manager.get_cache_stats()
+        stats_text += f"""
+⚡ CACHE PENCARIAN:
+• Hit / Miss       : {cache['hits']} / {cache['misses']} ({cache['hit_rate']*100:.1f}% hit)
+• Eviction         : {cache['evictions']}
+• Entri            : {cache['entries']} ({cache['size']}/{cache['capacity']} record)
+"""
+        
+        stats_text += f"\n{'='*60}\n"
+        stats_text += f"Diperbarui: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(1.0, stats_text)
+
+    # ==================== HELPER METHODS ====================
+    def update_display(self):
+        """Update tampilan data di treeview"""
+        self.search_results = None
+        # Clear existing items
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        
+        # Insert data halaman aktif (urutan array atau sorted view)
+        count = self.data_manager.get_count()
+        total_pages = max(1, math.ceil(count / self.PAGE_SIZE))
+        self.current_page = min(self.current_page, total_pages - 1)
+        if self.view_field:
+            data = self.data_manager.get_sorted_page(self.view_field, self.view_ascending,
+                                                     self.current_page, self.PAGE_SIZE)
+        else:
+            data = self.data_manager.get_page(self.current_page, self.PAGE_SIZE)
+        
+        offset = self.current_page * self.PAGE_SIZE
+        for i, mhs in enumerate(data, offset + 1):
+            status = "Lulus" if mhs.ipk >= 2.0 else "Belum"
+            self.tree.insert('', 'end', iid=mhs.nim, values=(
+                i, mhs.nim, mhs.nama, mhs.jurusan, f"{mhs.ipk:.2f}", status
+            ))
+        
+        view = f"{self.view_field} {'asc' if self.view_ascending else 'desc'}" if self.view_field else "urutan asli"
+        self.page_var.set(f"Hal {self.current_page + 1}/{total_pages} ({view})")
+        
+        # Update statistics
+        if count > 0:
+            avg_ipk = self.data_manager.get_average_ipk()
+            self.status_var.set(f"📊 Jumlah data: {count} | 📈 IPK Rata-rata: {avg_ipk:.2f} | 💾 Auto-save aktif")
+        else:
+            self.status_var.set(f"📊 Jumlah data: {count} | 💾 Auto-save aktif")
+        
+        # Update position
+        current_idx = self.data_manager.get_current_index()
+        total = count
+        self.position_var.set(f"Posisi: {current_idx + 1 if total > 0 else 0}/{total}")
+        
+        # Update statistics tab (leaderboard top-K menunggu tab dibuka)
+        self.update_statistics()
+        self.leaderboard_stale = True
+
+    def update_treeview(self, data_list):
+        """Update treeview dengan data tertentu"""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        
+        for i, mhs in enumerate(data_list, 1):
+            status = "Lulus" if mhs.ipk >= 2.0 else "Belum"
+            self.tree.insert('', 'end', iid=mhs.nim, values=(
+                i, mhs.nim, mhs.nama, mhs.jurusan, f"{mhs.ipk:.2f}", status
+            ))
+        
+        self.search_results = data_list  # Bisa diexport lewat tombol Export
+        self.status_var.set(f"📊 Menampilkan {len(data_list)} data dari pencarian")
+
+    def get_selected_nim(self):
+        """NIM dari baris terpilih (iid treeview = NIM)"""
+        selection = self.tree.selection()
+        return selection[0] if selection else None
+
+    def clear_fields(self):
+        """Clear semua field input"""
+        for field, widget in self.entries.items():
+            try:
+                if isinstance(widget, ttk.Entry):
+                    widget.delete(0, tk.END)
+                elif isinstance(widget, ttk.Combobox):
+                    widget.set("Teknik Informatika")
+            except:
+                pass
+
+    def prev_mahasiswa(self):
+        """Navigate ke data sebelumnya"""
+        index = self.data_manager.prev()
+        self.display_current_mahasiswa(index)
+
+    def next_mahasiswa(self):
+        """Navigate ke data berikutnya"""
+        index = self.data_manager.next()
+        self.display_current_mahasiswa(index)
+
+    def display_current_mahasiswa(self, index=None):
+        """Display data mahasiswa saat ini ke form"""
+        if index is None:
+            index = self.data_manager.get_current_index()
+        
+        mhs = self.data_manager.get_current()
+        if mhs:
+            try:
+                self.entries['nim'].delete(0, tk.END)
+                self.entries['nim'].insert(0, mhs.nim)
+                self.entries['nama'].delete(0, tk.END)
+                self.entries['nama'].insert(0, mhs.nama)
+                self.entries['jurusan'].set(mhs.jurusan)
+                self.entries['email'].delete(0, tk.END)
+                self.entries['email'].insert(0, mhs.email)
+                self.entries['telepon'].delete(0, tk.END)
+                self.entries['telepon'].insert(0, mhs.telepon)
+                self.entries['ipk'].delete(0, tk.END)
+                self.entries['ipk'].insert(0, f"{mhs.ipk:.2f}")
+            except Exception as e:
+                print(f"Error displaying data: {e}")
+
+        total = self.data_manager.get_count()
+        self.position_var.set(f"Posisi: {index + 1 if total > 0 else 0}/{total}")
+
+    def on_tree_select(self, event):
+        """Handle treeview selection"""
+        nim = self.get_selected_nim()
+        if nim and self.data_manager.select_by_nim(nim) is not None:
+            # Posisi diambil dari nomor baris tampilan, bukan scan array utama
+            values = self.tree.item(nim, 'values')
+            self.display_current_mahasiswa(int(values[0]) - 1 if values else None)
+
+    def on_tree_double_click(self, event):
+        """Handle treeview double click"""
+        self.show_details()
+
+    def exit_app(self):
+        """Exit application"""
+        if messagebox.askyesno("Konfirmasi", "🚪 Apakah Anda yakin ingin keluar?"):
+            self.data_manager.shutdown()
+            try:
+                self.data_manager.save_to_file()
+            except:
+                pass
+            self.root.quit()
+
+# ============================== MAIN FUNCTION ==============================
+def main():
+    root = tk.Tk()
+    
+    # Set icon if exists
+    try:
+        root.iconbitmap('icon.ico')
+    except:
+        pass
+    
+    app = MahasiswaApp(root)
+    
+    # Center window on screen
+    root.update_idletasks()
+    width = root.winfo_width() or 1200
+    height = root.winfo_height() or 800
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f'{width}x{height}+{x}+{y}')
+    
+    # Handle window close event
+    root.protocol("WM_DELETE_WINDOW", app.exit_app)
+    
+    # Bind keyboard shortcuts
+    root.bind('<Control-s>', lambda e: app.save_data())
+    root.bind('<Control-f>', lambda e: app.show_search_dialog())
+    root.bind('<Control-n>', lambda e: app.clear_fields())
+    root.bind('<Escape>', lambda e: root.focus())
+    
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Import CSV paralel"""
+
+import csv
+import multiprocessing
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .exceptions import FileOperationError
+from .model import Mahasiswa
+
+
+# ============================== CSV IMPORT ==============================
+CSV_COLUMN_ALIASES = {
+    'nim': 'nim', 'nama': 'nama', 'jurusan': 'jurusan', 'email': 'email',
+    'telepon': 'telepon', 'ipk': 'ipk',
+    'created at': 'created_at', 'created_at': 'created_at',
+    'updated at': 'updated_at', 'updated_at': 'updated_at'
+}
+CSV_DEFAULT_COLUMNS = ['nim', 'nama', 'jurusan', 'email', 'telepon', 'ipk', 'created_at', 'updated_at']
+
+
+def parse_csv_chunk(rows, columns):
+    """Dijalankan di proses worker: (nomor baris, nilai) -> (list (baris, Mahasiswa) valid, list error)"""
+    records, errors = [], []
+    for line, values in rows:
+        data = {column: value.strip() for column, value in zip(columns, values) if column}
+        nim = data.get('nim', '')
+        try:
+            data['ipk'] = float(data.get('ipk') or 0.0)
+        except ValueError:
+            errors.append({'row': line, 'nim': nim, 'error': "IPK harus berupa angka!"})
+            continue
+        for field in ('created_at', 'updated_at'):
+            if not data.get(field):
+                data.pop(field, None)
+        mahasiswa = Mahasiswa.from_dict(data)
+        message = mahasiswa.validate()
+        if message is None:
+            records.append((line, mahasiswa))
+        else:
+            errors.append({'row': line, 'nim': nim, 'error': message})
+    return records, errors
+
+
+class CSVImporter:
+    """Import CSV bertahap: baris dibaca per chunk, validasi & konstruksi Mahasiswa
+    dibagi ke ProcessPoolExecutor, hasil digabung sesuai urutan file lalu
+    dimasukkan ke manager dengan satu kali add_many."""
+    CHUNK_SIZE = 5000
+    PARALLEL_MIN_BYTES = 1 << 20  # File kecil diproses di proses ini (biaya start worker > manfaat)
+
+    def __init__(self, manager, workers=None, chunk_size=CHUNK_SIZE, progress=None):
+        self._manager = manager
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._progress = progress  # callback(jumlah baris selesai diproses)
+
+    @staticmethod
+    def _columns(header):
+        """Nama kolom dari header; None jika baris pertama ternyata data"""
+        names = [value.strip().lower() for value in header]
+        if 'nim' not in names:
+            return None
+        return [CSV_COLUMN_ALIASES.get(name) for name in names]
+
+    def _chunks(self, reader, first_row):
+        chunk = [first_row] if first_row else []
+        for values in reader:
+            if not values:
+                continue  # Baris kosong
+            chunk.append((reader.line_num, values))
+            if len(chunk) >= self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self, filename, strict=False):
+        """Menjalankan import; mengembalikan laporan add_many + throughput"""
+        start = time.perf_counter()
+        records, lines, errors = [], [], []
+        processed = 0
+
+        def collect(result):
+            nonlocal processed
+            valid, rejected = result
+            for line, mahasiswa in valid:
+                lines.append(line)
+                records.append(mahasiswa)
+            errors.extend(rejected)
+            processed += len(valid) + len(rejected)
+            if self._progress is not None:
+                self._progress(processed)
+
+        try:
+            workers = self._workers if os.path.getsize(filename) >= self.PARALLEL_MIN_BYTES else 1
+            with open(filename, 'r', newline='', encoding='utf-8-sig') as file:
+                reader = csv.reader(file)
+                header = next(reader, [])
+                columns = self._columns(header)
+                first_row = None
+                if columns is None:
+                    columns, first_row = CSV_DEFAULT_COLUMNS, (reader.line_num, header)
+                chunks = self._chunks(reader, first_row if header else None)
+
+                if workers > 1:
+                    # spawn: aman walau proses utama punya thread (autosave worker)
+                    context = multiprocessing.get_context('spawn')
+                    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                        pending = deque()
+                        for chunk in chunks:
+                            pending.append(pool.submit(parse_csv_chunk, chunk, columns))
+                            # Batasi chunk yang sedang diproses agar memori tetap terbatas
+                            if len(pending) >= workers * 2:
+                                collect(pending.popleft().result())
+                        while pending:
+                            collect(pending.popleft().result())
+                else:
+                    for chunk in chunks:
+                        collect(parse_csv_chunk(chunk, columns))
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            raise FileOperationError(f"Gagal import CSV: {str(e)}")
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            # Worker mati (mis. kehabisan memori) atau data tidak bisa dikirim antarproses
+            raise FileOperationError(f"Gagal import CSV: proses worker gagal ({str(e)}); "
+                                     f"coba lagi dengan workers=1")
+
+        if strict and errors:
+            report = {'applied': 0, 'errors': []}
+        else:
+            report = self._manager.add_many(records, strict=strict, validate=False)
+        # Index baris laporan add_many -> nomor baris di file CSV
+        for error in report['errors']:
+            error['row'] = lines[error['row']]
+        all_errors = sorted(errors + report['errors'], key=lambda error: error['row'])
+        elapsed = time.perf_counter() - start
+        return {
+            'total': processed,
+            'applied': report['applied'],
+            'rejected': len(all_errors),
+            'errors': all_errors,
+            'workers': workers,
+            'elapsed_s': elapsed,
+            'rows_per_sec': processed / elapsed if elapsed > 0 else 0.0
+        }
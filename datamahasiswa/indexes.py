@@ -0,0 +1,132 @@
+"""Index pencarian trigram dan sorted view"""
+
+from bisect import bisect_left, insort
+from operator import itemgetter
+
+
+# ============================== TRIGRAM INDEX ==============================
+class TrigramIndex:
+    """Inverted index trigram untuk pencarian substring pada field teks"""
+    N = 3
+
+    def __init__(self, fields=('nama', 'email', 'jurusan')):
+        self._fields = tuple(fields)
+        self._postings = {field: {} for field in self._fields}  # field -> trigram -> set NIM
+        self._values = {field: {} for field in self._fields}    # field -> NIM -> nilai lowercase
+
+    @classmethod
+    def trigrams(cls, text):
+        """Memecah teks menjadi himpunan trigram"""
+        return {text[i:i + cls.N] for i in range(len(text) - cls.N + 1)}
+
+    def has_field(self, field):
+        return field in self._postings
+
+    def add(self, mahasiswa):
+        """Menambahkan satu record ke index"""
+        for field in self._fields:
+            value = str(getattr(mahasiswa, field, '')).lower()
+            self._values[field][mahasiswa.nim] = value
+            postings = self._postings[field]
+            for gram in self.trigrams(value):
+                postings.setdefault(gram, set()).add(mahasiswa.nim)
+
+    def remove(self, mahasiswa, nim=None):
+        """Menghapus satu record dari index.
+        nim: NIM saat record didaftarkan (default mahasiswa.nim)"""
+        nim = mahasiswa.nim if nim is None else nim
+        for field in self._fields:
+            value = self._values[field].pop(nim, None)
+            if value is None:
+                continue
+            postings = self._postings[field]
+            for gram in self.trigrams(value):
+                nims = postings.get(gram)
+                if nims is not None:
+                    nims.discard(nim)
+                    if not nims:
+                        del postings[gram]
+
+    def build(self, data):
+        """Membangun ulang index dari seluruh data"""
+        self._postings = {field: {} for field in self._fields}
+        self._values = {field: {} for field in self._fields}
+        for mhs in data:
+            self.add(mhs)
+
+    def estimate(self, field, keyword):
+        """Perkiraan jumlah kandidat (ukuran posting list terkecil)"""
+        grams = self.trigrams(keyword.lower())
+        if not grams:
+            return len(self._values[field])
+        postings = self._postings[field]
+        return min(len(postings.get(gram, ())) for gram in grams)
+
+    def search(self, field, keyword):
+        """Mengembalikan himpunan NIM yang field-nya mengandung keyword"""
+        keyword = keyword.lower()
+        values = self._values[field]
+        grams = self.trigrams(keyword)
+        if grams:
+            # Irisan posting list, mulai dari yang paling kecil
+            postings = self._postings[field]
+            lists = sorted((postings.get(gram, set()) for gram in grams), key=len)
+            candidates = set(lists[0])
+            for nims in lists[1:]:
+                if not candidates:
+                    break
+                candidates &= nims
+        else:
+            # Keyword lebih pendek dari trigram: scan nilai yang sudah di-lowercase
+            candidates = values.keys()
+        # Verifikasi akhir (trigram hanya menyaring kandidat)
+        return {nim for nim in candidates if keyword in values[nim]}
+
+# ============================== SORTED VIEW ==============================
+class SortedView:
+    """Permutasi terurut (nilai field, NIM) yang dijaga inkremental dengan bisect.
+    Satu view melayani urutan ascending maupun descending; nilai seri selalu
+    berurutan NIM ascending (sama dengan ORDER BY field, nim di backend SQLite)."""
+    def __init__(self, field, data):
+        self.field = field
+        # NIM -> nilai field saat didaftarkan, agar remove tetap tepat walau objeknya diubah langsung
+        self._values = {mhs.nim: getattr(mhs, field) for mhs in data}
+        self._entries = sorted((value, nim) for nim, value in self._values.items())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, mahasiswa):
+        value = getattr(mahasiswa, self.field)
+        self._values[mahasiswa.nim] = value
+        insort(self._entries, (value, mahasiswa.nim))
+
+    def remove(self, mahasiswa, nim=None):
+        """nim: NIM saat record didaftarkan (default mahasiswa.nim)"""
+        nim = mahasiswa.nim if nim is None else nim
+        if nim not in self._values:
+            return
+        entry = (self._values.pop(nim), nim)
+        pos = bisect_left(self._entries, entry)
+        if pos < len(self._entries) and self._entries[pos] == entry:
+            del self._entries[pos]
+
+    def nims(self, ascending=True, start=0, stop=None):
+        """NIM pada posisi [start, stop) dari urutan yang diminta"""
+        total = len(self._entries)
+        stop = total if stop is None else min(stop, total)
+        if start >= stop:
+            return []
+        entries = self._entries
+        if ascending:
+            return [nim for _, nim in entries[start:stop]]
+        # Segmen terbalik diperluas ke batas grup nilai seri di kedua ujung, lalu diurut
+        # nilai descending secara stabil sehingga NIM dalam satu grup tetap ascending
+        low, high = total - stop, total - start
+        while low > 0 and entries[low - 1][0] == entries[low][0]:
+            low -= 1
+        while high < total and entries[high][0] == entries[high - 1][0]:
+            high += 1
+        segment = sorted(entries[low:high], key=itemgetter(0), reverse=True)
+        skip = start - (total - high)
+        return [nim for _, nim in segment[skip:skip + stop - start]]
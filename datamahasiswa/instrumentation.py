@@ -0,0 +1,135 @@
+"""Pengukuran latensi operasi"""
+
+import functools
+import math
+import threading
+import time
+from collections import deque
+
+
+# ============================== INSTRUMENTATION ==============================
+class LatencyHistogram:
+    """Histogram latensi (ns) dengan bucket logaritmik: 4 sub-bucket per pangkat 2"""
+    BUCKET_COUNT = 200  # Cukup untuk ~2^51 ns
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @staticmethod
+    def bucket_of(ns):
+        if ns < 4:
+            return max(ns, 0)
+        bits = ns.bit_length()
+        sub = (ns >> (bits - 3)) & 0b11
+        return (bits - 2) * 4 + sub
+
+    @staticmethod
+    def bucket_upper(index):
+        """Batas atas (ns) sebuah bucket"""
+        if index < 4:
+            return index
+        bits, sub = index // 4 + 2, index % 4
+        lower = (4 | sub) << (bits - 3)
+        return lower + (1 << (bits - 3)) - 1
+
+    def record(self, ns):
+        self.counts[min(self.bucket_of(ns), self.BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total_ns += ns
+        self.max_ns = max(self.max_ns, ns)
+
+    def percentile(self, pct):
+        """Perkiraan persentil (ns), galat maksimal ~25% dari nilai sebenarnya"""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(self.bucket_upper(index), self.max_ns)
+        return self.max_ns
+
+
+class PerformanceMonitor:
+    """Pusat instrumentasi: counter, histogram latensi dan ring buffer per operasi"""
+    def __init__(self, recent_size=256):
+        self._histograms = {}
+        self._errors = {}
+        self._last_ns = {}
+        self._counters = {}
+        self._recent = deque(maxlen=recent_size)  # (waktu, operasi, ns, gagal)
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ns, failed=False):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(elapsed_ns)
+            self._last_ns[name] = elapsed_ns
+            if failed:
+                self._errors[name] = self._errors.get(name, 0) + 1
+            self._recent.append((time.time(), name, elapsed_ns, failed))
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def last_ms(self, name):
+        """Latensi terakhir sebuah operasi (ms)"""
+        return self._last_ns.get(name, 0) / 1e6
+
+    def get_counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+    def get_recent(self, limit=50):
+        with self._lock:
+            return list(self._recent)[-limit:]
+
+    def snapshot(self):
+        """Ringkasan per operasi: count, error, mean, p50/p95/p99, max (ms)"""
+        with self._lock:
+            rows = []
+            for name, histogram in sorted(self._histograms.items()):
+                rows.append({
+                    'operation': name,
+                    'count': histogram.count,
+                    'errors': self._errors.get(name, 0),
+                    'mean_ms': histogram.total_ns / histogram.count / 1e6,
+                    'p50_ms': histogram.percentile(50) / 1e6,
+                    'p95_ms': histogram.percentile(95) / 1e6,
+                    'p99_ms': histogram.percentile(99) / 1e6,
+                    'max_ms': histogram.max_ns / 1e6,
+                    'total_ms': histogram.total_ns / 1e6
+                })
+            return rows
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._last_ns.clear()
+            self._counters.clear()
+            self._recent.clear()
+
+
+def instrumented(name):
+    """Dekorator method manager: mencatat latensi ke self._monitor"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter_ns()
+            failed = True
+            try:
+                result = func(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._monitor.record(name, time.perf_counter_ns() - start, failed)
+        return wrapper
+    return decorator
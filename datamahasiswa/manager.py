@@ -0,0 +1,1140 @@
+"""Manajer data mahasiswa berbasis file JSON/biner"""
+
+import heapq
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+from datetime import datetime
+from operator import attrgetter, gt, lt
+
+from .base import DataOperations, check_batch, batch_report
+from .exceptions import ValidationError, FileOperationError
+from .indexes import TrigramIndex, SortedView
+from .instrumentation import PerformanceMonitor, instrumented
+from .model import Mahasiswa, RegexPatterns
+from .persistence import AutosaveWorker, OperationJournal
+from .storage import write_snapshot, read_snapshot, export_records
+
+
+# ============================== CLASS MANAJER DATA ==============================
+class DataMahasiswaManager(DataOperations):
+    """Kelas untuk mengelola data mahasiswa dengan array dan pointer"""
+    SORT_HISTORY_LIMIT = 100
+    JOURNAL_COMPACT_ENTRIES = 1000  # Kompaksi journal ke snapshot setelah sekian operasi
+
+    def __init__(self, filename="data_mahasiswa.json", use_journal=True):
+        self._data_mahasiswa = []  # Array untuk menyimpan data
+        self._current_index = 0     # Pointer untuk navigasi
+        self._current_nim = None    # Data aktif dipilih lewat NIM; posisinya dihitung saat perlu
+        self._filename = filename
+        self._autosave = True
+        self._journal = OperationJournal(filename + '.journal') if use_journal else None
+        self._lock = threading.RLock()  # Menjaga mutasi vs snapshot autosave
+        self._sort_history = deque(maxlen=self.SORT_HISTORY_LIMIT)
+        self._sort_count = 0
+        self._monitor = PerformanceMonitor()
+        self._save_lock = threading.Lock()
+        self._saver = AutosaveWorker(self._autosave_job)
+        self._nim_index = {}        # Hash index NIM -> objek Mahasiswa
+        self._nim_sorted = []       # Array NIM terurut untuk binary search
+        self._trigram_index = None  # Index trigram opsional (dibangun saat dibutuhkan)
+        self._sorted_views = {}     # field -> SortedView (dibangun saat dibutuhkan)
+        self._jurusan_index = {}    # Hash index jurusan -> set NIM
+        self._indexed_values = {}   # NIM -> (jurusan, ipk) saat didaftarkan ke index
+        self._ipk_sum = 0.0         # Agregat statistik yang dijaga inkremental
+        self._ipk_sorted = []       # Multiset IPK terurut (min/max)
+        self._jurusan_ipk_sum = {}
+        self._last_search_plan = []
+        self._generation = 0        # Naik setiap kali data/urutan berubah
+        self._saved_generation = 0  # Generasi terakhir yang sudah tersimpan ke file
+        self._last_save = None      # Info penyimpanan terakhir (waktu & durasi)
+        self._cache = OrderedDict() # LRU cache hasil pencarian & sorted view
+        self._cache_capacity = 250000  # Batas total record di semua hasil cache (bukan jumlah entri)
+        self._cache_items = 0          # Total record yang sedang disimpan cache
+        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    # ============ INDEX ============
+    def _index_add(self, mahasiswa):
+        """Mendaftarkan mahasiswa ke index NIM"""
+        self._nim_index[mahasiswa.nim] = mahasiswa
+        self._indexed_values[mahasiswa.nim] = (mahasiswa.jurusan, mahasiswa.ipk)
+        insort(self._nim_sorted, mahasiswa.nim)
+        self._jurusan_index.setdefault(mahasiswa.jurusan, set()).add(mahasiswa.nim)
+        self._ipk_sum += mahasiswa.ipk
+        insort(self._ipk_sorted, mahasiswa.ipk)
+        self._jurusan_ipk_sum[mahasiswa.jurusan] = \
+            self._jurusan_ipk_sum.get(mahasiswa.jurusan, 0.0) + mahasiswa.ipk
+        if self._trigram_index is not None:
+            self._trigram_index.add(mahasiswa)
+        for view in self._sorted_views.values():
+            view.add(mahasiswa)
+
+    def _indexed_nim(self, mahasiswa):
+        """NIM tempat objek terdaftar di index, None jika tidak terdaftar.
+        Bisa berbeda dari mahasiswa.nim bila NIM diubah langsung lewat setter (cari O(n))."""
+        if self._nim_index.get(mahasiswa.nim) is mahasiswa:
+            return mahasiswa.nim
+        for nim, mhs in self._nim_index.items():
+            if mhs is mahasiswa:
+                return nim
+        return None
+
+    def _index_remove(self, mahasiswa):
+        """Menghapus mahasiswa dari index NIM memakai nilai yang tercatat saat didaftarkan
+        (bukan nilai objek sekarang yang mungkin sudah diubah lewat setter).
+        Mengembalikan NIM yang dihapus dari index, None jika objek tidak terdaftar."""
+        nim = self._indexed_nim(mahasiswa)
+        if nim is None:
+            return None
+        del self._nim_index[nim]
+        jurusan, ipk = self._indexed_values.pop(nim)
+        pos = bisect_left(self._nim_sorted, nim)
+        if pos < len(self._nim_sorted) and self._nim_sorted[pos] == nim:
+            del self._nim_sorted[pos]
+        nims = self._jurusan_index.get(jurusan)
+        if nims is not None:
+            nims.discard(nim)
+            if not nims:
+                del self._jurusan_index[jurusan]
+                self._jurusan_ipk_sum.pop(jurusan, None)
+            else:
+                self._jurusan_ipk_sum[jurusan] -= ipk
+        pos = bisect_left(self._ipk_sorted, ipk)
+        if pos < len(self._ipk_sorted) and self._ipk_sorted[pos] == ipk:
+            del self._ipk_sorted[pos]
+        # Reset ke 0 saat kosong agar galat floating point tidak menumpuk
+        self._ipk_sum = self._ipk_sum - ipk if self._nim_index else 0.0
+        if self._trigram_index is not None:
+            self._trigram_index.remove(mahasiswa, nim)
+        for view in self._sorted_views.values():
+            view.remove(mahasiswa, nim)
+        return nim
+
+    def _rebuild_index(self):
+        """Membangun ulang index dari array utama"""
+        self._nim_index = {mhs.nim: mhs for mhs in self._data_mahasiswa}
+        self._nim_sorted = sorted(self._nim_index)
+        self._indexed_values = {mhs.nim: (mhs.jurusan, mhs.ipk) for mhs in self._data_mahasiswa}
+        self._jurusan_index = {}
+        jurusan_ipk = {}
+        for mhs in self._data_mahasiswa:
+            self._jurusan_index.setdefault(mhs.jurusan, set()).add(mhs.nim)
+            jurusan_ipk.setdefault(mhs.jurusan, []).append(mhs.ipk)
+        self._jurusan_ipk_sum = {jurusan: math.fsum(values) for jurusan, values in jurusan_ipk.items()}
+        self._ipk_sorted = sorted(mhs.ipk for mhs in self._data_mahasiswa)
+        self._ipk_sum = math.fsum(self._ipk_sorted)
+        if self._trigram_index is not None:
+            self._trigram_index.build(self._data_mahasiswa)
+        self._sorted_views = {}
+
+    def enable_trigram_index(self, fields=('nama', 'email', 'jurusan')):
+        """Mengaktifkan index trigram untuk field teks"""
+        self._trigram_index = TrigramIndex(fields)
+        self._trigram_index.build(self._data_mahasiswa)
+
+    def disable_trigram_index(self):
+        self._trigram_index = None
+
+    # ============ CACHE ============
+    def _bump_generation(self):
+        """Menandai data berubah sehingga semua entri cache menjadi basi"""
+        self._generation += 1
+
+    def _cache_get(self, key):
+        """Mengambil entri cache yang masih satu generasi, None jika miss"""
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == self._generation:
+            self._cache.move_to_end(key)
+            self._cache_stats['hits'] += 1
+            return entry[1]
+        self._cache_stats['misses'] += 1
+        return None
+
+    def _cache_put(self, key, value, size):
+        """Menyimpan hasil berisi size record; entri LRU dibuang sampai total record
+        kembali di bawah kapasitas (hasil kosong tetap dihitung 1)"""
+        size = max(1, size)
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cache_items -= old[2]
+        if size > self._cache_capacity:
+            return  # Lebih besar dari seluruh cache: tidak disimpan
+        self._cache[key] = (self._generation, value, size)
+        self._cache_items += size
+        while self._cache_items > self._cache_capacity:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_items -= evicted[2]
+            self._cache_stats['evictions'] += 1
+
+    def clear_cache(self):
+        self._cache.clear()
+        self._cache_items = 0
+
+    def is_dirty(self):
+        """True jika ada perubahan yang belum tersimpan ke file utama"""
+        return self._generation != self._saved_generation
+
+    def get_cache_stats(self):
+        """Statistik hit/miss/eviction cache"""
+        lookups = self._cache_stats['hits'] + self._cache_stats['misses']
+        return {
+            **self._cache_stats,
+            'entries': len(self._cache),
+            'size': self._cache_items,
+            'capacity': self._cache_capacity,
+            'hit_rate': (self._cache_stats['hits'] / lookups) if lookups else 0.0,
+            'generation': self._generation
+        }
+
+    # CRUD dasar
+    @instrumented('crud.add')
+    def add_mahasiswa(self, mahasiswa: Mahasiswa):
+        """Menambahkan mahasiswa baru ke array"""
+        with self._lock:
+            # Cek duplikasi NIM lewat hash index (O(1))
+            if mahasiswa.nim in self._nim_index:
+                raise ValidationError(f"NIM {mahasiswa.nim} sudah terdaftar!")
+            
+            self._data_mahasiswa.append(mahasiswa)
+            self._index_add(mahasiswa)
+            self._bump_generation()
+            self._persist('add', mahasiswa.nim, mahasiswa)
+
+    @instrumented('crud.edit')
+    def edit_mahasiswa(self, index, mahasiswa: Mahasiswa):
+        with self._lock:
+            if 0 <= index < len(self._data_mahasiswa):
+                old = self._data_mahasiswa[index]
+                # Cek duplikasi NIM dengan data lain
+                existing = self._nim_index.get(mahasiswa.nim)
+                if existing is not None and existing is not old:
+                    raise ValidationError(f"NIM {mahasiswa.nim} sudah terdaftar!")
+                
+                # NIM lama diambil dari index: objek lama bisa sudah diubah lewat setter
+                old_nim = self._index_remove(old) or old.nim
+                if self._current_nim == old_nim:
+                    self._current_nim = mahasiswa.nim
+                self._data_mahasiswa[index] = mahasiswa
+                self._index_add(mahasiswa)
+                self._bump_generation()
+                self._persist('edit', old_nim, mahasiswa)
+                return True
+            return False
+
+    def edit_by_nim(self, nim, mahasiswa: Mahasiswa):
+        """Mengubah data mahasiswa berdasarkan NIM lama"""
+        return self.edit_mahasiswa(self.get_index_by_nim(nim), mahasiswa)
+
+    @instrumented('crud.delete')
+    def delete_mahasiswa(self, index):
+        with self._lock:
+            if 0 <= index < len(self._data_mahasiswa):
+                deleted = self._data_mahasiswa.pop(index)
+                deleted_nim = self._index_remove(deleted) or deleted.nim
+                self._bump_generation()
+                # adjust pointer if needed
+                if self._current_index >= len(self._data_mahasiswa):
+                    self._current_index = max(0, len(self._data_mahasiswa) - 1)
+                self._persist('delete', deleted_nim)
+                return deleted
+            return None
+
+    def get_mahasiswa(self, index):
+        if 0 <= index < len(self._data_mahasiswa):
+            return self._data_mahasiswa[index]
+        return None
+
+    def delete_by_nim(self, nim):
+        """Menghapus mahasiswa berdasarkan NIM"""
+        return self.delete_mahasiswa(self.get_index_by_nim(nim))
+
+    # Operasi batch: validasi seluruh batch, satu update index, satu kali persistensi
+    BATCH_REBUILD_THRESHOLD = 64  # Di atas ukuran ini index dibangun ulang sekali saja
+
+    @instrumented('crud.add_many')
+    def add_many(self, records, strict=False, validate=True):
+        """Menambahkan banyak mahasiswa sekaligus. Baris tidak valid dilaporkan per baris;
+        strict=True membatalkan seluruh batch jika ada satu saja yang gagal."""
+        records = list(records)
+        with self._lock:
+            valid, errors = check_batch(records, self._nim_index.__contains__, validate=validate)
+            if not valid or (strict and errors):
+                return batch_report(len(records), 0, errors)
+
+            added = [mhs for _, mhs in valid]
+            self._data_mahasiswa.extend(added)
+            if len(added) > self.BATCH_REBUILD_THRESHOLD:
+                self._rebuild_index()
+            else:
+                for mhs in added:
+                    self._index_add(mhs)
+            self._bump_generation()
+            self._persist_many([('add', mhs.nim, mhs) for mhs in added])
+        return batch_report(len(records), len(added), errors)
+
+    @instrumented('crud.upsert_many')
+    def upsert_many(self, records, strict=False):
+        """Menambah atau mengganti (berdasarkan NIM, posisi tetap) banyak mahasiswa sekaligus"""
+        records = list(records)
+        with self._lock:
+            valid, errors = check_batch(records, self._nim_index.__contains__, upsert=True)
+            if not valid or (strict and errors):
+                return batch_report(len(records), 0, errors)
+
+            replaced = {mhs.nim: mhs for _, mhs in valid if mhs.nim in self._nim_index}
+            added = [mhs for _, mhs in valid if mhs.nim not in replaced]
+            if replaced:
+                # Dicocokkan lewat identitas objek lama: NIM-nya bisa sudah diubah lewat setter
+                by_old = {id(self._nim_index[nim]): mhs for nim, mhs in replaced.items()}
+                self._data_mahasiswa = [by_old.get(id(mhs), mhs) for mhs in self._data_mahasiswa]
+            self._data_mahasiswa.extend(added)
+            if len(valid) > self.BATCH_REBUILD_THRESHOLD:
+                self._rebuild_index()
+            else:
+                for mhs in replaced.values():
+                    self._index_remove(self._nim_index[mhs.nim])
+                    self._index_add(mhs)
+                for mhs in added:
+                    self._index_add(mhs)
+            self._bump_generation()
+            self._persist_many([('edit' if mhs.nim in replaced else 'add', mhs.nim, mhs)
+                                for _, mhs in valid])
+        return batch_report(len(records), len(valid), errors)
+
+    @instrumented('crud.delete_many')
+    def delete_many(self, nims, strict=False):
+        """Menghapus banyak mahasiswa berdasarkan NIM dalam satu kali lintasan array"""
+        nims = [str(nim) for nim in nims]
+        with self._lock:
+            targets, errors = set(), []
+            for row, nim in enumerate(nims):
+                if nim in targets:
+                    errors.append({'row': row, 'nim': nim, 'error': f"NIM {nim} ganda dalam batch!"})
+                elif nim not in self._nim_index:
+                    errors.append({'row': row, 'nim': nim, 'error': f"NIM {nim} tidak ditemukan!"})
+                else:
+                    targets.add(nim)
+            if not targets or (strict and errors):
+                return batch_report(len(nims), 0, errors)
+
+            doomed = {id(self._nim_index[nim]) for nim in targets}
+            if len(targets) > self.BATCH_REBUILD_THRESHOLD:
+                self._data_mahasiswa = [mhs for mhs in self._data_mahasiswa if id(mhs) not in doomed]
+                self._rebuild_index()
+            else:
+                for nim in targets:
+                    self._index_remove(self._nim_index[nim])
+                self._data_mahasiswa = [mhs for mhs in self._data_mahasiswa if id(mhs) not in doomed]
+            if self._current_index >= len(self._data_mahasiswa):
+                self._current_index = max(0, len(self._data_mahasiswa) - 1)
+            self._bump_generation()
+            self._persist_many([('delete', nim, None) for nim in nims if nim in targets])
+        return batch_report(len(nims), len(targets), errors)
+
+    @instrumented('crud.get_by_nim')
+    def get_by_nim(self, nim):
+        """Mengambil mahasiswa berdasarkan NIM dalam O(1)"""
+        return self._nim_index.get(str(nim))
+
+    def get_index_by_nim(self, nim):
+        """Posisi mahasiswa di array utama, -1 jika tidak ada.
+        NIM yang tidak ada dijawab O(1) lewat hash index; posisi butuh scan O(n)
+        (list.index, perbandingan identitas di C), jadi hanya dipakai bila posisi memang perlu."""
+        mhs = self.get_by_nim(nim)
+        if mhs is None:
+            return -1
+        try:
+            return self._data_mahasiswa.index(mhs)
+        except ValueError:
+            return -1
+
+    def select_by_nim(self, nim):
+        """Menjadikan mahasiswa ber-NIM ini data aktif dalam O(1), tanpa mencari posisinya"""
+        mhs = self.get_by_nim(nim)
+        if mhs is not None:
+            self._current_nim = mhs.nim
+        return mhs
+
+    def _resolve_current(self):
+        """Menghitung posisi data aktif yang dipilih lewat select_by_nim (sekali, saat navigasi)"""
+        if self._current_nim is not None:
+            index = self.get_index_by_nim(self._current_nim)
+            self._current_nim = None
+            if index >= 0:
+                self._current_index = index
+
+    def get_all_mahasiswa(self):
+        return self._data_mahasiswa.copy()
+
+    def get_page(self, page, page_size):
+        """Satu halaman data dalam urutan array utama"""
+        start = page * page_size
+        return self._data_mahasiswa[start:start + page_size]
+
+    def get_count(self):
+        return len(self._data_mahasiswa)
+
+    # pointer navigation
+    def next(self):
+        self._resolve_current()
+        if self._current_index < len(self._data_mahasiswa) - 1:
+            self._current_index += 1
+        return self._current_index
+
+    def prev(self):
+        self._resolve_current()
+        if self._current_index > 0:
+            self._current_index -= 1
+        return self._current_index
+
+    def get_current(self):
+        if self._current_nim is not None:
+            mhs = self._nim_index.get(self._current_nim)
+            if mhs is not None:
+                return mhs
+            self._current_nim = None  # Sudah dihapus: kembali ke pointer posisi
+        if self._data_mahasiswa and 0 <= self._current_index < len(self._data_mahasiswa):
+            return self._data_mahasiswa[self._current_index]
+        return None
+
+    def get_current_index(self):
+        self._resolve_current()
+        return self._current_index
+
+    def set_current_index(self, idx):
+        self._current_nim = None
+        if 0 <= idx < len(self._data_mahasiswa):
+            self._current_index = idx
+        elif self._data_mahasiswa:
+            self._current_index = 0
+        else:
+            self._current_index = -1
+
+    def display_data(self):
+        result = []
+        for i, mhs in enumerate(self._data_mahasiswa):
+            result.append(f"{i+1}. {mhs}")
+        return "\n".join(result)
+
+    # ============ SEARCH ============
+    @instrumented('search.linear')
+    def linear_search(self, keyword, field='nama'):
+        keyword = keyword.lower()
+        key = ('linear', field, keyword, None)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        results = []
+        for mhs in self._data_mahasiswa:
+            try:
+                value = str(getattr(mhs, field, '')).lower()
+                if keyword in value:
+                    results.append(mhs)
+            except AttributeError:
+                continue
+        self._cache_put(key, results, len(results))
+        return list(results)
+
+    @instrumented('search.binary')
+    def binary_search(self, nim):
+        """Binary search O(log n) pada array NIM terurut"""
+        nim = str(nim)
+        sorted_nims = self._nim_sorted
+        left, right = 0, len(sorted_nims) - 1
+        
+        while left <= right:
+            mid = (left + right) // 2
+            current_nim = sorted_nims[mid]
+            if current_nim == nim:
+                return self._nim_index[current_nim]
+            elif current_nim < nim:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return None
+
+    @instrumented('search.nim_prefix')
+    def search_by_nim_prefix(self, prefix):
+        """Range query berdasarkan awalan NIM (mis. angkatan), terurut NIM"""
+        prefix = str(prefix)
+        key = ('nim_prefix', 'nim', prefix, None)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        left = bisect_left(self._nim_sorted, prefix)
+        right = bisect_left(self._nim_sorted, prefix + '\uffff')
+        results = [self._nim_index[nim] for nim in self._nim_sorted[left:right]]
+        self._cache_put(key, results, len(results))
+        return list(results)
+
+    def count_by_nim_prefix(self, prefix):
+        """Menghitung jumlah mahasiswa dengan awalan NIM tertentu"""
+        prefix = str(prefix)
+        return (bisect_left(self._nim_sorted, prefix + '\uffff') -
+                bisect_left(self._nim_sorted, prefix))
+
+    @instrumented('search.trigram')
+    def trigram_search(self, keyword, field='nama'):
+        """Pencarian substring lewat index trigram, hasil terurut NIM"""
+        if self._trigram_index is None:
+            self.enable_trigram_index()
+        if not self._trigram_index.has_field(field):
+            return self.linear_search(keyword, field)
+        key = ('trigram', field, keyword.lower(), None)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        nims = self._trigram_index.search(field, keyword)
+        results = [self._nim_index[nim] for nim in sorted(nims)]
+        self._cache_put(key, results, len(results))
+        return list(results)
+
+    def sequential_search(self, keyword, field='nama'):
+        return self.linear_search(keyword, field)
+
+    # Biaya relatif per kandidat untuk tiap metode akses
+    PLAN_METHOD_COST = {'hash': 0, 'trigram': 1, 'scan': 2}
+
+    def plan_search(self, criteria):
+        """Menyusun rencana eksekusi: kriteria paling selektif dijalankan dulu"""
+        plan = []
+        total = len(self._data_mahasiswa)
+        for field, value in criteria.items():
+            if not value:
+                continue
+            keyword = str(value).lower()
+            if field == 'nim' and len(keyword) == 12:
+                # Substring 12 digit dari NIM 12 digit = exact match
+                method = 'hash'
+                estimate = 1 if keyword in self._nim_index else 0
+            elif field == 'jurusan':
+                # Jurusan berkardinalitas rendah: cocokkan nilai distinct lalu hash lookup
+                method = 'hash'
+                estimate = sum(len(nims) for jurusan, nims in self._jurusan_index.items()
+                               if keyword in jurusan.lower())
+            elif self._trigram_index is not None and self._trigram_index.has_field(field):
+                method = 'trigram'
+                estimate = self._trigram_index.estimate(field, keyword)
+            else:
+                method = 'scan'
+                estimate = total
+            plan.append({
+                'field': field,
+                'value': keyword,
+                'method': method,
+                'estimate': estimate,
+                'actual': None,
+                'time_ms': None
+            })
+        plan.sort(key=lambda step: (step['estimate'], self.PLAN_METHOD_COST[step['method']]))
+        return plan
+
+    def _lookup_step(self, step):
+        """Menjalankan langkah pertama rencana lewat index yang tersedia"""
+        field, keyword = step['field'], step['value']
+        if step['method'] == 'hash' and field == 'nim':
+            return {keyword} if keyword in self._nim_index else set()
+        if step['method'] == 'hash' and field == 'jurusan':
+            result = set()
+            for jurusan, nims in self._jurusan_index.items():
+                if keyword in jurusan.lower():
+                    result |= nims
+            return result
+        if step['method'] == 'trigram':
+            return self._trigram_index.search(field, keyword)
+        return {mhs.nim for mhs in self._data_mahasiswa
+                if keyword in str(getattr(mhs, field, '')).lower()}
+
+    @instrumented('search.multiple')
+    def search_by_multiple(self, criteria):
+        """Mencari dengan multiple criteria sesuai rencana eksekusi, hasil terurut NIM"""
+        key = ('multiple', None,
+               tuple(sorted((field, str(value).lower()) for field, value in criteria.items() if value)),
+               None)
+        cached = self._cache_get(key)
+        if cached is not None:
+            results, self._last_search_plan = cached
+            return list(results)
+
+        plan = self.plan_search(criteria)
+        self._last_search_plan = plan
+        if not plan:
+            return self._data_mahasiswa.copy()
+
+        candidates = None
+        for step in plan:
+            start = time.perf_counter_ns()
+            if candidates is None:
+                candidates = self._lookup_step(step)
+            else:
+                # Langkah berikutnya hanya memfilter kandidat yang tersisa
+                field, keyword = step['field'], step['value']
+                candidates = {nim for nim in candidates
+                              if keyword in str(getattr(self._nim_index[nim], field, '')).lower()}
+            step['time_ms'] = (time.perf_counter_ns() - start) / 1e6
+            step['actual'] = len(candidates)
+            if not candidates:
+                break  # Short-circuit: langkah sisanya tidak perlu dijalankan
+        results = [self._nim_index[nim] for nim in sorted(candidates)]
+        self._cache_put(key, (results, plan), len(results))
+        return list(results)
+
+    def get_last_search_plan(self):
+        """Rencana eksekusi search_by_multiple terakhir beserta waktunya"""
+        return [dict(step) for step in self._last_search_plan]
+
+    # ============ SORTING ============
+    def _extract_keys(self, field):
+        """Mengambil nilai field setiap record sekali saja (array kunci)"""
+        try:
+            return [getattr(mhs, field) for mhs in self._data_mahasiswa]
+        except AttributeError:
+            raise ValidationError(f"Field '{field}' tidak dapat diurutkan!")
+
+    @instrumented('sort.bubble')
+    def bubble_sort(self, field='nim', ascending=True):
+        # Seluruh sorting di bawah lock: autosave tidak boleh menyalin array yang setengah tertukar
+        with self._lock:
+            start = time.perf_counter()
+            data = self._data_mahasiswa
+            keys = self._extract_keys(field)
+            n = len(data)
+            for i in range(n-1):
+                swapped = False
+                for j in range(n-i-1):
+                    compare_result = (keys[j] > keys[j+1]) if ascending else (keys[j] < keys[j+1])
+                    if compare_result:
+                        keys[j], keys[j+1] = keys[j+1], keys[j]
+                        data[j], data[j+1] = data[j+1], data[j]
+                        swapped = True
+                if not swapped:
+                    break
+        
+            self._record_sort(field, ascending, 'Bubble Sort', start)
+
+    @instrumented('sort.selection')
+    def selection_sort(self, field='nim', ascending=True):
+        with self._lock:
+            start = time.perf_counter()
+            data = self._data_mahasiswa
+            keys = self._extract_keys(field)
+            n = len(data)
+            for i in range(n):
+                sel = i
+                for j in range(i+1, n):
+                    if ascending:
+                        if keys[j] < keys[sel]:
+                            sel = j
+                    else:
+                        if keys[j] > keys[sel]:
+                            sel = j
+                if sel != i:
+                    keys[i], keys[sel] = keys[sel], keys[i]
+                    data[i], data[sel] = data[sel], data[i]
+        
+            self._record_sort(field, ascending, 'Selection Sort', start)
+
+    @instrumented('sort.insertion')
+    def insertion_sort(self, field='nim', ascending=True):
+        with self._lock:
+            start = time.perf_counter()
+            data = self._data_mahasiswa
+            keys = self._extract_keys(field)
+            for i in range(1, len(data)):
+                key, item = keys[i], data[i]
+                j = i - 1
+                while j >= 0 and ((key < keys[j]) if ascending else (key > keys[j])):
+                    keys[j + 1] = keys[j]
+                    data[j + 1] = data[j]
+                    j -= 1
+                keys[j + 1] = key
+                data[j + 1] = item
+        
+            self._record_sort(field, ascending, 'Insertion Sort', start)
+
+    # Partisi sekecil ini diselesaikan dengan insertion sort
+    INTROSORT_THRESHOLD = 16
+
+    @instrumented('sort.quick')
+    def quick_sort(self, field='nim', ascending=True):
+        """Introsort in-place iteratif: quicksort median-of-three dengan partisi 3 arah,
+        heapsort jika rekursi terlalu dalam, insertion sort untuk partisi kecil"""
+        with self._lock:
+            start = time.perf_counter()
+            data = self._data_mahasiswa
+            keys = self._extract_keys(field)
+            before = lt if ascending else gt
+            n = len(data)
+            if n > 1:
+                # Stack eksplisit pengganti rekursi: (awal, akhir, sisa kedalaman)
+                stack = [(0, n - 1, 2 * int(math.log2(n)))]
+                while stack:
+                    lo, hi, depth = stack.pop()
+                    while hi - lo + 1 > self.INTROSORT_THRESHOLD:
+                        if depth == 0:
+                            self._heapsort_range(keys, data, lo, hi, before)
+                            lo = hi + 1
+                            break
+                        depth -= 1
+
+                        # Median-of-three: urutkan lo, mid, hi lalu pakai mid sebagai pivot
+                        mid = (lo + hi) // 2
+                        for a, b in ((lo, mid), (mid, hi), (lo, mid)):
+                            if before(keys[b], keys[a]):
+                                keys[a], keys[b] = keys[b], keys[a]
+                                data[a], data[b] = data[b], data[a]
+                        pivot = keys[mid]
+
+                        # Partisi 3 arah (< pivot | == pivot | > pivot) agar data kembar tetap O(n)
+                        left, i, right = lo, lo, hi
+                        while i <= right:
+                            if before(keys[i], pivot):
+                                keys[left], keys[i] = keys[i], keys[left]
+                                data[left], data[i] = data[i], data[left]
+                                left += 1
+                                i += 1
+                            elif before(pivot, keys[i]):
+                                keys[i], keys[right] = keys[right], keys[i]
+                                data[i], data[right] = data[right], data[i]
+                                right -= 1
+                            else:
+                                i += 1
+
+                        # Partisi besar masuk stack, partisi kecil diproses langsung
+                        if left - lo < hi - right:
+                            stack.append((right + 1, hi, depth))
+                            hi = left - 1
+                        else:
+                            stack.append((lo, left - 1, depth))
+                            lo = right + 1
+                    self._insertion_sort_range(keys, data, lo, hi, before)
+
+            self._record_sort(field, ascending, 'Quick Sort', start)
+
+    @staticmethod
+    def _insertion_sort_range(keys, data, lo, hi, before):
+        """Insertion sort pada rentang [lo, hi]"""
+        for i in range(lo + 1, hi + 1):
+            key, item = keys[i], data[i]
+            j = i - 1
+            while j >= lo and before(key, keys[j]):
+                keys[j + 1] = keys[j]
+                data[j + 1] = data[j]
+                j -= 1
+            keys[j + 1] = key
+            data[j + 1] = item
+
+    @staticmethod
+    def _heapsort_range(keys, data, lo, hi, before):
+        """Heapsort pada rentang [lo, hi] (fallback introsort)"""
+        def sift_down(root, end):
+            while True:
+                child = 2 * (root - lo) + 1 + lo
+                if child > end:
+                    return
+                if child + 1 <= end and before(keys[child], keys[child + 1]):
+                    child += 1
+                if not before(keys[root], keys[child]):
+                    return
+                keys[root], keys[child] = keys[child], keys[root]
+                data[root], data[child] = data[child], data[root]
+                root = child
+
+        for root in range(lo + (hi - lo - 1) // 2, lo - 1, -1):
+            sift_down(root, hi)
+        for end in range(hi, lo, -1):
+            keys[lo], keys[end] = keys[end], keys[lo]
+            data[lo], data[end] = data[end], data[lo]
+            sift_down(lo, end - 1)
+
+    # LSD radix sort NIM memakai basis 1000 (12 digit = 4 pass)
+    RADIX_BASE = 1000
+    RADIX_PASSES = 4
+
+    @instrumented('sort.radix')
+    def radix_sort(self, field='nim', ascending=True):
+        """Sorting linear: LSD radix untuk NIM, counting sort untuk IPK (resolusi 0.01),
+        fallback Timsort untuk field teks bebas"""
+        with self._lock:
+            start = time.perf_counter()
+            data = self._data_mahasiswa
+            keys = self._extract_keys(field)
+            order = None
+            algorithm = 'Radix Sort'
+
+            if field == 'nim':
+                nim_re = RegexPatterns.NIM_RE
+                if all(nim_re.match(key) for key in keys):
+                    values = [int(key) for key in keys]
+                    order = list(range(len(data)))
+                    divisor = 1
+                    for _ in range(self.RADIX_PASSES):
+                        buckets = [[] for _ in range(self.RADIX_BASE)]
+                        for i in order:
+                            buckets[(values[i] // divisor) % self.RADIX_BASE].append(i)
+                        if not ascending:
+                            buckets.reverse()
+                        order = [i for bucket in buckets for i in bucket]
+                        divisor *= self.RADIX_BASE
+            elif field == 'ipk':
+                scaled = [round(key * 100) for key in keys]
+                # Counting sort hanya valid jika IPK tepat 2 desimal dalam 0.00-4.00
+                if all(0 <= value <= 400 and abs(key * 100 - value) < 1e-6
+                       for key, value in zip(keys, scaled)):
+                    buckets = [[] for _ in range(401)]
+                    for i, value in enumerate(scaled):
+                        buckets[value].append(i)
+                    if not ascending:
+                        buckets.reverse()
+                    order = [i for bucket in buckets for i in bucket]
+                    algorithm = 'Counting Sort'
+
+            if order is None:
+                order = list(range(len(data)))
+                order.sort(key=keys.__getitem__, reverse=not ascending)
+                algorithm = 'Radix Sort (fallback Timsort)'
+
+            self._data_mahasiswa = [data[i] for i in order]
+            self._record_sort(field, ascending, algorithm, start)
+
+    @instrumented('sort.timsort')
+    def sort_by(self, keys):
+        """Sorting multi-kunci stabil dengan Timsort, mis. [('jurusan', True), ('ipk', False)]"""
+        with self._lock:
+            start = time.perf_counter()
+            keys = [(key, True) if isinstance(key, str) else tuple(key) for key in keys]
+            if not keys:
+                raise ValidationError("Minimal satu kunci sorting!")
+
+            data = self._data_mahasiswa
+            order = list(range(len(data)))
+            # Timsort stabil: urutkan dari kunci terakhir ke kunci utama
+            for field, ascending in reversed(keys):
+                column = self._extract_keys(field)
+                order.sort(key=column.__getitem__, reverse=not ascending)
+            self._data_mahasiswa = [data[i] for i in order]
+
+            description = ", ".join(f"{field} {'asc' if ascending else 'desc'}" for field, ascending in keys)
+            self._record_sort(description, keys[0][1], 'Timsort', start)
+
+    def _get_view(self, field):
+        """Mengambil (atau membangun sekali) sorted view untuk field"""
+        view = self._sorted_views.get(field)
+        if view is None:
+            try:
+                view = SortedView(field, self._data_mahasiswa)
+            except AttributeError:
+                raise ValidationError(f"Field '{field}' tidak dapat diurutkan!")
+            self._sorted_views[field] = view
+        return view
+
+    def get_sorted_view(self, field='nim', ascending=True):
+        """Data terurut tanpa mengubah array utama (materialized view)"""
+        return self.get_sorted_page(field, ascending, 0, None)
+
+    @instrumented('sort.view_page')
+    def get_sorted_page(self, field, ascending, page, page_size):
+        """Satu halaman dari sorted view; page_size None = seluruh data"""
+        view = self._get_view(field)
+        if page_size is None:
+            nims = view.nims(ascending)
+        else:
+            nims = view.nims(ascending, page * page_size, (page + 1) * page_size)
+        return [self._nim_index[nim] for nim in nims]
+
+    def _record_sort(self, field, ascending, algorithm, start=None):
+        """Mencatat riwayat sorting beserta waktu eksekusinya"""
+        self._bump_generation()  # Urutan array utama berubah
+        # Urutan hasil dicatat sebagai permutasi NIM (replay O(n) dan idempoten), lalu
+        # snapshot dijadwalkan agar daftar NIM penuh tidak lama tertinggal di journal
+        self._persist('order', None, [mhs.nim for mhs in self._data_mahasiswa])
+        if self._autosave and self._journal is not None:
+            self._autosave_to_file()
+        self._sort_history.append({
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'field': field,
+            'ascending': ascending,
+            'algorithm': algorithm,
+            'count': len(self._data_mahasiswa),
+            'elapsed_ms': (time.perf_counter() - start) * 1000 if start is not None else None
+        })
+        self._sort_count += 1
+
+    def get_sort_history(self):
+        return list(self._sort_history)
+
+    def get_monitor(self):
+        """PerformanceMonitor milik manager ini"""
+        return self._monitor
+
+    def get_performance_stats(self):
+        return self._monitor.snapshot()
+
+    # ============ STATISTICS ============
+    @instrumented('stats.top_k')
+    def top_k(self, field='ipk', k=10, ascending=False, filters=None):
+        """K mahasiswa teratas (ascending=False) atau terbawah berdasarkan field.
+        filters mis. {'jurusan': 'Hukum'}: jurusan dicocokkan persis lewat index jurusan,
+        field teks lain (substring) memakai planner search_by_multiple."""
+        if k <= 0:
+            return []
+        filters = {field: value for field, value in (filters or {}).items() if value}
+        jurusan = filters.pop('jurusan', None)
+        if filters:
+            candidates = self.search_by_multiple(filters)
+            if jurusan is not None:
+                candidates = [mhs for mhs in candidates if mhs.jurusan == jurusan]
+        elif jurusan is not None:
+            # Urut NIM agar nilai seri berurutan sama seperti hasil search_by_multiple
+            candidates = [self._nim_index[nim] for nim in sorted(self._jurusan_index.get(jurusan, ()))]
+        else:
+            view = self._sorted_views.get(field)
+            if view is not None:
+                # Sorted view sudah ada: cukup ambil k elemen pertama, O(k)
+                return [self._nim_index[nim] for nim in view.nims(ascending, 0, k)]
+            candidates = self._data_mahasiswa
+        try:
+            key = attrgetter(field)
+            select = heapq.nsmallest if ascending else heapq.nlargest
+            top = select(k, candidates, key=key)
+            if len(top) == k:
+                # Nilai seri di batas ke-k: ambil NIM terkecil agar sama dengan jalur sorted view
+                edge = key(top[-1])
+                top = [mhs for mhs in top if key(mhs) != edge]
+                ties = sorted((mhs for mhs in candidates if key(mhs) == edge), key=attrgetter('nim'))
+                top.extend(ties[:k - len(top)])
+        except AttributeError:
+            raise ValidationError(f"Field '{field}' tidak dapat diurutkan!")
+        # Nilai seri diurut NIM ascending, baik ascending maupun descending
+        top.sort(key=attrgetter('nim'))
+        top.sort(key=key, reverse=not ascending)
+        return top
+
+    @instrumented('stats.get')
+    def get_statistics(self):
+        """Statistik dari agregat inkremental (tanpa scan seluruh data)"""
+        total = len(self._data_mahasiswa)
+        if not total:
+            return {}
+        
+        return {
+            'total': total,
+            'avg_ipk': self._ipk_sum / total,
+            'max_ipk': self._ipk_sorted[-1],
+            'min_ipk': self._ipk_sorted[0],
+            'jurusan_distribution': {jurusan: len(nims) for jurusan, nims in self._jurusan_index.items()},
+            'jurusan_avg_ipk': {jurusan: self._jurusan_ipk_sum[jurusan] / len(nims)
+                                for jurusan, nims in self._jurusan_index.items()},
+            'total_sort_operations': self._sort_count
+        }
+
+    def get_average_ipk(self):
+        """Rata-rata IPK dalam O(1)"""
+        total = len(self._data_mahasiswa)
+        return self._ipk_sum / total if total else 0.0
+
+    # ============ FILE OPERATIONS ============
+    @instrumented('file.save')
+    def save_to_file(self, filename=None):
+        """Menulis snapshot (JSON, atau biner jika file .mhsb / sudah biner);
+        untuk file utama sekaligus mengompaksi journal"""
+        try:
+            start = time.perf_counter()
+            save_filename = filename or self._filename
+            is_main = save_filename == self._filename
+            
+            with self._save_lock:
+                # Snapshot data dan rotasi journal harus atomik terhadap mutasi
+                with self._lock:
+                    records = list(self._data_mahasiswa)
+                    generation = self._generation
+                    if is_main and self._journal is not None:
+                        self._journal.rotate()
+                write_snapshot(save_filename, records)
+                if is_main:
+                    if self._journal is not None:
+                        self._journal.discard_rotated()
+                    self._mark_saved(generation, start)
+            return True
+        except Exception as e:
+            raise FileOperationError(f"Gagal menyimpan file: {str(e)}")
+
+    def compact(self):
+        """Melipat journal ke snapshot baru"""
+        return self.save_to_file()
+
+    def _persist(self, op, nim, mahasiswa=None):
+        """Mencatat satu mutasi: append ke journal (O(1)) atau autosave snapshot penuh"""
+        self._persist_many([(op, nim, mahasiswa)])
+
+    def _persist_many(self, operations):
+        """Mencatat satu atau beberapa mutasi (op, nim, Mahasiswa/dict/None) dengan satu kali tulis"""
+        if not self._autosave:
+            return
+        if self._journal is None or len(operations) >= self.JOURNAL_COMPACT_ENTRIES:
+            # Batch besar langsung ditulis sebagai snapshot penuh, bukan ribuan baris journal
+            self._autosave_to_file()
+            return
+        # Sebelum operasi ini tersimpan penuh?
+        was_clean = self._saved_generation == self._generation - 1
+        try:
+            self._journal.append_many([(op, nim, mhs.to_dict() if isinstance(mhs, Mahasiswa) else mhs)
+                                       for op, nim, mhs in operations])
+        except OSError:
+            self._autosave_to_file()  # Journal tidak bisa ditulis: simpan snapshot penuh
+            return
+        if was_clean:
+            self._saved_generation = self._generation
+        if self._journal.entries >= self.JOURNAL_COMPACT_ENTRIES:
+            self._autosave_to_file()  # Kompaksi di thread worker
+
+    @staticmethod
+    def _apply_journal_entry(records, positions, entry):
+        """Menerapkan satu operasi add/edit/delete ke list records (idempoten).
+        positions: NIM -> posisi di records; edit diterapkan di posisi semula,
+        record yang dihapus menjadi None sampai list dipadatkan."""
+        op, nim, data = entry.get('op'), entry.get('nim'), entry.get('data')
+        if op in ('add', 'edit') and data:
+            mhs = Mahasiswa.from_dict(data, trusted=True)
+            index = positions.pop(nim, None) if op == 'edit' else None
+            existing = positions.get(mhs.nim)
+            if index is None:
+                index = existing
+            elif existing is not None and existing != index:
+                records[existing] = None
+            if index is None:
+                index = len(records)
+                records.append(mhs)
+            else:
+                records[index] = mhs
+            positions[mhs.nim] = index
+        elif op == 'delete':
+            index = positions.pop(nim, None)
+            if index is not None:
+                records[index] = None
+
+    @staticmethod
+    def _apply_journal_order(records, nims):
+        """Menyusun records sesuai permutasi NIM hasil sorting; record yang tidak
+        tercantum (ditambah setelahnya) tetap di belakang dengan urutan semula"""
+        by_nim = {mhs.nim: mhs for mhs in records if mhs is not None}
+        ordered = [by_nim.pop(nim) for nim in nims if nim in by_nim]
+        ordered.extend(mhs for mhs in records if mhs is not None and mhs.nim in by_nim)
+        return ordered
+
+    @classmethod
+    def _replay_journal(cls, records, journal):
+        """Replay journal di atas list snapshot sehingga isi dan urutan array sama dengan
+        sebelum crash; aman diulang di atas snapshot yang sudah memuat operasinya"""
+        positions = {mhs.nim: i for i, mhs in enumerate(records)}
+        for entry in journal.replay():
+            if entry.get('op') == 'order':
+                records = cls._apply_journal_order(records, entry.get('data') or [])
+                positions = {mhs.nim: i for i, mhs in enumerate(records)}
+            else:
+                cls._apply_journal_entry(records, positions, entry)
+        return [mhs for mhs in records if mhs is not None]
+
+    def _mark_saved(self, generation, start):
+        """Mencatat generasi yang tersimpan beserta waktu & durasi simpan"""
+        self._saved_generation = max(self._saved_generation, generation)
+        self._last_save = {
+            'saved_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'duration_ms': (time.perf_counter() - start) * 1000
+        }
+
+    def get_last_save_info(self):
+        """Waktu dan durasi penyimpanan terakhir, None jika belum pernah"""
+        return dict(self._last_save) if self._last_save else None
+
+    @instrumented('file.load')
+    def load_from_file(self, filename=None, progress=None):
+        """Memuat snapshot (JSON/biner) secara streaming lalu replay journal.
+        progress: callback(bytes_read, total_bytes) opsional untuk progress bar."""
+        try:
+            load_filename = filename or self._filename
+            journal = self._journal if load_filename == self._filename else None
+            has_journal = journal is not None and journal.exists()
+            if os.path.exists(load_filename) or has_journal:
+                records = {}
+                if os.path.exists(load_filename):
+                    for mhs in read_snapshot(load_filename, progress):
+                        # Lewati NIM ganda agar index tetap konsisten
+                        if mhs.nim not in records:
+                            records[mhs.nim] = mhs
+                
+                records = list(records.values())
+                with self._lock:
+                    # Replay journal di atas snapshot terakhir
+                    if has_journal:
+                        records = self._replay_journal(records, journal)
+                    self._data_mahasiswa = records
+                    self._rebuild_index()
+                    self._bump_generation()
+                    self._saved_generation = self._generation
+                    self._current_index = 0 if self._data_mahasiswa else -1
+                    self._current_nim = None
+                return True
+            return False
+        except json.JSONDecodeError:
+            raise FileOperationError("File data korup atau format tidak valid!")
+        except Exception as e:
+            raise FileOperationError(f"Gagal memuat file: {str(e)}")
+
+    def _autosave_to_file(self):
+        """Menjadwalkan autosave di thread worker (burst perubahan digabung)"""
+        self._saver.request()
+
+    def request_save(self):
+        """Menyimpan di thread worker hanya jika ada perubahan; True jika dijadwalkan"""
+        if not self.is_dirty():
+            return False
+        self._saver.request()
+        return True
+
+    @instrumented('file.autosave')
+    def _autosave_job(self):
+        self.save_to_file()
+
+    def flush_autosave(self, timeout=None):
+        """Menunggu autosave yang tertunda selesai ditulis"""
+        return self._saver.flush(timeout)
+
+    def pop_autosave_errors(self):
+        """Error autosave sejak pemanggilan terakhir (untuk ditampilkan GUI)"""
+        return self._saver.pop_errors()
+
+    def shutdown(self, timeout=5.0):
+        """Menyelesaikan autosave tertunda lalu menghentikan thread worker"""
+        self._saver.stop(flush=True, timeout=timeout)
+        if self._journal is not None:
+            self._journal.close()
+
+    @instrumented('file.import_csv')
+    def import_from_csv(self, filename, workers=None, strict=False, progress=None):
+        """Import CSV paralel (lihat CSVImporter); baris yang ditolak dilaporkan per baris"""
+        from .importer import CSVImporter
+        return CSVImporter(self, workers=workers, progress=progress).run(filename, strict)
+
+    @instrumented('file.export')
+    def export(self, filename, records=None, fields=None, fmt=None, compression=None, progress=None):
+        """Export streaming ke CSV/JSON Lines/JSON (format & kompresi .gz/.xz dari ekstensi).
+        records: subset yang diexport (mis. hasil pencarian), default seluruh data.
+        fields: proyeksi field, mis. ['nim', 'nama', 'ipk']. Mengembalikan jumlah record."""
+        if records is None:
+            with self._lock:
+                records = list(self._data_mahasiswa)
+        return export_records(filename, records, fields, fmt, compression, progress)
+
+    @instrumented('file.export_csv')
+    def export_to_csv(self, filename="data_mahasiswa.csv"):
+        """Export data ke CSV"""
+        self.export(filename, fmt='csv')
+        return True
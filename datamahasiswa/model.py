@@ -0,0 +1,210 @@
+"""Model Mahasiswa beserta pola validasi"""
+
+import functools
+import re
+import time
+from datetime import datetime
+
+from .exceptions import ValidationError
+
+
+# ============================== REGEX PATTERNS ==============================
+class RegexPatterns:
+    """Kelas untuk menyimpan pola regex"""
+    NIM_PATTERN = r'^[0-9]{12}$'  # 12 digit angka
+    NAME_PATTERN = r'^[A-Za-z\s.,-]{3,50}$'  # Huruf, spasi, titik, koma, strip
+    EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    PHONE_PATTERN = r'^08[0-9]{8,11}$'  # Nomor HP Indonesia
+
+    # Versi terkompilasi (dipakai setter agar pola tidak di-resolve ulang tiap validasi)
+    NIM_RE = re.compile(NIM_PATTERN)
+    NAME_RE = re.compile(NAME_PATTERN)
+    EMAIL_RE = re.compile(EMAIL_PATTERN)
+    PHONE_RE = re.compile(PHONE_PATTERN)
+
+# ============================== CLASS MAHASISWA ==============================
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(epoch):
+    """Epoch (detik) -> string waktu lokal; banyak record berbagi detik yang sama"""
+    return datetime.fromtimestamp(epoch).strftime(TIMESTAMP_FORMAT)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(value):
+    """String waktu dari file -> epoch int; string yang tidak dikenali disimpan apa adanya"""
+    try:
+        return int(datetime.strptime(value, TIMESTAMP_FORMAT).timestamp())
+    except (TypeError, ValueError):
+        return value
+
+
+class Mahasiswa:
+    """Kelas untuk merepresentasikan data mahasiswa"""
+    # Tanpa __dict__ per objek; timestamp disimpan sebagai epoch int dan baru diformat saat dibaca
+    __slots__ = ('_nim', '_nama', '_jurusan', '_email', '_telepon', '_ipk', '_created_ts', '_updated_ts')
+
+    def __init__(self, nim='', nama='', jurusan='', email='', telepon='', ipk=0.0):
+        self._nim = str(nim)
+        self._nama = str(nama)
+        self._jurusan = str(jurusan)
+        self._email = str(email)
+        self._telepon = str(telepon)
+        self._ipk = float(ipk)
+        self._created_ts = self._updated_ts = int(time.time())
+
+    # Getter methods
+    @property
+    def nim(self):
+        return self._nim
+
+    @property
+    def nama(self):
+        return self._nama
+
+    @property
+    def jurusan(self):
+        return self._jurusan
+
+    @property
+    def email(self):
+        return self._email
+
+    @property
+    def telepon(self):
+        return self._telepon
+
+    @property
+    def ipk(self):
+        return self._ipk
+
+    @property
+    def created_at(self):
+        value = self._created_ts
+        return value if isinstance(value, str) else format_timestamp(value)
+
+    @property
+    def updated_at(self):
+        value = self._updated_ts
+        return value if isinstance(value, str) else format_timestamp(value)
+
+    def _touch(self):
+        self._updated_ts = int(time.time())
+
+    # Setter methods dengan validasi
+    @nim.setter
+    def nim(self, value):
+        if RegexPatterns.NIM_RE.match(str(value)):
+            self._nim = str(value)
+            self._touch()
+        else:
+            raise ValidationError("NIM harus 12 digit angka!")
+
+    @nama.setter
+    def nama(self, value):
+        if RegexPatterns.NAME_RE.match(str(value)):
+            self._nama = str(value)
+            self._touch()
+        else:
+            raise ValidationError("Nama hanya boleh huruf, spasi, titik, koma, strip (3-50 karakter)!")
+
+    @jurusan.setter
+    def jurusan(self, value):
+        self._jurusan = str(value)
+        self._touch()
+
+    @email.setter
+    def email(self, value):
+        if value == "" or RegexPatterns.EMAIL_RE.match(value):
+            self._email = value
+            self._touch()
+        else:
+            raise ValidationError("Format email tidak valid!")
+
+    @telepon.setter
+    def telepon(self, value):
+        if value == "" or RegexPatterns.PHONE_RE.match(value):
+            self._telepon = value
+            self._touch()
+        else:
+            raise ValidationError("Nomor telepon harus dimulai dengan 08 dan 10-13 digit!")
+
+    @ipk.setter
+    def ipk(self, value):
+        try:
+            ipk_value = float(value)
+            if 0.0 <= ipk_value <= 4.0:
+                self._ipk = ipk_value
+                self._touch()
+            else:
+                raise ValidationError("IPK harus antara 0.0 - 4.0!")
+        except ValueError:
+            raise ValidationError("IPK harus berupa angka!")
+
+    def to_dict(self):
+        """Konversi objek ke dictionary"""
+        return {
+            'nim': self._nim,
+            'nama': self._nama,
+            'jurusan': self._jurusan,
+            'email': self._email,
+            'telepon': self._telepon,
+            'ipk': self._ipk,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+    @staticmethod
+    def _timestamp_value(value, default):
+        """Nilai timestamp dari file (string/epoch) untuk disimpan di slot"""
+        if value is None:
+            return default
+        if isinstance(value, int):
+            return value
+        return parse_timestamp(value)
+
+    @classmethod
+    def from_dict(cls, data, trusted=False):
+        """Membuat objek dari dictionary.
+        trusted=True untuk data milik sendiri (snapshot/journal/database) yang tipenya
+        sudah benar: slot diisi langsung tanpa konversi dan nilai default."""
+        if trusted:
+            mahasiswa = cls.__new__(cls)
+            mahasiswa._nim = data['nim']
+            mahasiswa._nama = data['nama']
+            mahasiswa._jurusan = data['jurusan']
+            mahasiswa._email = data['email']
+            mahasiswa._telepon = data['telepon']
+            mahasiswa._ipk = float(data['ipk'])
+        else:
+            mahasiswa = cls(
+                nim=data.get('nim', ''),
+                nama=data.get('nama', ''),
+                jurusan=data.get('jurusan', ''),
+                email=data.get('email', ''),
+                telepon=data.get('telepon', ''),
+                ipk=data.get('ipk', 0.0)
+            )
+        now = int(time.time())
+        mahasiswa._created_ts = cls._timestamp_value(data.get('created_at'), now)
+        mahasiswa._updated_ts = cls._timestamp_value(data.get('updated_at'), now)
+        return mahasiswa
+
+    def validate(self):
+        """Memeriksa seluruh field sekaligus; pesan error pertama atau None jika valid"""
+        if not RegexPatterns.NIM_RE.match(self._nim):
+            return "NIM harus 12 digit angka!"
+        if not RegexPatterns.NAME_RE.match(self._nama):
+            return "Nama hanya boleh huruf, spasi, titik, koma, strip (3-50 karakter)!"
+        if self._email and not RegexPatterns.EMAIL_RE.match(self._email):
+            return "Format email tidak valid!"
+        if self._telepon and not RegexPatterns.PHONE_RE.match(self._telepon):
+            return "Nomor telepon harus dimulai dengan 08 dan 10-13 digit!"
+        if not 0.0 <= self._ipk <= 4.0:
+            return "IPK harus antara 0.0 - 4.0!"
+        return None
+
+    def __str__(self):
+        return f"{self._nim} - {self._nama} - {self._jurusan} - IPK: {self._ipk:.2f}"
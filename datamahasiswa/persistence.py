@@ -0,0 +1,176 @@
+"""Autosave latar belakang dan journal operasi"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+# ============================== AUTOSAVE WORKER ==============================
+class AutosaveWorker:
+    """Satu thread penyimpan jangka panjang yang menggabungkan (debounce)
+    rentetan perubahan menjadi satu kali tulis"""
+    def __init__(self, save_func, delay=0.5, max_delay=5.0, name='autosave'):
+        self._save_func = save_func
+        self._delay = delay            # Jeda tanpa perubahan sebelum menulis
+        self._max_delay = max_delay    # Batas tunda saat perubahan terus berdatangan
+        self._name = name
+        self._condition = threading.Condition()
+        self._dirty = False
+        self._saving = False
+        self._stopped = False
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._thread = None
+        self._errors = deque(maxlen=20)
+        self.save_count = 0
+
+    def request(self):
+        """Menandai data kotor; penulisan dilakukan di thread worker"""
+        with self._condition:
+            now = time.monotonic()
+            if not self._dirty:
+                self._first_request = now
+            self._dirty = True
+            self._last_request = now
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._dirty and not self._stopped:
+                    self._condition.wait()
+                if not self._dirty:
+                    return
+                # Debounce: tunggu sampai burst perubahan reda
+                while not self._stopped:
+                    now = time.monotonic()
+                    deadline = min(self._last_request + self._delay,
+                                   self._first_request + self._max_delay)
+                    if now >= deadline:
+                        break
+                    self._condition.wait(deadline - now)
+                self._dirty = False
+                self._saving = True
+            try:
+                self._save_func()
+                self.save_count += 1
+            except Exception as e:
+                self._errors.append(e)
+            finally:
+                with self._condition:
+                    self._saving = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Menunggu sampai semua perubahan tertulis; False jika timeout"""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while (self._dirty or self._saving) and self._thread is not None:
+                if self._dirty:
+                    self._last_request = self._first_request = 0.0  # Tulis sekarang
+                    self._condition.notify_all()
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, flush=True, timeout=None):
+        if flush:
+            self.flush(timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def pop_errors(self):
+        """Mengambil dan mengosongkan daftar error penyimpanan"""
+        with self._condition:
+            errors = list(self._errors)
+            self._errors.clear()
+            return errors
+
+# ============================== OPERATION JOURNAL ==============================
+class OperationJournal:
+    """Write-ahead journal JSON Lines: satu baris per operasi add/edit/delete (berdasarkan NIM)
+    atau order (permutasi NIM setelah sorting).
+    Saat kompaksi, journal aktif dirotasi ke file .old sampai snapshot baru selesai ditulis."""
+    def __init__(self, filename):
+        self.filename = filename
+        self.rotated_filename = filename + '.old'
+        self._file = None
+        self._lock = threading.Lock()
+        self.entries = None  # Dihitung saat pertama dibuka
+
+    def _open(self):
+        if self._file is None:
+            if self.entries is None:
+                self.entries = sum(1 for _ in self._read_lines(self.filename))
+            self._file = open(self.filename, 'a', encoding='utf-8')
+
+    def append(self, op, nim, data=None):
+        """Menambahkan satu operasi ke akhir journal (O(1))"""
+        self.append_many([(op, nim, data)])
+
+    def append_many(self, operations):
+        """Menambahkan beberapa operasi dengan satu kali flush"""
+        lines = "".join(json.dumps({'op': op, 'nim': nim, 'data': data}, ensure_ascii=False) + "\n"
+                        for op, nim, data in operations)
+        with self._lock:
+            self._open()
+            self._file.write(lines)
+            self._file.flush()
+            self.entries += len(operations)
+
+    def rotate(self):
+        """Memindahkan journal aktif ke file .old (digabung jika .old masih ada)"""
+        with self._lock:
+            self.close()
+            if os.path.exists(self.filename):
+                if os.path.exists(self.rotated_filename):
+                    with open(self.filename, 'r', encoding='utf-8') as src, \
+                            open(self.rotated_filename, 'a', encoding='utf-8') as dst:
+                        dst.write(src.read())
+                    os.remove(self.filename)
+                else:
+                    os.replace(self.filename, self.rotated_filename)
+            self.entries = 0
+
+    def discard_rotated(self):
+        """Menghapus journal lama setelah snapshot baru tersimpan"""
+        if os.path.exists(self.rotated_filename):
+            os.remove(self.rotated_filename)
+
+    @staticmethod
+    def _read_lines(filename):
+        if not os.path.exists(filename):
+            return
+        with open(filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield line
+
+    def replay(self):
+        """Membaca semua operasi (journal lama lalu aktif) secara berurutan"""
+        with self._lock:
+            for filename in (self.rotated_filename, self.filename):
+                for line in self._read_lines(filename):
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Baris terakhir terpotong (crash saat menulis): abaikan
+                        continue
+
+    def exists(self):
+        return os.path.exists(self.filename) or os.path.exists(self.rotated_filename)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,622 @@
+"""Backend SQLite"""
+
+import os
+import sqlite3
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+
+from .base import DataOperations, check_batch, batch_report
+from .exceptions import ValidationError, FileOperationError
+from .instrumentation import PerformanceMonitor, instrumented
+from .manager import DataMahasiswaManager
+from .model import Mahasiswa
+from .persistence import OperationJournal
+from .storage import write_snapshot, read_snapshot, export_records
+
+
+# ============================== SQLITE BACKEND ==============================
+class SQLiteMahasiswaManager(DataOperations):
+    """Manager data mahasiswa berbasis tabel SQLite (API sama dengan DataMahasiswaManager).
+    Kolom urutan menyimpan posisi record pada 'array' sehingga akses per index,
+    pagination dan hasil sorting tetap berlaku tanpa memuat seluruh data ke RAM."""
+    SORT_HISTORY_LIMIT = 100
+    FIELDS = ('nim', 'nama', 'jurusan', 'email', 'telepon', 'ipk', 'created_at', 'updated_at')
+    TEXT_FIELDS = ('nama', 'email', 'jurusan')  # Field yang di backend JSON memakai index trigram
+    BATCH_SIZE = 5000  # Jumlah baris per executemany saat insert massal
+
+    def __init__(self, filename="data_mahasiswa.db"):
+        self._filename = filename
+        self._current_index = 0
+        self._sort_history = deque(maxlen=self.SORT_HISTORY_LIMIT)
+        self._sort_count = 0
+        self._monitor = PerformanceMonitor()
+        self._last_search_plan = []
+        self._last_save = None
+        try:
+            self._conn = sqlite3.connect(filename)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema()
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Gagal membuka database: {str(e)}")
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS mahasiswa (
+                    nim TEXT PRIMARY KEY,
+                    nama TEXT NOT NULL,
+                    jurusan TEXT NOT NULL DEFAULT '',
+                    email TEXT NOT NULL DEFAULT '',
+                    telepon TEXT NOT NULL DEFAULT '',
+                    ipk REAL NOT NULL DEFAULT 0,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    urutan INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_mahasiswa_jurusan ON mahasiswa(jurusan);
+                CREATE INDEX IF NOT EXISTS idx_mahasiswa_ipk ON mahasiswa(ipk);
+                CREATE INDEX IF NOT EXISTS idx_mahasiswa_nama ON mahasiswa(nama);
+                CREATE INDEX IF NOT EXISTS idx_mahasiswa_urutan ON mahasiswa(urutan);
+            """)
+
+    # ============ HELPER ============
+    def _check_field(self, field):
+        """Nama kolom disisipkan ke SQL, jadi wajib dari whitelist"""
+        if field not in self.FIELDS:
+            raise ValidationError(f"Field '{field}' tidak dapat diurutkan!")
+        return field
+
+    @staticmethod
+    def _to_row(mahasiswa, urutan):
+        return (mahasiswa.nim, mahasiswa.nama, mahasiswa.jurusan, mahasiswa.email,
+                mahasiswa.telepon, mahasiswa.ipk, mahasiswa.created_at, mahasiswa.updated_at, urutan)
+
+    @staticmethod
+    def _from_row(row):
+        return Mahasiswa.from_dict(dict(row), trusted=True)
+
+    def _query(self, sql, params=()):
+        return [self._from_row(row) for row in self._conn.execute(sql, params)]
+
+    @staticmethod
+    def _like_pattern(keyword):
+        """Pola LIKE substring dengan karakter wildcard di-escape"""
+        keyword = str(keyword).lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{keyword}%"
+
+    def _next_urutan(self):
+        return self._conn.execute("SELECT COALESCE(MAX(urutan), -1) + 1 FROM mahasiswa").fetchone()[0]
+
+    def _nim_at(self, index):
+        """NIM pada posisi index (urutan array), None jika di luar jangkauan"""
+        if index < 0:
+            return None
+        row = self._conn.execute("SELECT nim FROM mahasiswa ORDER BY urutan LIMIT 1 OFFSET ?",
+                                 (index,)).fetchone()
+        return row[0] if row else None
+
+    def is_dirty(self):
+        """Setiap mutasi langsung di-commit, jadi tidak pernah ada perubahan tertunda"""
+        return False
+
+    def get_cache_stats(self):
+        """Tidak ada cache hasil di level aplikasi (page cache dikelola SQLite)"""
+        return {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'size': 0, 'capacity': 0,
+                'hit_rate': 0.0, 'generation': 0}
+
+    # ============ CRUD ============
+    @instrumented('crud.add')
+    def add_mahasiswa(self, mahasiswa: Mahasiswa):
+        """Menambahkan mahasiswa baru di akhir urutan"""
+        try:
+            with self._conn:
+                self._conn.execute("INSERT INTO mahasiswa VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   self._to_row(mahasiswa, self._next_urutan()))
+        except sqlite3.IntegrityError:
+            raise ValidationError(f"NIM {mahasiswa.nim} sudah terdaftar!")
+
+    def _existing_nims(self, nims):
+        """Subset NIM yang sudah ada di tabel (query IN per potongan)"""
+        nims, found = list(nims), set()
+        for start in range(0, len(nims), 500):
+            chunk = nims[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            found.update(row[0] for row in self._conn.execute(
+                f"SELECT nim FROM mahasiswa WHERE nim IN ({placeholders})", chunk))
+        return found
+
+    def _insert_rows(self, records):
+        """Insert massal di akhir urutan dengan executemany per batch (di dalam transaksi)"""
+        urutan = self._next_urutan()
+        for start in range(0, len(records), self.BATCH_SIZE):
+            batch = records[start:start + self.BATCH_SIZE]
+            self._conn.executemany(
+                "INSERT INTO mahasiswa VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._to_row(mhs, urutan + start + i) for i, mhs in enumerate(batch)))
+
+    @instrumented('crud.add_many')
+    def add_many(self, records, strict=False, validate=True):
+        """Insert massal dalam satu transaksi, laporan error per baris seperti backend JSON"""
+        records = list(records)
+        existing = self._existing_nims(getattr(mhs, 'nim', None) for mhs in records)
+        valid, errors = check_batch(records, existing.__contains__, validate=validate)
+        if not valid or (strict and errors):
+            return batch_report(len(records), 0, errors)
+        with self._conn:
+            self._insert_rows([mhs for _, mhs in valid])
+        return batch_report(len(records), len(valid), errors)
+
+    @instrumented('crud.upsert_many')
+    def upsert_many(self, records, strict=False):
+        """Insert atau update berdasarkan NIM (posisi record lama tetap) dalam satu transaksi"""
+        records = list(records)
+        valid, errors = check_batch(records, None, upsert=True)
+        if not valid or (strict and errors):
+            return batch_report(len(records), 0, errors)
+        existing = self._existing_nims(mhs.nim for _, mhs in valid)
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE mahasiswa SET nama = ?, jurusan = ?, email = ?, telepon = ?, ipk = ?, "
+                "created_at = ?, updated_at = ? WHERE nim = ?",
+                (self._to_row(mhs, None)[1:-1] + (mhs.nim,) for _, mhs in valid if mhs.nim in existing))
+            self._insert_rows([mhs for _, mhs in valid if mhs.nim not in existing])
+        return batch_report(len(records), len(valid), errors)
+
+    @instrumented('crud.delete_many')
+    def delete_many(self, nims, strict=False):
+        """Menghapus banyak NIM dalam satu transaksi"""
+        nims = [str(nim) for nim in nims]
+        existing = self._existing_nims(set(nims))
+        targets, errors = set(), []
+        for row, nim in enumerate(nims):
+            if nim in targets:
+                errors.append({'row': row, 'nim': nim, 'error': f"NIM {nim} ganda dalam batch!"})
+            elif nim not in existing:
+                errors.append({'row': row, 'nim': nim, 'error': f"NIM {nim} tidak ditemukan!"})
+            else:
+                targets.add(nim)
+        if not targets or (strict and errors):
+            return batch_report(len(nims), 0, errors)
+        with self._conn:
+            self._conn.executemany("DELETE FROM mahasiswa WHERE nim = ?", ((nim,) for nim in targets))
+        count = self.get_count()
+        if self._current_index >= count:
+            self._current_index = max(0, count - 1)
+        return batch_report(len(nims), len(targets), errors)
+
+    @instrumented('crud.edit')
+    def edit_mahasiswa(self, index, mahasiswa: Mahasiswa):
+        nim = self._nim_at(index)
+        return self.edit_by_nim(nim, mahasiswa) if nim is not None else False
+
+    def edit_by_nim(self, nim, mahasiswa: Mahasiswa):
+        """Mengubah data mahasiswa berdasarkan NIM lama (posisi tetap)"""
+        try:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "UPDATE mahasiswa SET nim = ?, nama = ?, jurusan = ?, email = ?, telepon = ?, "
+                    "ipk = ?, created_at = ?, updated_at = ? WHERE nim = ?",
+                    self._to_row(mahasiswa, None)[:-1] + (str(nim),))
+        except sqlite3.IntegrityError:
+            raise ValidationError(f"NIM {mahasiswa.nim} sudah terdaftar!")
+        return cursor.rowcount > 0
+
+    @instrumented('crud.delete')
+    def delete_mahasiswa(self, index):
+        nim = self._nim_at(index)
+        return self.delete_by_nim(nim) if nim is not None else None
+
+    def delete_by_nim(self, nim):
+        """Menghapus mahasiswa berdasarkan NIM, mengembalikan data yang dihapus"""
+        deleted = self.get_by_nim(nim)
+        if deleted is None:
+            return None
+        with self._conn:
+            self._conn.execute("DELETE FROM mahasiswa WHERE nim = ?", (deleted.nim,))
+        count = self.get_count()
+        if self._current_index >= count:
+            self._current_index = max(0, count - 1)
+        return deleted
+
+    def get_mahasiswa(self, index):
+        if index < 0:
+            return None
+        rows = self._query("SELECT * FROM mahasiswa ORDER BY urutan LIMIT 1 OFFSET ?", (index,))
+        return rows[0] if rows else None
+
+    @instrumented('crud.get_by_nim')
+    def get_by_nim(self, nim):
+        """Lookup lewat primary key"""
+        rows = self._query("SELECT * FROM mahasiswa WHERE nim = ?", (str(nim),))
+        return rows[0] if rows else None
+
+    def get_index_by_nim(self, nim):
+        """Posisi mahasiswa di urutan array, -1 jika tidak ada"""
+        row = self._conn.execute("SELECT urutan FROM mahasiswa WHERE nim = ?", (str(nim),)).fetchone()
+        if row is None:
+            return -1
+        return self._conn.execute("SELECT COUNT(*) FROM mahasiswa WHERE urutan < ?",
+                                  (row[0],)).fetchone()[0]
+
+    def select_by_nim(self, nim):
+        """Menjadikan mahasiswa ber-NIM ini data aktif (lookup primary key + index urutan)"""
+        mhs = self.get_by_nim(nim)
+        if mhs is not None:
+            self._current_index = self.get_index_by_nim(mhs.nim)
+        return mhs
+
+    def get_all_mahasiswa(self):
+        return self._query("SELECT * FROM mahasiswa ORDER BY urutan")
+
+    def get_page(self, page, page_size):
+        """Satu halaman data dalam urutan array (LIMIT/OFFSET lewat index urutan)"""
+        return self._query("SELECT * FROM mahasiswa ORDER BY urutan LIMIT ? OFFSET ?",
+                           (page_size, page * page_size))
+
+    def get_count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM mahasiswa").fetchone()[0]
+
+    # pointer navigation
+    def next(self):
+        if self._current_index < self.get_count() - 1:
+            self._current_index += 1
+        return self._current_index
+
+    def prev(self):
+        if self._current_index > 0:
+            self._current_index -= 1
+        return self._current_index
+
+    def get_current(self):
+        return self.get_mahasiswa(self._current_index)
+
+    def get_current_index(self):
+        return self._current_index
+
+    def set_current_index(self, idx):
+        count = self.get_count()
+        if 0 <= idx < count:
+            self._current_index = idx
+        elif count:
+            self._current_index = 0
+        else:
+            self._current_index = -1
+
+    def display_data(self):
+        return "\n".join(f"{i+1}. {mhs}" for i, mhs in enumerate(self.get_all_mahasiswa()))
+
+    # ============ SEARCH ============
+    @instrumented('search.linear')
+    def linear_search(self, keyword, field='nama'):
+        """Substring case-insensitive, hasil dalam urutan array"""
+        field = self._check_field(field)
+        return self._query(f"SELECT * FROM mahasiswa WHERE lower({field}) LIKE ? ESCAPE '\\' "
+                           "ORDER BY urutan", (self._like_pattern(keyword),))
+
+    @instrumented('search.binary')
+    def binary_search(self, nim):
+        """Exact match NIM lewat B-tree primary key"""
+        return self.get_by_nim(nim)
+
+    @instrumented('search.nim_prefix')
+    def search_by_nim_prefix(self, prefix):
+        """Range scan primary key berdasarkan awalan NIM, terurut NIM"""
+        prefix = str(prefix)
+        return self._query("SELECT * FROM mahasiswa WHERE nim >= ? AND nim < ? ORDER BY nim",
+                           (prefix, prefix + '\uffff'))
+
+    def count_by_nim_prefix(self, prefix):
+        prefix = str(prefix)
+        return self._conn.execute("SELECT COUNT(*) FROM mahasiswa WHERE nim >= ? AND nim < ?",
+                                  (prefix, prefix + '\uffff')).fetchone()[0]
+
+    @instrumented('search.trigram')
+    def trigram_search(self, keyword, field='nama'):
+        """Tanpa index trigram: substring LIKE, hasil terurut NIM seperti backend JSON"""
+        if field not in self.TEXT_FIELDS:
+            return self.linear_search(keyword, field)
+        return self._query(f"SELECT * FROM mahasiswa WHERE lower({field}) LIKE ? ESCAPE '\\' "
+                           "ORDER BY nim", (self._like_pattern(keyword),))
+
+    def sequential_search(self, keyword, field='nama'):
+        return self.linear_search(keyword, field)
+
+    def enable_trigram_index(self):
+        """Tidak diperlukan: pencarian dikerjakan query planner SQLite"""
+
+    def disable_trigram_index(self):
+        pass
+
+    def _build_where(self, criteria):
+        clauses, params = [], []
+        for field, value in criteria.items():
+            if not value:
+                continue
+            field = self._check_field(field)
+            clauses.append(f"lower({field}) LIKE ? ESCAPE '\\'")
+            params.append(self._like_pattern(value))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @instrumented('search.multiple')
+    def search_by_multiple(self, criteria):
+        """Semua kriteria digabung dalam satu query, hasil terurut NIM.
+        Rencana eksekusi diambil dari EXPLAIN QUERY PLAN."""
+        where, params = self._build_where(criteria)
+        sql = f"SELECT * FROM mahasiswa{where} ORDER BY nim"
+        start = time.perf_counter_ns()
+        results = self._query(sql, params)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+        self._last_search_plan = [{
+            'field': 'sql',
+            'value': where.strip(),
+            'method': row['detail'],
+            'estimate': None,
+            'actual': len(results),
+            'time_ms': elapsed_ms
+        } for row in self._conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        return results
+
+    def get_last_search_plan(self):
+        return [dict(step) for step in self._last_search_plan]
+
+    # ============ SORTING ============
+    def _reorder(self, order_by):
+        """Menulis ulang kolom urutan sesuai ORDER BY (satu transaksi)"""
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS temp.urutan_baru")
+            self._conn.execute("CREATE TEMP TABLE urutan_baru (pos INTEGER PRIMARY KEY, nim TEXT UNIQUE)")
+            # rowid pos diberikan berurutan mengikuti ORDER BY
+            self._conn.execute(f"INSERT INTO urutan_baru (nim) SELECT nim FROM mahasiswa ORDER BY {order_by}")
+            self._conn.execute("UPDATE mahasiswa SET urutan = "
+                               "(SELECT pos FROM urutan_baru WHERE urutan_baru.nim = mahasiswa.nim)")
+            self._conn.execute("DROP TABLE urutan_baru")
+
+    def _sql_sort(self, field, ascending, algorithm):
+        start = time.perf_counter()
+        field = self._check_field(field)
+        # urutan lama sebagai tie-breaker agar sorting stabil
+        self._reorder(f"{field} {'ASC' if ascending else 'DESC'}, urutan")
+        self._record_sort(field, ascending, algorithm, start)
+
+    # Semua algoritma dijalankan sebagai ORDER BY di SQLite (index dipakai bila ada)
+    @instrumented('sort.bubble')
+    def bubble_sort(self, field='nim', ascending=True):
+        self._sql_sort(field, ascending, 'Bubble Sort (SQL ORDER BY)')
+
+    @instrumented('sort.selection')
+    def selection_sort(self, field='nim', ascending=True):
+        self._sql_sort(field, ascending, 'Selection Sort (SQL ORDER BY)')
+
+    @instrumented('sort.insertion')
+    def insertion_sort(self, field='nim', ascending=True):
+        self._sql_sort(field, ascending, 'Insertion Sort (SQL ORDER BY)')
+
+    @instrumented('sort.quick')
+    def quick_sort(self, field='nim', ascending=True):
+        self._sql_sort(field, ascending, 'Quick Sort (SQL ORDER BY)')
+
+    @instrumented('sort.radix')
+    def radix_sort(self, field='nim', ascending=True):
+        self._sql_sort(field, ascending, 'Radix Sort (SQL ORDER BY)')
+
+    @instrumented('sort.timsort')
+    def sort_by(self, keys):
+        """Sorting multi-kunci, mis. [('jurusan', True), ('ipk', False)]"""
+        start = time.perf_counter()
+        keys = [(key, True) if isinstance(key, str) else tuple(key) for key in keys]
+        if not keys:
+            raise ValidationError("Minimal satu kunci sorting!")
+        order_by = ", ".join(f"{self._check_field(field)} {'ASC' if ascending else 'DESC'}"
+                             for field, ascending in keys)
+        self._reorder(order_by + ", urutan")
+
+        description = ", ".join(f"{field} {'asc' if ascending else 'desc'}" for field, ascending in keys)
+        self._record_sort(description, keys[0][1], 'SQL ORDER BY', start)
+
+    def get_sorted_view(self, field='nim', ascending=True):
+        """Data terurut tanpa mengubah kolom urutan"""
+        return self.get_sorted_page(field, ascending, 0, None)
+
+    @instrumented('sort.view_page')
+    def get_sorted_page(self, field, ascending, page, page_size):
+        """Satu halaman data terurut; page_size None = seluruh data"""
+        field = self._check_field(field)
+        direction = 'ASC' if ascending else 'DESC'
+        # nim sebagai tie-breaker agar halaman stabil
+        sql = f"SELECT * FROM mahasiswa ORDER BY {field} {direction}, nim"
+        if page_size is None:
+            return self._query(sql)
+        return self._query(sql + " LIMIT ? OFFSET ?", (page_size, page * page_size))
+
+    def _record_sort(self, field, ascending, algorithm, start=None):
+        """Mencatat riwayat sorting beserta waktu eksekusinya"""
+        self._sort_history.append({
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'field': field,
+            'ascending': ascending,
+            'algorithm': algorithm,
+            'count': self.get_count(),
+            'elapsed_ms': (time.perf_counter() - start) * 1000 if start is not None else None
+        })
+        self._sort_count += 1
+
+    def get_sort_history(self):
+        return list(self._sort_history)
+
+    def get_monitor(self):
+        return self._monitor
+
+    def get_performance_stats(self):
+        return self._monitor.snapshot()
+
+    # ============ STATISTICS ============
+    @instrumented('stats.top_k')
+    def top_k(self, field='ipk', k=10, ascending=False, filters=None):
+        """K mahasiswa teratas/terbawah lewat ORDER BY ... LIMIT k"""
+        if k <= 0:
+            return []
+        field = self._check_field(field)
+        filters = {name: value for name, value in (filters or {}).items() if value}
+        jurusan = filters.pop('jurusan', None)
+        where, params = self._build_where(filters)
+        if jurusan is not None:
+            # Jurusan dicocokkan persis ("Manajemen" bukan "Manajemen Informatika")
+            where += (" AND" if where else " WHERE") + " jurusan = ?"
+            params.append(jurusan)
+        return self._query(f"SELECT * FROM mahasiswa{where} "
+                           f"ORDER BY {field} {'ASC' if ascending else 'DESC'}, nim LIMIT ?",
+                           params + [k])
+
+    @instrumented('stats.get')
+    def get_statistics(self):
+        """Statistik dihitung dengan agregat SQL"""
+        total, avg_ipk, max_ipk, min_ipk = self._conn.execute(
+            "SELECT COUNT(*), AVG(ipk), MAX(ipk), MIN(ipk) FROM mahasiswa").fetchone()
+        if not total:
+            return {}
+
+        groups = self._conn.execute(
+            "SELECT jurusan, COUNT(*), AVG(ipk) FROM mahasiswa GROUP BY jurusan").fetchall()
+        return {
+            'total': total,
+            'avg_ipk': avg_ipk,
+            'max_ipk': max_ipk,
+            'min_ipk': min_ipk,
+            'jurusan_distribution': {jurusan: count for jurusan, count, _ in groups},
+            'jurusan_avg_ipk': {jurusan: avg for jurusan, _, avg in groups},
+            'total_sort_operations': self._sort_count
+        }
+
+    def get_average_ipk(self):
+        return self._conn.execute("SELECT COALESCE(AVG(ipk), 0.0) FROM mahasiswa").fetchone()[0]
+
+    # ============ FILE OPERATIONS ============
+    @instrumented('file.save')
+    def save_to_file(self, filename=None):
+        """Tanpa filename: checkpoint WAL ke file database.
+        Dengan filename: menulis snapshot JSON/biner (format sama dengan backend JSON)."""
+        try:
+            start = time.perf_counter()
+            if filename is None or filename == self._filename:
+                self._conn.commit()
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            else:
+                write_snapshot(filename, self.get_all_mahasiswa())
+            self._last_save = {
+                'saved_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'duration_ms': (time.perf_counter() - start) * 1000
+            }
+            return True
+        except Exception as e:
+            raise FileOperationError(f"Gagal menyimpan file: {str(e)}")
+
+    def compact(self):
+        """Checkpoint WAL lalu VACUUM untuk membuang halaman kosong"""
+        try:
+            self._conn.commit()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+            return True
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Gagal mengompaksi database: {str(e)}")
+
+    def get_last_save_info(self):
+        return dict(self._last_save) if self._last_save else None
+
+    @instrumented('file.load')
+    def load_from_file(self, filename=None, progress=None):
+        """Tanpa filename: data sudah ada di database.
+        Dengan filename snapshot: mengganti isi tabel dengan isi file tersebut."""
+        if filename is None or filename == self._filename:
+            self._current_index = 0 if self.get_count() else -1
+            return True
+        source = DataMahasiswaManager(filename)
+        source._autosave = False
+        try:
+            if not source.load_from_file(progress=progress):
+                return False
+        finally:
+            source.shutdown()
+        try:
+            with self._conn:
+                self._conn.execute("DELETE FROM mahasiswa")
+                self._conn.executemany("INSERT INTO mahasiswa VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       (self._to_row(mhs, i)
+                                        for i, mhs in enumerate(source.get_all_mahasiswa())))
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Gagal memuat file: {str(e)}")
+        self._current_index = 0 if self.get_count() else -1
+        return True
+
+    def migrate_from_json(self, json_filename="data_mahasiswa.json"):
+        """Migrasi satu kali dari file JSON (beserta journal-nya) ke database.
+        Ditolak jika database sudah berisi data; mengembalikan jumlah record.
+        Snapshot dibaca streaming dan dimasukkan per BATCH_SIZE record lewat add_many."""
+        if self.get_count():
+            raise FileOperationError("Database sudah berisi data, migrasi dibatalkan!")
+        if OperationJournal(json_filename + '.journal').exists():
+            # Journal hanya bisa di-replay di atas snapshot utuh di memori
+            if not self.load_from_file(json_filename):
+                raise FileOperationError(f"File {json_filename} tidak ditemukan!")
+            return self.get_count()
+        if not os.path.exists(json_filename):
+            raise FileOperationError(f"File {json_filename} tidak ditemukan!")
+        try:
+            records = read_snapshot(json_filename)
+            while True:
+                chunk = list(islice(records, self.BATCH_SIZE))
+                if not chunk:
+                    break
+                # NIM ganda di file: record pertama dipakai, sama seperti load_from_file
+                self.add_many(chunk, validate=False)
+        except Exception as e:
+            # Batalkan migrasi sebagian agar bisa diulang (database kosong sebelum migrasi)
+            with self._conn:
+                self._conn.execute("DELETE FROM mahasiswa")
+            raise FileOperationError(f"Gagal migrasi {json_filename}: {str(e)}")
+        self._current_index = 0 if self.get_count() else -1
+        return self.get_count()
+
+    # Antarmuka autosave backend JSON: setiap mutasi sudah langsung di-commit
+    def request_save(self):
+        return False
+
+    def flush_autosave(self, timeout=None):
+        return True
+
+    def pop_autosave_errors(self):
+        return []
+
+    def shutdown(self, timeout=5.0):
+        """Menutup koneksi database"""
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+
+    @instrumented('file.import_csv')
+    def import_from_csv(self, filename, workers=None, strict=False, progress=None):
+        """Import CSV paralel (lihat CSVImporter); baris yang ditolak dilaporkan per baris"""
+        from .importer import CSVImporter
+        return CSVImporter(self, workers=workers, progress=progress).run(filename, strict)
+
+    def _iter_all(self):
+        """Record dalam urutan array langsung dari cursor (tanpa list penuh)"""
+        return (self._from_row(row) for row in self._conn.execute("SELECT * FROM mahasiswa ORDER BY urutan"))
+
+    @instrumented('file.export')
+    def export(self, filename, records=None, fields=None, fmt=None, compression=None, progress=None):
+        """Export streaming seperti backend JSON; data diambil bertahap dari cursor"""
+        if records is None:
+            records = self._iter_all()
+        return export_records(filename, records, fields, fmt, compression, progress)
+
+    @instrumented('file.export_csv')
+    def export_to_csv(self, filename="data_mahasiswa.csv"):
+        """Export data ke CSV"""
+        self.export(filename, fmt='csv')
+        return True
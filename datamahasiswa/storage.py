@@ -0,0 +1,489 @@
+"""Format file: JSON streaming, snapshot biner, export streaming"""
+
+import codecs
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from operator import attrgetter
+
+from .exceptions import ValidationError, FileOperationError
+from .model import Mahasiswa
+
+
+# ============================== STREAMING JSON LOADER ==============================
+class JSONRecordStream:
+    """Membaca array record dari file JSON satu per satu tanpa json.load seluruh file.
+    Mendukung format {"metadata": ..., "data": [...]} maupun list lama."""
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, filename, progress=None, chunk_size=CHUNK_SIZE):
+        self._filename = filename
+        self._progress = progress      # callback(bytes_read, total_bytes)
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.metadata = None
+        self.total_bytes = os.path.getsize(filename)
+        self.bytes_read = 0
+        self.count = 0
+
+    def __iter__(self):
+        with open(self._filename, 'rb') as file:
+            self._file = file
+            self._text = codecs.getincrementaldecoder('utf-8-sig')()
+            self._buffer = ''
+            self._pos = 0
+            self._eof = False
+            yield from self._parse()
+
+    # ============ BUFFER ============
+    def _fill(self):
+        """Membaca satu chunk lagi; False jika file sudah habis"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        self._eof = not chunk
+        self.bytes_read += len(chunk)
+        # Buang bagian buffer yang sudah diproses agar memori tetap terbatas
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk, final=self._eof)
+        self._pos = 0
+        if self._progress is not None:
+            self._progress(self.bytes_read, self.total_bytes)
+        return True
+
+    def _peek(self):
+        """Karakter non-spasi berikutnya ('' jika EOF) tanpa mengonsumsinya"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise self._error(f"Diharapkan salah satu dari {chars!r}")
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Mendekode satu nilai JSON utuh, membaca chunk tambahan bila terpotong"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # Nilai yang berakhir tepat di ujung buffer (mis. angka) bisa saja terpotong
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    # ============ PARSER ============
+    def _parse(self):
+        char = self._peek()
+        if char == '[':
+            yield from self._array()
+        elif char == '{':
+            self._pos += 1
+            if self._peek() == '}':
+                return
+            while True:
+                key = self._value()
+                self._expect(':')
+                if key == 'data' and self._peek() == '[':
+                    yield from self._array()
+                else:
+                    value = self._value()
+                    if key == 'metadata':
+                        self.metadata = value
+                if self._expect(',}') == '}':
+                    return
+        else:
+            raise self._error("Format data tidak dikenali")
+
+    def _array(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            self.count += 1
+            if self._expect(',]') == ']':
+                return
+
+# ============================== BINARY SNAPSHOT ==============================
+class BinarySnapshot:
+    """Snapshot biner berversi yang dibaca lewat mmap (akses acak per posisi/NIM).
+
+    Layout (little-endian):
+        header   : magic, versi, jumlah record, lebar NIM, jumlah jurusan, offset tiap section
+        nim      : NIM lebar tetap (ASCII, padding NUL)
+        ipk      : float64 per record
+        jurusan  : kode uint16 per record (dictionary encoding)
+        nim_sort : posisi uint32 terurut NIM untuk binary search
+        offsets  : uint64 awal setiap string (5 per record + tabel jurusan) + akhir blob
+        strings  : blob UTF-8 nama/email/telepon/created_at/updated_at lalu nama jurusan
+    """
+    MAGIC = b'MHSB'
+    VERSION = 1
+    EXTENSION = '.mhsb'
+    HEADER = struct.Struct('<4sHHIII6Q')
+    STRING_FIELDS = ('nama', 'email', 'telepon', 'created_at', 'updated_at')
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mm) < self.HEADER.size:
+                raise FileOperationError("Snapshot biner terpotong!")
+            (magic, version, _, self._count, self._nim_width, jurusan_count,
+             self._nim_off, self._ipk_off, self._jurusan_off, self._sort_off,
+             self._offsets_off, self._strings_off) = self.HEADER.unpack_from(self._mm, 0)
+            if magic != self.MAGIC:
+                raise FileOperationError("Bukan file snapshot biner!")
+            if version > self.VERSION:
+                raise FileOperationError(f"Versi snapshot {version} belum didukung!")
+            last_offset = self._offsets_off + (self._count * 5 + jurusan_count) * 8
+            if (last_offset + 8 > len(self._mm) or
+                    self._strings_off + struct.unpack_from('<Q', self._mm, last_offset)[0] > len(self._mm)):
+                raise FileOperationError("Snapshot biner terpotong!")
+            self._jurusan = [self._string(self._count * 5 + j) for j in range(jurusan_count)]
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def is_binary(cls, filename):
+        """True jika file diawali magic header snapshot biner"""
+        try:
+            with open(filename, 'rb') as file:
+                return file.read(len(cls.MAGIC)) == cls.MAGIC
+        except OSError:
+            return False
+
+    @classmethod
+    def write(cls, file, records):
+        """Menulis list Mahasiswa ke file biner yang sudah terbuka"""
+        count = len(records)
+        nims = [mhs.nim.encode('utf-8') for mhs in records]
+        nim_width = max(map(len, nims), default=0)
+        jurusan_codes = {}
+        codes = [jurusan_codes.setdefault(mhs.jurusan, len(jurusan_codes)) for mhs in records]
+        if len(jurusan_codes) > 0xFFFF:
+            raise FileOperationError("Terlalu banyak jurusan untuk snapshot biner!")
+
+        strings = [str(getattr(mhs, field)).encode('utf-8')
+                   for mhs in records for field in cls.STRING_FIELDS]
+        strings.extend(jurusan.encode('utf-8') for jurusan in jurusan_codes)
+        offsets = [0]
+        for value in strings:
+            offsets.append(offsets[-1] + len(value))
+        order = sorted(range(count), key=nims.__getitem__)
+
+        nim_off = cls.HEADER.size
+        ipk_off = nim_off + count * nim_width
+        jurusan_off = ipk_off + count * 8
+        sort_off = jurusan_off + count * 2
+        offsets_off = sort_off + count * 4
+        strings_off = offsets_off + len(offsets) * 8
+
+        file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, count, nim_width, len(jurusan_codes),
+                                   nim_off, ipk_off, jurusan_off, sort_off, offsets_off, strings_off))
+        file.write(b''.join(nim.ljust(nim_width, b'\0') for nim in nims))
+        file.write(struct.pack(f'<{count}d', *(mhs.ipk for mhs in records)))
+        file.write(struct.pack(f'<{count}H', *codes))
+        file.write(struct.pack(f'<{count}I', *order))
+        file.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        file.write(b''.join(strings))
+
+    # ============ AKSES ACAK ============
+    def __len__(self):
+        return self._count
+
+    def _string(self, index):
+        start, end = struct.unpack_from('<2Q', self._mm, self._offsets_off + index * 8)
+        return self._mm[self._strings_off + start:self._strings_off + end].decode('utf-8')
+
+    def _nim(self, position):
+        start = self._nim_off + position * self._nim_width
+        return self._mm[start:start + self._nim_width].rstrip(b'\0').decode('utf-8')
+
+    def get(self, position):
+        """Record pada posisi tertentu tanpa membaca record lain"""
+        if not 0 <= position < self._count:
+            return None
+        ipk, = struct.unpack_from('<d', self._mm, self._ipk_off + position * 8)
+        code, = struct.unpack_from('<H', self._mm, self._jurusan_off + position * 2)
+        data = {field: self._string(position * 5 + i) for i, field in enumerate(self.STRING_FIELDS)}
+        data.update(nim=self._nim(position), jurusan=self._jurusan[code], ipk=ipk)
+        return Mahasiswa.from_dict(data, trusted=True)
+
+    def find_by_nim(self, nim):
+        """Binary search NIM pada section nim_sort, O(log n) akses halaman"""
+        nim = str(nim)
+        left, right = 0, self._count - 1
+        while left <= right:
+            mid = (left + right) // 2
+            position, = struct.unpack_from('<I', self._mm, self._sort_off + mid * 4)
+            current = self._nim(position)
+            if current == nim:
+                return self.get(position)
+            elif current < nim:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return None
+
+    def __iter__(self):
+        """Membaca seluruh record berurutan (kolom di-unpack sekaligus)"""
+        count = self._count
+        ipks = struct.unpack_from(f'<{count}d', self._mm, self._ipk_off)
+        codes = struct.unpack_from(f'<{count}H', self._mm, self._jurusan_off)
+        offsets = struct.unpack_from(f'<{count * 5 + 1}Q', self._mm, self._offsets_off)
+        raw = self._mm[self._strings_off:self._strings_off + offsets[count * 5]]
+        text = raw.decode('utf-8')
+        # Offset tersimpan dalam byte: slicing teks langsung hanya valid jika blob murni ASCII
+        ascii_only = len(text) == len(raw)
+        for position in range(count):
+            base = position * 5
+            data = {field: (text[offsets[base + i]:offsets[base + i + 1]] if ascii_only else
+                            raw[offsets[base + i]:offsets[base + i + 1]].decode('utf-8'))
+                    for i, field in enumerate(self.STRING_FIELDS)}
+            data.update(nim=self._nim(position), jurusan=self._jurusan[codes[position]],
+                        ipk=ipks[position])
+            yield Mahasiswa.from_dict(data, trusted=True)
+
+    def close(self):
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ============================== STREAMING EXPORT ==============================
+class StreamingExporter:
+    """Exporter berbasis generator: record ditulis per chunk berukuran tetap sehingga
+    memori tambahan konstan. Format: csv, jsonl, json; kompresi opsional gzip/xz."""
+    CHUNK_SIZE = 1000
+    FIELDS = ('nim', 'nama', 'jurusan', 'email', 'telepon', 'ipk', 'created_at', 'updated_at')
+    CSV_HEADERS = {'nim': 'NIM', 'nama': 'Nama', 'jurusan': 'Jurusan', 'email': 'Email',
+                   'telepon': 'Telepon', 'ipk': 'IPK', 'created_at': 'Created At',
+                   'updated_at': 'Updated At'}
+    FORMATS = ('csv', 'jsonl', 'json')
+    COMPRESSIONS = {'.gz': 'gzip', '.xz': 'lzma'}
+
+    def __init__(self, records, fields=None, progress=None, chunk_size=CHUNK_SIZE):
+        self._records = records
+        self._fields = tuple(fields) if fields else self.FIELDS
+        unknown = [field for field in self._fields if field not in self.FIELDS]
+        if unknown:
+            raise ValidationError(f"Field tidak dikenal: {', '.join(unknown)}")
+        self._progress = progress  # callback(jumlah record ditulis, total atau None)
+        self._chunk_size = chunk_size
+        self.count = 0
+
+    @classmethod
+    def detect(cls, filename):
+        """(format, kompresi) dari ekstensi, mis. data.jsonl.gz -> ('jsonl', 'gzip')"""
+        base, ext = os.path.splitext(filename.lower())
+        compression = cls.COMPRESSIONS.get(ext)
+        if compression:
+            base, ext = os.path.splitext(base)
+        fmt = ext.lstrip('.')
+        return (fmt if fmt in cls.FORMATS else 'csv'), compression
+
+    # ============ CHUNK ============
+    def _rows(self):
+        """Tuple nilai field terpilih per record, dihitung satu per satu"""
+        getter = attrgetter(*self._fields)
+        if len(self._fields) == 1:
+            return ((getter(mhs),) for mhs in self._records)
+        return (getter(mhs) for mhs in self._records)
+
+    def _chunked(self, render):
+        """Mengelompokkan hasil render per record menjadi string chunk"""
+        total = len(self._records) if hasattr(self._records, '__len__') else None
+        chunk = []
+        for row in self._rows():
+            chunk.append(render(row))
+            self.count += 1
+            if len(chunk) >= self._chunk_size:
+                yield "".join(chunk)
+                chunk = []
+                if self._progress is not None:
+                    self._progress(self.count, total)
+        if chunk:
+            yield "".join(chunk)
+        if self._progress is not None:
+            self._progress(self.count, total)
+
+    def iter_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        ipk_column = self._fields.index('ipk') if 'ipk' in self._fields else None
+
+        def render(row):
+            if ipk_column is not None:
+                row = list(row)
+                row[ipk_column] = f"{row[ipk_column]:.2f}"
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(row)
+            return buffer.getvalue()
+
+        writer.writerow([self.CSV_HEADERS[field] for field in self._fields])
+        yield buffer.getvalue()
+        yield from self._chunked(render)
+
+    def iter_jsonl(self):
+        fields = self._fields
+        return self._chunked(lambda row: json.dumps(dict(zip(fields, row)), ensure_ascii=False) + "\n")
+
+    def iter_json(self, metadata=None):
+        """JSON ringkas: {"metadata": ..., "data": [satu record per baris]}"""
+        fields = self._fields
+        first = True
+
+        def render(row):
+            nonlocal first
+            separator = "\n" if first else ",\n"
+            first = False
+            return separator + json.dumps(dict(zip(fields, row)), ensure_ascii=False)
+
+        yield '{"metadata": ' + json.dumps(metadata or {}, ensure_ascii=False) + ', "data": ['
+        yield from self._chunked(render)
+        yield "\n]}\n"
+
+    # ============ TULIS ============
+    def write_to(self, binary_file, fmt='csv', compression=None, metadata=None):
+        """Menulis ke file biner yang sudah terbuka, dengan kompresi transparan"""
+        if compression == 'gzip':
+            import gzip
+            stream = gzip.GzipFile(fileobj=binary_file, mode='wb')
+        elif compression == 'lzma':
+            import lzma
+            stream = lzma.LZMAFile(binary_file, mode='wb')
+        else:
+            stream = None
+        text = io.TextIOWrapper(stream or binary_file, encoding='utf-8', newline='')
+        try:
+            if fmt == 'jsonl':
+                chunks = self.iter_jsonl()
+            elif fmt == 'json':
+                chunks = self.iter_json(metadata)
+            else:
+                chunks = self.iter_csv()
+            for chunk in chunks:
+                text.write(chunk)
+            text.flush()
+        finally:
+            text.detach()
+            if stream is not None:
+                stream.close()
+        return self.count
+
+# ============================== SNAPSHOT I/O ==============================
+# Versi metadata JSON yang hanya ditulis write_snapshot: record berasal dari to_dict
+# sehingga boleh dimuat lewat jalur trusted. File 2.0 (aplikasi lama/diedit manual) divalidasi.
+TRUSTED_JSON_VERSION = '2.1'
+DEFAULT_FILE_MODE = 0o644  # Permission file data baru (file lama mempertahankan permission-nya)
+
+
+def _target_mode(filename):
+    """Permission file tujuan: sama dengan file lama, atau DEFAULT_FILE_MODE untuk file baru.
+    (umask tidak dibaca lewat os.umask karena mengubah umask seluruh proses dari thread autosave)"""
+    try:
+        return os.stat(filename).st_mode & 0o7777
+    except FileNotFoundError:
+        return DEFAULT_FILE_MODE
+
+
+def atomic_write(filename, write_func, mode='w'):
+    """Menulis ke file sementara di folder yang sama lalu os.replace ke tujuan"""
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(prefix='.tmp-', suffix=os.path.basename(filename), dir=directory)
+    try:
+        encoding = None if 'b' in mode else 'utf-8'
+        with os.fdopen(fd, mode, encoding=encoding) as file:
+            write_func(file)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp membuat file 0600; samakan dengan permission yang diharapkan
+        os.chmod(temp_path, _target_mode(filename))
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_snapshot(filename, records):
+    """Format dipilih dari ekstensi atau header file yang sudah ada"""
+    if filename.endswith(BinarySnapshot.EXTENSION) or BinarySnapshot.is_binary(filename):
+        atomic_write(filename, lambda file: BinarySnapshot.write(file, records), mode='wb')
+        return
+
+    # Tambah metadata; record ditulis streaming per chunk (tanpa list dict penuh)
+    metadata = {
+        'saved_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'total_records': len(records),
+        'version': TRUSTED_JSON_VERSION
+    }
+    atomic_write(filename,
+                 lambda file: StreamingExporter(records).write_to(file, 'json', metadata=metadata),
+                 mode='wb')
+
+
+def read_snapshot(filename, progress=None):
+    """Mahasiswa dari file snapshot; format biner/JSON dideteksi dari header"""
+    if BinarySnapshot.is_binary(filename):
+        total_bytes = os.path.getsize(filename)
+        with BinarySnapshot(filename) as snapshot:
+            count = len(snapshot)
+            for i, mhs in enumerate(snapshot, 1):
+                if progress is not None and (i % 10000 == 0 or i == count):
+                    progress(total_bytes * i // count, total_bytes)
+                yield mhs
+    else:
+        stream = JSONRecordStream(filename, progress)
+        for item in stream:
+            # Metadata mendahului data; record yang ternyata tidak lengkap jatuh ke jalur validasi
+            mhs = None
+            if (stream.metadata or {}).get('version') == TRUSTED_JSON_VERSION:
+                try:
+                    mhs = Mahasiswa.from_dict(item, trusted=True)
+                except (KeyError, TypeError, ValueError):
+                    mhs = None
+            yield mhs if mhs is not None else Mahasiswa.from_dict(item)
+
+
+def export_records(filename, records, fields=None, fmt=None, compression=None, progress=None):
+    """Export streaming record ke file; format & kompresi dari ekstensi bila tidak diberikan"""
+    detected_fmt, detected_compression = StreamingExporter.detect(filename)
+    fmt, compression = fmt or detected_fmt, compression or detected_compression
+    metadata = {'exported_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    exporter = StreamingExporter(records, fields, progress)
+    try:
+        atomic_write(
+            filename, lambda file: exporter.write_to(file, fmt, compression, metadata), mode='wb')
+        return exporter.count
+    except Exception as e:
+        raise FileOperationError(f"Gagal export data: {str(e)}")
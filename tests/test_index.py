@@ -0,0 +1,124 @@
+"""Test index & agregat manager saat objek diubah langsung lewat setter."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from datamahasiswa.manager import DataMahasiswaManager
+from datamahasiswa.model import Mahasiswa
+from datamahasiswa.sqlite_backend import SQLiteMahasiswaManager
+
+
+class TestIndexConsistency(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        self.filename = os.path.join(tmpdir, 'data.json')
+        self.manager = self.open_manager()
+        self.manager.add_mahasiswa(Mahasiswa('000000000001', 'Ani', 'Hukum', ipk=2.0))
+        self.manager.add_mahasiswa(Mahasiswa('000000000002', 'Budi', 'Informatika', ipk=3.0))
+        self.manager.enable_trigram_index()
+        self.manager.get_sorted_view('ipk')  # Bangun sorted view agar ikut diuji
+
+    def open_manager(self):
+        manager = DataMahasiswaManager(self.filename)
+        manager.load_from_file()
+        manager._saver.request = lambda: None  # Tanpa kompaksi: journal ikut diuji
+        self.addCleanup(manager.shutdown)
+        return manager
+
+    def assertIndexFresh(self, manager):
+        """Index inkremental harus sama dengan index yang dibangun ulang dari data"""
+        fresh = DataMahasiswaManager(self.filename, use_journal=False)
+        fresh._data_mahasiswa = list(manager.get_all_mahasiswa())
+        fresh._rebuild_index()
+        self.assertEqual(manager.get_statistics(), fresh.get_statistics())
+        self.assertEqual(manager._nim_sorted, fresh._nim_sorted)
+        self.assertEqual(manager._nim_index, fresh._nim_index)
+        self.assertEqual(manager.get_sorted_view('ipk'), fresh.get_sorted_view('ipk'))
+
+    def test_edit_same_object_after_setter(self):
+        mhs = self.manager.get_by_nim('000000000001')
+        mhs.ipk = 4.0
+        mhs.jurusan = 'Informatika'
+        mhs.nama = 'Citra'
+        self.manager.edit_by_nim('000000000001', mhs)
+
+        stats = self.manager.get_statistics()
+        self.assertAlmostEqual(stats['avg_ipk'], 3.5)
+        self.assertEqual((stats['min_ipk'], stats['max_ipk']), (3.0, 4.0))
+        self.assertEqual(stats['jurusan_distribution'], {'Informatika': 2})
+        self.assertEqual(self.manager.search_by_multiple({'nama': 'citra'}), [mhs])
+        self.assertEqual(self.manager.search_by_multiple({'nama': 'ani'}), [])
+        self.assertIndexFresh(self.manager)
+
+    def test_nim_changed_in_place(self):
+        mhs = self.manager.get_by_nim('000000000001')
+        mhs.nim = '000000000009'
+        self.manager.edit_by_nim('000000000001', mhs)
+
+        self.assertIsNone(self.manager.get_by_nim('000000000001'))
+        self.assertIs(self.manager.get_by_nim('000000000009'), mhs)
+        self.assertIsNone(self.manager.binary_search('000000000001'))
+        self.assertIndexFresh(self.manager)
+        # Journal mencatat NIM lama sehingga replay tidak menyisakan record ganda
+        self.manager.shutdown()
+        reloaded = self.open_manager()
+        self.assertEqual([m.nim for m in reloaded.get_all_mahasiswa()],
+                         ['000000000009', '000000000002'])
+
+    def test_delete_after_setter(self):
+        self.manager.get_by_nim('000000000002').ipk = 1.0
+        self.manager.delete_by_nim('000000000002')
+
+        stats = self.manager.get_statistics()
+        self.assertEqual((stats['avg_ipk'], stats['min_ipk'], stats['max_ipk']), (2.0, 2.0, 2.0))
+        self.assertEqual(stats['jurusan_distribution'], {'Hukum': 1})
+        self.assertIndexFresh(self.manager)
+
+    def test_delete_many_after_nim_changed(self):
+        self.manager.get_by_nim('000000000002').nim = '000000000007'
+        report = self.manager.delete_many(['000000000002'])
+
+        self.assertEqual(report['applied'], 1)
+        self.assertEqual([m.nim for m in self.manager.get_all_mahasiswa()], ['000000000001'])
+        self.assertIndexFresh(self.manager)
+
+
+class TestTopKTies(unittest.TestCase):
+    """top_k harus memberi hasil sama (nilai seri urut NIM) di semua jalur"""
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        self.records = [Mahasiswa(f"{nim:012d}", 'Mahasiswa', 'Hukum', ipk=ipk)
+                        for nim, ipk in [(5, 3.0), (1, 4.0), (4, 3.0), (2, 3.0), (3, 2.0), (6, 4.0)]]
+        self.manager = DataMahasiswaManager(os.path.join(tmpdir, 'data.json'), use_journal=False)
+        self.manager._autosave = False
+        self.manager.add_many(self.records)
+        self.sqlite = SQLiteMahasiswaManager(os.path.join(tmpdir, 'data.db'))
+        self.addCleanup(self.sqlite.shutdown)
+        self.sqlite.add_many(self.records)
+
+    def test_heap_view_and_sqlite_agree(self):
+        expected = {
+            False: ['000000000001', '000000000006', '000000000002', '000000000004'],
+            True: ['000000000003', '000000000002', '000000000004', '000000000005'],
+        }
+        for ascending, nims in expected.items():
+            self.manager._sorted_views = {}
+            heap = [mhs.nim for mhs in self.manager.top_k('ipk', 4, ascending)]
+            self.manager.get_sorted_view('ipk')
+            view = [mhs.nim for mhs in self.manager.top_k('ipk', 4, ascending)]
+            sqlite = [mhs.nim for mhs in self.sqlite.top_k('ipk', 4, ascending)]
+            self.assertEqual(heap, nims)
+            self.assertEqual(view, nims)
+            self.assertEqual(sqlite, nims)
+
+    def test_sorted_page_descending_keeps_nim_order(self):
+        for manager in (self.manager, self.sqlite):
+            page = manager.get_sorted_page('ipk', False, 1, 2)
+            self.assertEqual([mhs.nim for mhs in page], ['000000000002', '000000000004'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Test journal operasi: append, rotasi, replay, dan crash saat kompaksi."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from datamahasiswa.manager import DataMahasiswaManager
+from datamahasiswa.model import Mahasiswa
+from datamahasiswa.persistence import OperationJournal
+
+
+def make(nim, nama, ipk=3.0, jurusan='Informatika'):
+    return Mahasiswa(f"{nim:012d}", nama, jurusan, ipk=ipk)
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'data.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def open_manager(self):
+        manager = DataMahasiswaManager(self.filename)
+        manager.load_from_file()
+        self.addCleanup(manager.shutdown)
+        return manager
+
+    @staticmethod
+    def state(manager):
+        return [(mhs.nim, mhs.nama, mhs.ipk) for mhs in manager.get_all_mahasiswa()]
+
+
+class TestOperationJournal(JournalTestCase):
+    def test_append_counts_and_replays_in_order(self):
+        journal = OperationJournal(self.filename + '.journal')
+        journal.append('add', '1', {'nim': '1'})
+        journal.append_many([('edit', '1', {'nim': '2'}), ('delete', '2', None)])
+        journal.close()
+        self.assertEqual(journal.entries, 3)
+        self.assertEqual([entry['op'] for entry in journal.replay()], ['add', 'edit', 'delete'])
+        # Membuka ulang menghitung baris yang sudah ada
+        reopened = OperationJournal(self.filename + '.journal')
+        reopened.append('delete', '1')
+        reopened.close()
+        self.assertEqual(reopened.entries, 4)
+
+    def test_rotate_merges_into_old_file(self):
+        journal = OperationJournal(self.filename + '.journal')
+        journal.append('add', '1')
+        journal.rotate()
+        journal.append('add', '2')
+        journal.rotate()  # .old masih ada: digabung, bukan ditimpa
+        journal.append('add', '3')
+        journal.close()
+        self.assertEqual(journal.entries, 1)
+        self.assertEqual([entry['nim'] for entry in journal.replay()], ['1', '2', '3'])
+        journal.discard_rotated()
+        self.assertEqual([entry['nim'] for entry in journal.replay()], ['3'])
+
+    def test_truncated_last_line_is_ignored(self):
+        journal = OperationJournal(self.filename + '.journal')
+        journal.append('add', '1')
+        journal.close()
+        with open(journal.filename, 'a', encoding='utf-8') as file:
+            file.write('{"op": "add", "ni')
+        self.assertEqual([entry['nim'] for entry in journal.replay()], ['1'])
+
+
+class TestManagerReplay(JournalTestCase):
+    def test_replay_restores_data_and_order(self):
+        manager = self.open_manager()
+        manager._saver.request = lambda: None  # Tahan kompaksi: hanya journal, tanpa snapshot
+        for i in range(5):
+            manager.add_mahasiswa(make(i, f"Mhs {i}", ipk=1.0 + i / 2))
+        manager.edit_by_nim(f"{2:012d}", make(2, "Mhs Edit", ipk=3.9))
+        manager.delete_by_nim(f"{4:012d}")
+        manager.quick_sort('ipk', ascending=False)
+        expected = self.state(manager)
+        manager.shutdown()
+        self.assertFalse(os.path.exists(self.filename))
+
+        with open(self.filename + '.journal', encoding='utf-8') as file:
+            self.assertIn('"op": "order"', file.read())
+        self.assertEqual(self.state(self.open_manager()), expected)
+
+    def test_sort_schedules_compaction(self):
+        manager = self.open_manager()
+        manager.add_mahasiswa(make(1, "Budi", ipk=2.0))
+        manager.add_mahasiswa(make(2, "Ani", ipk=3.0))
+        manager.flush_autosave(5)
+        manager.sort_by([('nama', True)])
+        manager.flush_autosave(5)
+        self.assertEqual(manager._journal.entries, 0)
+        self.assertFalse(manager.is_dirty())
+        self.assertEqual([nim for nim, _, _ in self.state(self.open_manager())],
+                         [f"{2:012d}", f"{1:012d}"])
+
+    def test_crash_between_snapshot_and_discard(self):
+        manager = self.open_manager()
+        manager._saver.request = lambda: None  # Tahan kompaksi otomatis
+        manager.add_mahasiswa(make(1, "Ani", ipk=2.0))
+        manager.add_mahasiswa(make(2, "Budi", ipk=3.5))
+        manager.edit_by_nim(f"{1:012d}", make(3, "Ani Pindah", ipk=2.5))
+        manager.add_mahasiswa(make(1, "Cici", ipk=3.0))
+        manager.quick_sort('ipk', ascending=False)
+        manager.delete_by_nim(f"{2:012d}")
+        expected = self.state(manager)
+        journal_copy = self.filename + '.copy'
+        shutil.copyfile(self.filename + '.journal', journal_copy)
+        manager.save_to_file()
+        manager.shutdown()
+        # Crash setelah snapshot baru ditulis tetapi sebelum journal lama dihapus
+        os.replace(journal_copy, self.filename + '.journal.old')
+
+        reloaded = self.open_manager()
+        self.assertEqual(self.state(reloaded), expected)
+        reloaded.shutdown()
+        self.assertEqual(self.state(self.open_manager()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()